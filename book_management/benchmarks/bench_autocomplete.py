@@ -0,0 +1,78 @@
+"""제목 자동 완성: 메모리 접두어 인덱스와 SQLite LIKE 조회 비교
+
+사용법: python -m benchmarks.bench_autocomplete [--rows 1000000] [--queries 2000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from benchmarks.common import make_book, make_books, temp_db_path
+from utils.autocomplete import AutocompleteIndex, PrefixIndex
+from utils.database import DatabaseManager
+
+def percentile(samples, fraction):
+    return sorted(samples)[int(len(samples) * fraction)]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--sqlite', action='store_true', help="SQLite LIKE 조회도 측정 (느림)")
+    args = parser.parse_args()
+
+    titles = [make_book(n).title for n in range(args.rows)]
+    rng = random.Random(42)
+    # 한 글자부터 몇 글자까지 입력하는 중인 상황
+    prefixes = [rng.choice(titles)[:rng.randint(1, 12)] for _ in range(args.queries)]
+
+    tracemalloc.start()
+    began = time.perf_counter()
+    index = PrefixIndex(titles)
+    build = time.perf_counter() - began
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"build {len(index):,} titles {build:.2f}s, {memory / 1024 / 1024:.1f} MiB"
+          f" ({memory / len(index):.0f} bytes/title)")
+
+    samples = []
+    for prefix in prefixes:
+        began = time.perf_counter()
+        index.suggest(prefix, limit=10)
+        samples.append(time.perf_counter() - began)
+    print(f"suggest  p50 {percentile(samples, 0.5) * 1e6:7.1f} us"
+          f"  p99 {percentile(samples, 0.99) * 1e6:7.1f} us"
+          f"  max {max(samples) * 1e6:7.1f} us")
+
+    samples = []
+    for n in range(args.rows, args.rows + 200):
+        title = make_book(n).title
+        began = time.perf_counter()
+        index.add(title)
+        samples.append(time.perf_counter() - began)
+    print(f"add      p50 {percentile(samples, 0.5) * 1e6:7.1f} us"
+          f"  p99 {percentile(samples, 0.99) * 1e6:7.1f} us")
+
+    if not args.sqlite:
+        return
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1, profile='balanced')
+        db.initialize_db()
+        db.add_books(make_books(args.rows))
+        began = time.perf_counter()
+        AutocompleteIndex.from_database(db)
+        print(f"load from database {time.perf_counter() - began:.2f}s")
+        samples = []
+        with db.get_connection() as conn:
+            for prefix in prefixes[:50]:
+                began = time.perf_counter()
+                conn.execute('SELECT DISTINCT title FROM books WHERE title LIKE ? LIMIT 10',
+                             (prefix + '%',)).fetchall()
+                samples.append(time.perf_counter() - began)
+        print(f"sqlite LIKE p50 {percentile(samples, 0.5) * 1e3:7.1f} ms"
+              f"  p99 {percentile(samples, 0.99) * 1e3:7.1f} ms")
+        db.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""도서 한 권당 메모리: 일반 dataclass, slots Book, BookBatch 비교
+
+사용법: python -m benchmarks.bench_book_memory [--rows 1000000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from benchmarks.common import make_books
+from models.book_batch import BookBatch
+from utils.database import BOOK_COLUMNS
+from utils.row_decoder import make_book_decoder
+
+@dataclass
+class DictBook:
+    """slots 를 쓰기 전의 Book 과 같은 구조 (비교용)"""
+    id: int
+    title: str
+    author: str
+    isbn: str
+    published_date: datetime
+    quantity: int
+    created_at: datetime = field(default_factory=datetime.now)
+
+def measure(label, build, rows):
+    gc.collect()
+    tracemalloc.start()
+    began = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - began
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<22} {used / rows:7.0f} bytes/record  build {elapsed:6.2f}s")
+    return value
+
+def total_by_author(books):
+    totals = {}
+    for book in books:
+        totals[book.author] = totals.get(book.author, 0) + book.quantity
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+    rows = args.rows
+
+    # DB 에서 읽은 것과 같은 행 튜플을 미리 만들어 두고, 각 표현이 추가로 쓰는 메모리만 측정
+    raw = [(n + 1, book.title, book.author, book.isbn,
+            book.published_date.strftime('%Y-%m-%d'), book.quantity,
+            f"2024-01-01 {n // 3600 % 24:02d}:{n // 60 % 60:02d}:{n % 60:02d}")
+           for n, book in enumerate(make_books(rows))]
+    decode = make_book_decoder(BOOK_COLUMNS)
+
+    def decode_fields(row):
+        book = decode(row)
+        return (book.id, book.title, book.author, book.isbn, book.published_date,
+                book.quantity, book.created_at)
+
+    def dict_books():
+        return [DictBook(*row) for row in map(decode_fields, raw)]
+
+    measure('dataclass (__dict__)', dict_books, rows)
+    books = measure('Book (slots=True)', lambda: [decode(row) for row in raw], rows)
+    batch = measure('BookBatch.from_rows', lambda: BookBatch.from_rows(raw), rows)
+    measure('BookBatch.from_books', lambda: BookBatch.from_books(books), rows)
+
+    for label, run in (('list[Book]', lambda: total_by_author(books)),
+                       ('BookBatch', batch.total_quantity_by_author)):
+        began = time.perf_counter()
+        totals = run()
+        print(f"total_quantity_by_author {label:<11} {(time.perf_counter() - began) * 1000:7.1f} ms"
+              f"  ({len(totals)} authors)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""add_book 반복 호출과 add_books 대량 저장 비교
+
+사용법: python -m benchmarks.bench_bulk_insert [--rows 200000] [--loop-rows 2000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.database import DatabaseManager
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--loop-rows', type=int, default=2000,
+                        help='행마다 커밋하는 방식은 느리므로 적은 행으로 측정')
+    parser.add_argument('--batch-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1)
+        db.initialize_db()
+        began = time.perf_counter()
+        for book in make_books(args.loop_rows):
+            db.add_book(book)
+        loop_rate = args.loop_rows / (time.perf_counter() - began)
+        db.close()
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1)
+        db.initialize_db()
+        began = time.perf_counter()
+        result = db.add_books(make_books(args.rows), batch_size=args.batch_size)
+        bulk_rate = result.written / (time.perf_counter() - began)
+        db.close()
+
+    print(f"add_book loop : {loop_rate:12,.0f} rows/s")
+    print(f"add_books     : {bulk_rate:12,.0f} rows/s")
+    print(f"speedup       : {bulk_rate / loop_rate:12.1f}x")
+
+if __name__ == '__main__':
+    main()
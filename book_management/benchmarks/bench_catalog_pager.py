@@ -0,0 +1,72 @@
+"""카탈로그 스크롤 지연: 키셋 페이지(CatalogPager) vs OFFSET, 목록 크기별 비교
+
+사용법: python -m benchmarks.bench_catalog_pager [--sizes 10000 100000 1000000] [--page-size 100]
+(book_management 디렉터리에서 실행)
+제목순으로 정렬한 목록의 끝부분을 차례로 스크롤할 때 페이지 하나를 읽는 시간과,
+스크롤바를 끌어 멀리 건너뛸 때(key_at) 시간을 출력합니다.
+"""
+
+import argparse
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.catalog_pager import CatalogPager
+from utils.database import BOOK_COLUMNS, DatabaseManager
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def measure(func, repeat):
+    samples = []
+    for n in range(repeat):
+        began = time.perf_counter()
+        func(n)
+        samples.append(time.perf_counter() - began)
+    return samples
+
+def report(label, samples):
+    print(f"  {label:<34} p50 {percentile(samples, 0.5) * 1e3:7.2f} ms"
+          f"  p99 {percentile(samples, 0.99) * 1e3:7.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--pages', type=int, default=100)
+    args = parser.parse_args()
+    page_size = args.page_size
+
+    for size in args.sizes:
+        with temp_db_path() as path:
+            with DatabaseManager(path, pool_size=1, profile='balanced') as db:
+                db.initialize_db()
+                db.add_books(make_books(size), batch_size=50000)
+                print(f"{size:,} books (title order, {page_size} rows/page)")
+                last_page = (size - 1) // page_size
+                # 끝에서 pages 페이지 전부터 차례로 스크롤 (시작 위치는 한 번 건너뜀)
+                first = max(last_page - args.pages, 0)
+                pager = CatalogPager(db, page_size=page_size, cache_pages=args.pages * 2,
+                                     order_by='title')
+                pager.page(first)
+                report("keyset page (sequential)",
+                       measure(lambda n: pager.page(first + 1 + n), min(args.pages, last_page - first)))
+                report("cached window (20 rows)",
+                       measure(lambda n: pager.window((first + 1 + n) * page_size, 20),
+                               min(args.pages, last_page - first)))
+                sql = (f'SELECT {", ".join(BOOK_COLUMNS)} FROM books ORDER BY title, id '
+                       f'LIMIT ? OFFSET ?')
+
+                def offset_page(n):
+                    with db.get_connection() as conn:
+                        conn.execute(sql, (page_size, (first + 1 + n) * page_size)).fetchall()
+
+                report("OFFSET page (sequential)", measure(offset_page, min(args.pages, 20)))
+
+                def jump(n):
+                    pager.refresh()
+                    pager.page(int(last_page * (0.5 + n / 40)))
+
+                report("jump via key_at (50-75%)", measure(jump, 10))
+
+if __name__ == '__main__':
+    main()
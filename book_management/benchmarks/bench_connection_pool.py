@@ -0,0 +1,48 @@
+"""DatabaseManager 커넥션 풀 벤치마크
+
+사용법: python -m benchmarks.bench_connection_pool [--ops 2000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import threading
+import time
+from benchmarks.common import make_book, temp_db_path
+from utils.database import DatabaseManager
+
+def run_workload(db: DatabaseManager, ops: int, threads: int, start: int) -> float:
+    """쓰기 1회 + 읽기 1회를 한 연산으로 보고 초당 연산 수를 반환"""
+    per_thread = ops // threads
+
+    def worker(offset):
+        for n in range(offset, offset + per_thread):
+            book = make_book(n)
+            db.add_book(book)
+            db.get_book_by_isbn(book.isbn)
+
+    workers = [threading.Thread(target=worker, args=(start + i * per_thread,))
+               for i in range(threads)]
+    began = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return per_thread * threads / (time.perf_counter() - began)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ops', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'threads':>8} {'ops/sec':>12}")
+    for label, pool_size in (('no pool', 0), ('pool=8', 8)):
+        for threads in (1, 8):
+            with temp_db_path() as path:
+                db = DatabaseManager(path, pool_size=pool_size)
+                db.initialize_db()
+                rate = run_workload(db, args.ops, threads, start=0)
+                db.close()
+            print(f"{label:<12} {threads:>8} {rate:>12,.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""FTS5 search_books 와 LIKE '%x%' 검색 비교
+
+사용법: python -m benchmarks.bench_fts_search [--rows 1000000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.database import DatabaseManager
+
+# 흔한 단어는 LIKE 가 LIMIT 20 에서 일찍 끝나지만 FTS 는 bm25 로 전체를 정렬함.
+# 드문 단어(제목 끝 번호)는 LIKE 가 테이블 전체를 읽어야 함.
+QUERIES = ["파이", "design pat", "홍길", "12345", "99999", "algo 4242"]
+
+def average_ms(func, repeat: int) -> float:
+    began = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - began) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1, profile='bulk-load')
+        db.initialize_db()
+        began = time.perf_counter()
+        db.add_books(make_books(args.rows))
+        print(f"loaded {args.rows:,} rows in {time.perf_counter() - began:.1f}s")
+
+        print(f"{'query':<14} {'FTS ms':>10} {'LIKE ms':>10}")
+        for query in QUERIES:
+            term = f"%{query.split()[0]}%"
+
+            def like():
+                with db.get_connection() as conn:
+                    conn.execute(
+                        'SELECT * FROM books WHERE title LIKE ? OR author LIKE ? LIMIT 20',
+                        (term, term)).fetchall()
+
+            fts_ms = average_ms(lambda: db.search_books(query, limit=20), args.repeat)
+            like_ms = average_ms(like, args.repeat)
+            print(f"{query:<14} {fts_ms:>10.2f} {like_ms:>10.2f}")
+        db.close()
+
+if __name__ == '__main__':
+    main()
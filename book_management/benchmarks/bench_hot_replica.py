@@ -0,0 +1,53 @@
+"""메모리 복제본의 읽기 지연 개선과 100만 행당 메모리 사용량 측정
+
+사용법: python -m benchmarks.bench_hot_replica [--rows 1000000] [--lookups 20000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import random
+import time
+from benchmarks.common import make_book, make_books, temp_db_path
+from utils.database import DatabaseManager
+from utils.replica import HotReplicaDatabaseManager
+
+def lookup_us(db, isbns) -> float:
+    began = time.perf_counter()
+    for isbn in isbns:
+        db.get_book_by_isbn(isbn)
+    return (time.perf_counter() - began) / len(isbns) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--lookups', type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    isbns = [make_book(rng.randrange(args.rows)).isbn for _ in range(args.lookups)]
+
+    with temp_db_path() as path:
+        loader = DatabaseManager(path, pool_size=1, profile='bulk-load')
+        loader.initialize_db()
+        loader.add_books(make_books(args.rows))
+        loader.close()
+
+        disk = DatabaseManager(path, pool_size=1, profile='balanced')
+        disk_us = lookup_us(disk, isbns)
+        disk.close()
+
+        began = time.perf_counter()
+        replica = HotReplicaDatabaseManager(path)
+        replica.initialize_db()
+        load_time = time.perf_counter() - began
+        memory_us = lookup_us(replica, isbns)
+        usage = replica.memory_usage()
+        replica.close()
+
+    print(f"replica load time      : {load_time:8.2f} s")
+    print(f"get_book_by_isbn disk  : {disk_us:8.1f} us")
+    print(f"get_book_by_isbn memory: {memory_us:8.1f} us  ({disk_us / memory_us:.1f}x)")
+    print(f"memory per 1M rows     : {usage / args.rows * 1e6 / 1024 / 1024:8.1f} MiB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""가져오기 전 isbn 중복 확인: Bloom 필터 사용 여부 비교
+
+사용법: python -m benchmarks.bench_isbn_filter [--rows 200000] [--imports 50000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import time
+from benchmarks.common import make_book, make_books, temp_db_path
+from utils.database import DatabaseManager
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--imports', type=int, default=50000)
+    parser.add_argument('--fpr', type=float, default=0.01)
+    args = parser.parse_args()
+
+    # 가져올 도서의 10% 만 이미 있는 일반적인 가져오기 상황
+    existing = args.imports // 10
+    isbns = [make_book(n).isbn for n in range(args.rows - existing, args.rows - existing + args.imports)]
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, profile='balanced')
+        db.initialize_db()
+        db.add_books(make_books(args.rows))
+        db.close()
+
+        for label, kwargs in (('no filter', {}),
+                              ('bloom filter', {'isbn_filter_capacity': args.rows + args.imports,
+                                                'isbn_filter_fpr': args.fpr,
+                                                'isbn_filter_file': path + '.bloom'})):
+            manager = DatabaseManager(path, pool_size=1, profile='balanced', **kwargs)
+            began = time.perf_counter()
+            manager.initialize_db()
+            startup = time.perf_counter() - began
+
+            began = time.perf_counter()
+            for isbn in isbns:
+                manager.get_book_by_isbn(isbn)
+            single = time.perf_counter() - began
+
+            began = time.perf_counter()
+            found = manager.existing_isbns(isbns)
+            batched = time.perf_counter() - began
+            assert len(found) == existing
+            print(f"{label:<13} startup {startup * 1000:7.1f} ms  single {single * 1000:8.1f} ms"
+                  f"  existing_isbns {batched * 1000:7.1f} ms")
+            if manager.isbn_filter is not None:
+                bloom = manager.isbn_filter
+                stats = bloom.stats
+                print(f"{'':<13} {bloom.size_in_bytes / 1024:.0f} KiB, k={bloom.num_hashes},"
+                      f" configured fpr {bloom.false_positive_rate:.2%},"
+                      f" measured fpr {stats.measured_false_positive_rate:.2%},"
+                      f" probes skipped {stats.probe_savings:.1%}")
+            manager.close()
+
+        # 저장된 필터로 다시 시작 (워터마크 이후 행만 읽음)
+        manager = DatabaseManager(path, pool_size=1, profile='balanced',
+                                  isbn_filter_capacity=args.rows + args.imports,
+                                  isbn_filter_fpr=args.fpr, isbn_filter_file=path + '.bloom')
+        began = time.perf_counter()
+        manager.initialize_db()
+        print(f"{'warm start':<13} startup {(time.perf_counter() - began) * 1000:7.1f} ms")
+        manager.close()
+
+if __name__ == '__main__':
+    main()
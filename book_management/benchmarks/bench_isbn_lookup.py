@@ -0,0 +1,44 @@
+"""get_book_by_isbn 반복 호출과 get_books_by_isbns 일괄 조회 비교
+
+사용법: python -m benchmarks.bench_isbn_lookup [--rows 200000] [--lookups 10000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import random
+import time
+from benchmarks.common import make_book, make_books, temp_db_path
+from utils.database import DatabaseManager
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=10000)
+    args = parser.parse_args()
+
+    # 절반은 있는 isbn, 절반은 없는 isbn
+    rng = random.Random(42)
+    isbns = [make_book(rng.randrange(args.rows * 2)).isbn for _ in range(args.lookups)]
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, profile='balanced')
+        db.initialize_db()
+        db.add_books(make_books(args.rows))
+
+        for label, manager in (('no pool', db),
+                               ('pool=1', DatabaseManager(path, pool_size=1, profile='balanced'))):
+            began = time.perf_counter()
+            looped = {isbn: book for isbn in isbns
+                      if (book := manager.get_book_by_isbn(isbn)) is not None}
+            loop_time = time.perf_counter() - began
+
+            began = time.perf_counter()
+            batched = manager.get_books_by_isbns(isbns)
+            batch_time = time.perf_counter() - began
+            assert looped.keys() == batched.keys()
+            print(f"{label:<8} loop {loop_time * 1000:9.1f} ms  batched {batch_time * 1000:7.1f} ms"
+                  f"  speedup {loop_time / batch_time:6.1f}x  ({len(batched):,} found)")
+            manager.close()
+
+if __name__ == '__main__':
+    main()
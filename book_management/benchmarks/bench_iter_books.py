@@ -0,0 +1,51 @@
+"""iter_books 키셋 페이지 순회의 속도와 메모리 사용량 측정
+
+사용법: python -m benchmarks.bench_iter_books [--rows 5000000] [--fetchall]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import time
+import tracemalloc
+from benchmarks.common import make_books, temp_db_path
+from utils.database import DatabaseManager
+
+def measure(label: str, func):
+    tracemalloc.start()
+    began = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - began
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {count:>10,} rows {elapsed:8.1f}s "
+          f"{count / elapsed:>10,.0f} rows/s  peak {peak / 1024 / 1024:8.1f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000000)
+    parser.add_argument('--page-size', type=int, default=5000)
+    parser.add_argument('--fetchall', action='store_true',
+                        help='비교용으로 fetchall 을 함께 측정 (전체 행을 메모리에 올림)')
+    args = parser.parse_args()
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1, profile='bulk-load')
+        db.initialize_db()
+        began = time.perf_counter()
+        db.add_books(make_books(args.rows))
+        print(f"loaded {args.rows:,} rows in {time.perf_counter() - began:.1f}s")
+
+        measure('iter_books(id)',
+                lambda: sum(1 for _ in db.iter_books(page_size=args.page_size)))
+        measure('iter_books(author)',
+                lambda: sum(1 for _ in db.iter_books(order_by='author',
+                                                     page_size=args.page_size)))
+        if args.fetchall:
+            def fetchall():
+                with db.get_connection() as conn:
+                    return len(conn.execute('SELECT * FROM books').fetchall())
+            measure('fetchall', fetchall)
+        db.close()
+
+if __name__ == '__main__':
+    main()
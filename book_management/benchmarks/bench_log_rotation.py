@@ -0,0 +1,92 @@
+"""로그 순환 시 로그 호출 지연: 순환 없음 / 호출 스레드에서 gzip / 백그라운드 gzip 비교
+
+사용법: python -m benchmarks.bench_log_rotation [--records 200000] [--max-bytes 1048576]
+(book_management 디렉터리에서 실행)
+큐 없이(queue_size=0) 호출 스레드가 직접 파일에 쓰게 해서 순환 비용이 그대로 드러나게 합니다.
+"""
+
+import argparse
+import gzip
+import logging
+import os
+import shutil
+import time
+from logging.handlers import RotatingFileHandler
+from benchmarks.common import temp_db_path
+from utils.log_rotation import RotatingArchiveHandler
+
+def inline_gzip_handler(path, max_bytes):
+    """logging cookbook 의 rotator 방식: 순환하는 스레드가 직접 gzip 으로 압축"""
+    def rotator(source, dest):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb', compresslevel=6) as f_out:
+            shutil.copyfileobj(f_in, f_out, 1 << 20)
+        os.remove(source)
+
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=1000,
+                                  encoding='utf-8', delay=True)
+    handler.namer = lambda name: f'{name}.gz'
+    handler.rotator = rotator
+    return handler
+
+def count_rollovers(handler):
+    """doRollover 호출 횟수를 세도록 감쌈"""
+    counter = [0]
+    rollover = handler.doRollover
+
+    def counting_rollover():
+        counter[0] += 1
+        rollover()
+
+    handler.doRollover = counting_rollover
+    return counter
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def run(logger, counter, records):
+    """호출마다 지연을 재고, 순환이 일어난 호출의 지연은 따로 모음"""
+    samples, rotating = [], []
+    clock = time.perf_counter
+    for n in range(records):
+        before = counter[0]
+        began = clock()
+        logger.info("도서 추가됨: %s (ID: %d)", "파이썬 프로그래밍", n)
+        elapsed = clock() - began
+        samples.append(elapsed)
+        if counter[0] != before:
+            rotating.append(elapsed)
+    return sorted(samples), sorted(rotating)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--max-bytes', type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    for label, make_handler in (
+            ('no rotation', lambda path: logging.FileHandler(path, delay=True)),
+            ('rotate + inline gzip', lambda path: inline_gzip_handler(path, args.max_bytes)),
+            ('rotate + background gzip',
+             lambda path: RotatingArchiveHandler(path, max_bytes=args.max_bytes))):
+        with temp_db_path('app.log') as path:
+            handler = make_handler(path)
+            handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+            counter = count_rollovers(handler) if hasattr(handler, 'doRollover') else [0]
+            logger = logging.getLogger(f"bench.{label}")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            logger.addHandler(handler)
+            samples, rotating = run(logger, counter, args.records)
+            began = time.perf_counter()
+            handler.close()
+            closing = time.perf_counter() - began
+            logger.removeHandler(handler)
+            rotating_calls = (f"{percentile(rotating, 0.5) * 1e3:6.2f} / {rotating[-1] * 1e3:6.2f} ms"
+                              if rotating else "      -")
+            print(f"{label:<26} p50 {percentile(samples, 0.5) * 1e6:6.1f} us"
+                  f"  p99 {percentile(samples, 0.99) * 1e6:7.1f} us"
+                  f"  max {samples[-1] * 1e3:7.2f} ms  rotations {counter[0]:3d}"
+                  f"  rotating call p50/max {rotating_calls}  close {closing:5.2f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""로그 호출 지연: 동기 FileHandler 와 큐 기반 로깅 비교
+
+사용법: python -m benchmarks.bench_logging [--records 50000] [--threads 4] [--fsync]
+(book_management 디렉터리에서 실행)
+--fsync 를 주면 레코드마다 fsync 해서 느린 디스크를 흉내 냅니다.
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from benchmarks.common import temp_db_path
+from utils import log_queue
+from utils.logger import setup_logger, shutdown_loggers
+
+def file_handler_of(logger):
+    """로거가 실제로 파일에 쓰는 핸들러 (큐 방식이면 리스너 쪽 핸들러)"""
+    for handler in logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            return handler
+    for name, queue_handler, listener, handler in log_queue._listeners:
+        if queue_handler in logger.handlers:
+            return handler
+
+def slow_down(handler):
+    """레코드마다 fsync 하도록 바꿔 느린 디스크를 흉내 냄"""
+    flush = handler.flush
+
+    def flush_and_sync():
+        flush()
+        if handler.stream is not None:
+            os.fsync(handler.stream.fileno())
+
+    handler.flush = flush_and_sync
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def burst(logger, records, threads):
+    """여러 스레드가 동시에 로그를 쏟아낼 때 호출 한 번의 지연을 측정"""
+    latencies = [[] for _ in range(threads)]
+
+    def worker(out):
+        clock = time.perf_counter
+        for n in range(records // threads):
+            began = clock()
+            logger.info("도서 추가됨: %s (ID: %d)", "파이썬 프로그래밍", n)
+            out.append(clock() - began)
+
+    workers = [threading.Thread(target=worker, args=(out,)) for out in latencies]
+    began = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - began, sorted(sum(latencies, []))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--fsync', action='store_true')
+    args = parser.parse_args()
+
+    with temp_db_path('app.log') as path:
+        for label, kwargs in (('sync FileHandler', {'queue_size': 0}),
+                              ('queue drop (10000)', {'queue_size': 10000, 'overflow': 'drop'}),
+                              ('queue block (10000)', {'queue_size': 10000, 'overflow': 'block'})):
+            name = f"bench.{label}"
+            logger = setup_logger(name, path, **kwargs)
+            logger.propagate = False
+            if args.fsync:
+                slow_down(file_handler_of(logger))
+            elapsed, samples = burst(logger, args.records, args.threads)
+            handlers = list(logger.handlers)
+            began = time.perf_counter()
+            shutdown_loggers()
+            drain = time.perf_counter() - began
+            dropped = sum(getattr(h, 'dropped', 0) for h in handlers)
+            print(f"{label:<20} p50 {percentile(samples, 0.5) * 1e6:7.1f} us"
+                  f"  p99 {percentile(samples, 0.99) * 1e6:8.1f} us"
+                  f"  max {samples[-1] * 1e3:7.1f} ms  burst {elapsed:5.2f}s"
+                  f"  flush {drain:5.2f}s  dropped {dropped}")
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+
+if __name__ == '__main__':
+    main()
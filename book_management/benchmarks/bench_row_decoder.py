@@ -0,0 +1,47 @@
+"""행 디코딩 비용 비교: raw 튜플, Book(*row), 날짜 파싱 포함 디코더
+
+사용법: python -m benchmarks.bench_row_decoder [--rows 1000000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import time
+from datetime import datetime
+from benchmarks.common import make_books, temp_db_path
+from models.book import Book
+from utils.database import BOOK_COLUMNS, DatabaseManager
+from utils.row_decoder import make_book_decoder
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1, profile='bulk-load')
+        db.initialize_db()
+        db.add_books(make_books(args.rows))
+        rows = list(db.iter_books(raw=True, page_size=50000))
+        db.close()
+
+    def uncached(row):
+        # 캐시 없이 행마다 strptime 으로 파싱하는 방식
+        return Book(row[0], row[1], row[2], row[3],
+                    datetime.strptime(row[4], '%Y-%m-%d'), row[5],
+                    datetime.strptime(row[6], '%Y-%m-%d %H:%M:%S'))
+
+    decoders = [
+        ('Book(*row) (dates as str)', lambda row: Book(*row)),
+        ('strptime per row', uncached),
+        ('make_book_decoder', make_book_decoder(BOOK_COLUMNS)),
+    ]
+    scale = 1000000 / len(rows)
+    print(f"{'decoder':<28} {'s per 1M rows':>14}")
+    for label, decode in decoders:
+        began = time.perf_counter()
+        for row in rows:
+            decode(row)
+        print(f"{label:<28} {(time.perf_counter() - began) * scale:>14.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""도서 내보내기: json.dumps(book.to_dict()) 와 일괄 직렬화기 비교
+
+사용법: python -m benchmarks.bench_serializer [--rows 200000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from benchmarks.common import make_books, temp_db_path
+from utils.serializer import write_csv, write_jsonl
+
+def strftime_to_dict(book):
+    """캐시를 넣기 전 Book.to_dict 와 같은 구현 (기준선)"""
+    return {
+        'id': book.id,
+        'title': book.title,
+        'author': book.author,
+        'isbn': book.isbn,
+        'published_date': book.published_date.strftime('%Y-%m-%d'),
+        'quantity': book.quantity,
+        'created_at': book.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    books = list(make_books(args.rows))
+    # DB 에서 읽은 도서처럼 created_at 은 초 단위이고 일괄 등록이라 같은 초가 많음
+    started = datetime(2024, 1, 1)
+    for n, book in enumerate(books):
+        book.id = n + 1
+        book.created_at = started + timedelta(seconds=n // 100)
+
+    with temp_db_path('books.jsonl') as path:
+        def run(label, export):
+            began = time.perf_counter()
+            export()
+            elapsed = time.perf_counter() - began
+            print(f"{label:<36} {elapsed:7.2f}s {args.rows / elapsed:12,.0f} books/s"
+                  f"  {os.path.getsize(path) / 1024 / 1024:6.1f} MiB")
+            return elapsed
+
+        def baseline(to_dict):
+            with open(path, 'w', encoding='utf-8') as f:
+                for book in books:
+                    f.write(json.dumps(to_dict(book)) + '\n')
+
+        base = run('json.dumps(to_dict()) (strftime)', lambda: baseline(strftime_to_dict))
+        run('json.dumps(to_dict()) (cached)', lambda: baseline(lambda book: book.to_dict()))
+        fast = run('write_jsonl', lambda: write_jsonl(books, path))
+        run('write_jsonl compress=True', lambda: write_jsonl(books, path, compress=True))
+        run('write_csv', lambda: write_csv(books, path))
+        run('write_csv compress=True', lambda: write_csv(books, path, compress=True))
+        print(f"write_jsonl speedup {base / fast:.1f}x")
+
+if __name__ == '__main__':
+    main()
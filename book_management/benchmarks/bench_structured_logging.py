@@ -0,0 +1,61 @@
+"""대량 가져오기에서 행마다 로그를 남길 때의 비용: f-string / %-인자 / EventLog 비교
+
+사용법: python -m benchmarks.bench_structured_logging [--records 100000]
+(book_management 디렉터리에서 실행)
+각 방식으로 행마다 한 번씩 로그를 호출하고, 호출에 든 시간과 파일에 남은 줄 수를 출력합니다.
+"""
+
+import argparse
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.logger import setup_logger, shutdown_loggers
+from utils.structured_log import EventLog
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+    books = list(make_books(args.records))
+
+    with temp_db_path('app.log') as path:
+        for label, log_format in (('text f-string', 'text'), ('text %-args', 'text'),
+                                  ('EventLog text', 'text'), ('EventLog json', 'json'),
+                                  ('EventLog json 100/s', 'json'),
+                                  ('EventLog json 1/1000', 'json')):
+            name = f"bench.{label}"
+            # 큐가 넘쳐 버려지는 레코드 없이 비교하도록 block 정책 사용
+            logger = setup_logger(name, path, queue_size=10000, overflow='block',
+                                  log_format=log_format)
+            logger.propagate = False
+            if label == 'text f-string':
+                def log_row(book, book_id):
+                    logger.info(f"도서 추가됨: {book.title} (ID: {book_id})")
+            elif label == 'text %-args':
+                def log_row(book, book_id):
+                    logger.info("도서 추가됨: %s (ID: %d)", book.title, book_id)
+            else:
+                event_log = EventLog('book_added', logger_name=name,
+                                     max_per_second=100 if label.endswith('/s') else 0,
+                                     sample_every=1000 if label.endswith('1/1000') else 1)
+
+                def log_row(book, book_id, event_log=event_log):
+                    event_log(book_id=book_id, title=book.title, isbn=book.isbn)
+
+            began = time.perf_counter()
+            for book_id, book in enumerate(books, 1):
+                log_row(book, book_id)
+            elapsed = time.perf_counter() - began
+            began = time.perf_counter()
+            shutdown_loggers()
+            drain = time.perf_counter() - began
+            with open(path, encoding='utf-8') as f:
+                lines = sum(1 for _ in f)
+            open(path, 'w').close()
+            print(f"{label:<22} {elapsed / len(books) * 1e6:6.2f} us/row"
+                  f"  flush {drain:5.2f}s  lines {lines:7,d}")
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+
+if __name__ == '__main__':
+    main()
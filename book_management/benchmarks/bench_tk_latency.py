@@ -0,0 +1,99 @@
+"""대량 가져오기 중 UI 프레임 지연 측정: Tk 스레드에서 직접 실행 vs AsyncDatabaseManager
+
+16ms 마다 예약한 프레임 콜백이 얼마나 늦게 실행되는지 기록합니다.
+DISPLAY 가 있으면 실제 Tk, 없으면 root.after 만 흉내내는 FakeTkRoot 를 사용합니다.
+
+사용법: python -m benchmarks.bench_tk_latency [--rows 100000]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.async_database import AsyncDatabaseManager
+from utils.database import DatabaseManager
+from utils.tk_bridge import AsyncTkBridge
+
+FRAME_MS = 16
+
+def make_root():
+    if os.environ.get('DISPLAY'):
+        import tkinter as tk
+        root = tk.Tk()
+
+        def run_until(predicate, timeout=600.0):
+            deadline = time.monotonic() + timeout
+            while not predicate() and time.monotonic() < deadline:
+                root.update()
+                time.sleep(0.001)
+
+        root.run_until = run_until
+        return root
+    from tests.fake_tk import FakeTkRoot
+    return FakeTkRoot()
+
+class FrameProbe:
+    """FRAME_MS 간격으로 예약된 콜백의 지연(ms)을 기록"""
+
+    def __init__(self, root):
+        self.root = root
+        self.lateness = []
+        self.running = True
+        self._expected = time.perf_counter() + FRAME_MS / 1000
+        root.after(FRAME_MS, self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.lateness.append(max(0.0, (now - self._expected) * 1000))
+        if self.running:
+            self._expected = now + FRAME_MS / 1000
+            self.root.after(FRAME_MS, self._tick)
+
+    def report(self, label):
+        values = sorted(self.lateness)
+        p99 = values[int(len(values) * 0.99) - 1] if len(values) >= 100 else values[-1]
+        print(f"{label:<22} frames {len(values):6d}  p99 {p99:8.1f} ms  max {values[-1]:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    with temp_db_path() as path:
+        root = make_root()
+        db = DatabaseManager(path, profile='balanced')
+        db.initialize_db()
+        probe = FrameProbe(root)
+        done = []
+
+        def blocking_import():
+            db.add_books(make_books(args.rows))
+            done.append(True)
+
+        root.after(50, blocking_import)
+        root.run_until(lambda: done)
+        # 막혀 있던 프레임 콜백이 실행될 시간을 줌
+        root.run_until(lambda: False, timeout=0.1)
+        probe.running = False
+        probe.report('Tk thread (blocking)')
+        db.close()
+
+    with temp_db_path() as path:
+        root = make_root()
+        adb = AsyncDatabaseManager(path, profile='balanced')
+        bridge = AsyncTkBridge(root)
+        asyncio.run_coroutine_threadsafe(adb.initialize_db(), bridge.loop).result()
+        probe = FrameProbe(root)
+        done = []
+        bridge.submit(adb.add_books(make_books(args.rows)), on_success=done.append)
+        root.run_until(lambda: done)
+        root.run_until(lambda: False, timeout=0.1)
+        probe.running = False
+        probe.report('AsyncDatabaseManager')
+        bridge.close()
+        adb.close()
+
+if __name__ == '__main__':
+    main()
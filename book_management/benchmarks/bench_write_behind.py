@@ -0,0 +1,64 @@
+"""동시 add_book 과 write-behind 그룹 커밋의 처리량과 지연 시간 비교
+
+사용법: python -m benchmarks.bench_write_behind [--threads 8] [--per-thread 200]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from benchmarks.common import make_book, temp_db_path
+from utils.database import DatabaseManager
+from utils.write_behind import WriteBehindWriter
+
+def run(add, threads: int, per_thread: int):
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        local = []
+        for n in range(offset, offset + per_thread):
+            began = time.perf_counter()
+            add(make_book(n))
+            local.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(i * per_thread,)) for i in range(threads)]
+    began = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    elapsed = time.perf_counter() - began
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return len(latencies) / elapsed, statistics.median(latencies), p99
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--per-thread', type=int, default=200)
+    parser.add_argument('--profile', default=None)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14} {'rows/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=args.threads, profile=args.profile)
+        db.initialize_db()
+        result = run(db.add_book, args.threads, args.per_thread)
+        db.close()
+    print(f"{'add_book':<14} {result[0]:>10,.0f} {result[1] * 1000:>8.2f} {result[2] * 1000:>8.2f}")
+
+    with temp_db_path() as path:
+        db = DatabaseManager(path, pool_size=1, profile=args.profile)
+        db.initialize_db()
+        with WriteBehindWriter(db, max_batch_size=500, max_latency=0.005) as writer:
+            result = run(lambda book: writer.submit(book).result(),
+                         args.threads, args.per_thread)
+        db.close()
+    print(f"{'write-behind':<14} {result[0]:>10,.0f} {result[1] * 1000:>8.2f} {result[2] * 1000:>8.2f}")
+
+if __name__ == '__main__':
+    main()
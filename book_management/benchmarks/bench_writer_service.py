@@ -0,0 +1,64 @@
+"""여러 프로세스가 직접 쓰는 경우와 WriterService 를 거치는 경우의 처리량 비교
+
+사용법: python -m benchmarks.bench_writer_service [--processes 4] [--requests 200] [--rows 10]
+(book_management 디렉터리에서 실행)
+"""
+
+import argparse
+import multiprocessing as mp
+import sqlite3
+import time
+from benchmarks.common import make_books, temp_db_path
+from utils.database import DatabaseManager
+from utils.writer_service import WriterService
+
+def direct_writer(path, offset, requests, rows, errors):
+    db = DatabaseManager(path, profile='balanced')
+    for n in range(requests):
+        while True:
+            try:
+                db.add_books(make_books(rows, start=offset + n * rows))
+                break
+            except sqlite3.OperationalError:
+                # busy_timeout 을 넘겨 'database is locked' 가 나면 재시도
+                with errors.get_lock():
+                    errors.value += 1
+
+def service_writer(client, offset, requests, rows):
+    for n in range(requests):
+        client.add_books(make_books(rows, start=offset + n * rows))
+
+def run(processes):
+    began = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - began
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='프로세스당 쓰기 요청 수')
+    parser.add_argument('--rows', type=int, default=10, help='요청당 행 수')
+    args = parser.parse_args()
+    total = args.processes * args.requests * args.rows
+    span = args.requests * args.rows
+
+    with temp_db_path() as path:
+        DatabaseManager(path, profile='balanced').initialize_db()
+        errors = mp.Value('i', 0)
+        elapsed = run([mp.Process(target=direct_writer,
+                                  args=(path, i * span, args.requests, args.rows, errors))
+                       for i in range(args.processes)])
+        print(f"direct writers : {total / elapsed:10,.0f} rows/s  (lock retries: {errors.value})")
+
+    with temp_db_path() as path:
+        with WriterService(path) as service:
+            elapsed = run([mp.Process(target=service_writer,
+                                      args=(service.client(), i * span, args.requests, args.rows))
+                           for i in range(args.processes)])
+        print(f"writer service : {total / elapsed:10,.0f} rows/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""벤치마크 스크립트에서 공통으로 사용하는 도우미 함수"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator
+from models.book import Book
+
+AUTHORS = ["홍길동", "김철수", "이영희", "박민수", "최지우", "정우성", "강감찬", "유관순"]
+WORDS = ["파이썬", "프로그래밍", "데이터", "알고리즘", "네트워크", "데이터베이스",
+         "python", "async", "threading", "design", "patterns", "testing"]
+
+def make_book(n: int) -> Book:
+    """번호 n 에 대해 항상 같은 내용의 도서를 생성"""
+    return Book(
+        id=None,
+        title=f"{WORDS[n % len(WORDS)]} {WORDS[(n // 7) % len(WORDS)]} {n}",
+        author=AUTHORS[n % len(AUTHORS)],
+        isbn=f"ISBN-{n:012d}",
+        published_date=datetime(2000, 1, 1) + timedelta(days=n % 9000),
+        quantity=n % 10
+    )
+
+def make_books(count: int, start: int = 0) -> Iterator[Book]:
+    for n in range(start, start + count):
+        yield make_book(n)
+
+@contextmanager
+def temp_db_path(name: str = 'books.db'):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, name)
+
+@contextmanager
+def timer(label: str, count: int = 0, unit: str = 'ops'):
+    """블록 실행 시간을 측정해 출력"""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    if count:
+        print(f"{label:<40} {elapsed:8.3f}s {count / elapsed:12,.0f} {unit}/s")
+    else:
+        print(f"{label:<40} {elapsed:8.3f}s")
@@ -1,16 +1,42 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from models.book import Book
-from utils.database import DatabaseManager
-from utils.logger import logger
+from utils.async_database import AsyncDatabaseManager
+from utils.tk_bridge import AsyncTkBridge
+from utils.tk_worker import BackgroundJob, JobCancelled, TkWorker
+from utils.catalog_pager import CatalogPager
+from utils.catalog_view import CatalogView
+from utils.id_generator import SnowflakeIdGenerator
+from utils.autocomplete import AutocompleteIndex
+from utils.logger import get_logger
+from utils.structured_log import EventLog
 from datetime import datetime
 
+# 도서 추가 이벤트는 초당 10 줄까지만 기록하고 나머지는 건수만 남김
+BOOK_ADDED = EventLog('book_added', max_per_second=10)
+CSV_IMPORTED = EventLog('csv_imported')
+
 class BookManagementApp:
     def __init__(self, root):
         self.root = root
         self.root.title("도서 관리 시스템")
-        self.db = DatabaseManager('database/books.db')
-        self.db.initialize_db()
+        # 같은 초에 여러 권을 추가해도 isbn 이 겹치지 않도록 Snowflake id 사용
+        # (CSV 가져오기에서 isbn 이 비어 있는 행도 DB 스레드에서 같은 생성기로 채움)
+        self.isbn_generator = SnowflakeIdGenerator()
+        # DB 작업은 전용 스레드에서 실행하고 결과만 Tk 메인 스레드로 받음
+        self.db = AsyncDatabaseManager('database/books.db', profile='balanced',
+                                       isbn_generator=self.isbn_generator)
+        self.bridge = AsyncTkBridge(self.root)
+        # 목록 페이지 조회는 작업 스레드에서 DB 스레드로 보내고 결과를 기다림
+        # (뷰가 이 작업 스레드를 계속 쓰므로 창을 닫을 때까지 바꾸지 않음)
+        self.catalog_worker = TkWorker(self.bridge.pump)
+        self.current_job = None
+        self.bridge.submit(self.db.initialize_db(), on_success=lambda _: self.catalog.reload(),
+                           on_error=self.on_db_error)
+        # 자동 완성 인덱스는 DB 스레드에서 만들고, 그 전까지는 빈 인덱스 사용
+        self.autocomplete = AutocompleteIndex()
+        self.bridge.submit(self.db.build_autocomplete(),
+                           on_success=self.on_autocomplete_loaded, on_error=self.on_db_error)
         
         self.setup_ui()
     
@@ -22,39 +48,154 @@ class BookManagementApp:
         # 입력 필드
         ttk.Label(input_frame, text="제목:").grid(row=0, column=0, padx=5, pady=5)
         self.title_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.title_var).grid(row=0, column=1, padx=5, pady=5)
+        title_entry = ttk.Combobox(input_frame, textvariable=self.title_var)
+        title_entry.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(input_frame, text="저자:").grid(row=1, column=0, padx=5, pady=5)
         self.author_var = tk.StringVar()
-        ttk.Entry(input_frame, textvariable=self.author_var).grid(row=1, column=1, padx=5, pady=5)
+        author_entry = ttk.Combobox(input_frame, textvariable=self.author_var)
+        author_entry.grid(row=1, column=1, padx=5, pady=5)
+        
+        # 입력할 때마다 메모리 인덱스에서 제안 목록을 갱신 (DB 조회 없음)
+        self.title_var.trace_add('write', lambda *_: self.update_suggestions(
+            title_entry, self.title_var, self.autocomplete.titles))
+        self.author_var.trace_add('write', lambda *_: self.update_suggestions(
+            author_entry, self.author_var, self.autocomplete.authors))
         
         # 버튼
         ttk.Button(input_frame, text="도서 추가", command=self.add_book).grid(row=2, column=0, columnspan=2, pady=10)
+        
+        # 작업 프레임 (CSV 가져오기, 진행률, 취소)
+        job_frame = ttk.LabelFrame(self.root, text="작업")
+        job_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
+        
+        self.import_button = ttk.Button(job_frame, text="CSV 가져오기", command=self.import_books)
+        self.import_button.grid(row=0, column=0, padx=5, pady=5)
+        self.cancel_button = ttk.Button(job_frame, text="취소", command=self.cancel_job,
+                                        state="disabled")
+        self.cancel_button.grid(row=0, column=1, padx=5, pady=5)
+        
+        self.progress = ttk.Progressbar(job_frame, maximum=100, length=240)
+        self.progress.grid(row=1, column=0, columnspan=2, padx=5, pady=5)
+        self.status_var = tk.StringVar(value="대기 중")
+        ttk.Label(job_frame, textvariable=self.status_var).grid(row=2, column=0, columnspan=2, padx=5, pady=5)
+        
+        # 도서 목록 (보이는 행만 DB 에서 읽는 가상 목록, 제목을 누르면 정렬)
+        catalog_frame = ttk.LabelFrame(self.root, text="도서 목록")
+        catalog_frame.grid(row=0, column=1, rowspan=2, padx=10, pady=5, sticky="nsew")
+        self.catalog = CatalogView(catalog_frame, CatalogPager(self.db.blocking()),
+                                   self.catalog_worker)
+        self.catalog.grid(row=0, column=0, sticky="nsew")
+        catalog_frame.columnconfigure(0, weight=1)
+        catalog_frame.rowconfigure(0, weight=1)
+        self.root.columnconfigure(1, weight=1)
+        self.root.rowconfigure(1, weight=1)
+    
+    def update_suggestions(self, entry, var, index):
+        entry['values'] = index.suggest(var.get(), limit=10)
+    
+    def on_autocomplete_loaded(self, index):
+        # 인덱스를 만든 뒤 추가되는 도서는 add_book 성공 콜백에서 반영됨
+        self.autocomplete = index
     
     def add_book(self):
-        try:
-            book = Book(
-                id=None,
-                title=self.title_var.get(),
-                author=self.author_var.get(),
-                isbn=f"ISBN-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                published_date=datetime.now(),
-                quantity=1
-            )
-            
-            book_id = self.db.add_book(book)
-            logger.info(f"도서 추가됨: {book.title} (ID: {book_id})")
+        book = Book(
+            id=None,
+            title=self.title_var.get(),
+            author=self.author_var.get(),
+            isbn=self.isbn_generator.next_isbn(),
+            published_date=datetime.now(),
+            quantity=1
+        )
+        
+        def on_success(book_id):
+            BOOK_ADDED(book_id=book_id, title=book.title, isbn=book.isbn)
+            self.autocomplete.add_book(book)
+            self.catalog.reload()
             messagebox.showinfo("성공", "도서가 추가되었습니다.")
             
             # 입력 필드 초기화
             self.title_var.set("")
             self.author_var.set("")
-            
-        except Exception as e:
-            logger.error(f"도서 추가 실패: {str(e)}")
+        
+        def on_error(e):
+            get_logger().error("도서 추가 실패: %s", e)
             messagebox.showerror("오류", f"도서 추가 중 오류 발생: {str(e)}")
+        
+        self.bridge.submit(self.db.add_book(book), on_success=on_success, on_error=on_error)
+    
+    def import_books(self):
+        path = filedialog.askopenfilename(
+            title="가져올 CSV 파일", filetypes=[("CSV", "*.csv *.csv.gz"), ("모든 파일", "*")])
+        if not path:
+            return
+        
+        def on_success(result):
+            CSV_IMPORTED(path=path, total=result.total, written=result.written)
+            self.finish_job(f"가져오기 완료: {result.written}권 저장, {result.skipped}권 건너뜀")
+            self.catalog.reload()
+            # 새로 들어온 제목/저자를 자동 완성에 반영
+            self.bridge.submit(self.db.build_autocomplete(),
+                               on_success=self.on_autocomplete_loaded, on_error=self.on_db_error)
+        
+        # 가져오기는 청크마다 DB 스레드의 호출 하나이므로 그 사이 도서 추가와 목록 조회도 처리됨
+        self.start_job("가져오는 중...", self.db.import_csv, path, on_success=on_success)
+    
+    def start_job(self, status, coro_func, *args, on_success):
+        """coro_func(*args, job=job) 코루틴을 실행하고 진행률/취소를 job 으로 주고받음"""
+        if self.current_job is not None:
+            messagebox.showwarning("작업 중", "이미 진행 중인 작업이 있습니다.")
+            return
+        self.progress['value'] = 0
+        self.status_var.set(status)
+        self.import_button['state'] = "disabled"
+        self.cancel_button['state'] = "normal"
+        self.current_job = BackgroundJob(self.bridge.pump, self.on_job_progress)
+        self.bridge.submit(coro_func(*args, job=self.current_job),
+                           on_success=on_success, on_error=self.on_job_error)
+    
+    def on_job_progress(self, done, total):
+        if total:
+            self.progress['value'] = done * 100 / total
+    
+    def on_job_cancelled(self, cancelled):
+        result = cancelled.args[0] if cancelled.args else None
+        saved = f" ({result.written}권 저장됨)" if result is not None else ""
+        self.finish_job(f"취소됨{saved}")
+    
+    def on_job_error(self, e):
+        if isinstance(e, JobCancelled):
+            self.on_job_cancelled(e)
+            return
+        get_logger().error("작업 실패: %s", e)
+        self.finish_job("실패")
+        messagebox.showerror("오류", f"작업 중 오류 발생: {str(e)}")
+    
+    def finish_job(self, status):
+        self.current_job = None
+        self.progress['value'] = 0
+        self.status_var.set(status)
+        self.import_button['state'] = "normal"
+        self.cancel_button['state'] = "disabled"
+    
+    def cancel_job(self):
+        if self.current_job is not None:
+            self.current_job.cancel()
+            self.status_var.set("취소하는 중...")
+    
+    def on_db_error(self, e):
+        get_logger().error("데이터베이스 오류: %s", e)
+        messagebox.showerror("오류", f"데이터베이스 오류: {str(e)}")
+    
+    def on_close(self):
+        # after 콜백을 취소해야 하므로 창을 닫기 전에 정리
+        self.catalog_worker.close()
+        self.bridge.close()
+        self.db.close()
+        self.root.destroy()
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = BookManagementApp(root)
+    root.protocol("WM_DELETE_WINDOW", app.on_close)
     root.mainloop()
@@ -1,7 +1,28 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
 
-@dataclass
+# strftime 대신 C 로 구현된 isoformat 을 씀. datetime 을 키로 캐시하면 시간대만 다른
+# 같은 시각이 한 항목을 공유해 다른 문자열이 나오므로, 날짜는 value.date() (그 값의 시간대 기준
+# 날짜) 를 키로 캐시하고 시각은 캐시하지 않음
+@lru_cache(maxsize=65536)
+def _format_day(value: date) -> str:
+    return value.isoformat()
+
+def format_date(value: date) -> str:
+    """'%Y-%m-%d' 형식 (datetime 과 date 모두 받음)"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return _format_day(value)
+
+def format_datetime(value: datetime) -> str:
+    """'%Y-%m-%d %H:%M:%S' 형식 (시간대가 있으면 그 시간대의 시각을 오프셋 없이 씀)"""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return value.isoformat(' ', 'seconds')
+
+# slots=True: 인스턴스마다 __dict__ 를 두지 않아 수백만 권을 올려도 메모리가 적게 듦
+@dataclass(slots=True)
 class Book:
     id: int
     title: str
@@ -9,7 +30,8 @@ class Book:
     isbn: str
     published_date: datetime
     quantity: int
-    created_at: datetime = datetime.now()
+    # 기본값은 인스턴스를 만들 때마다 새로 계산 (import 시각으로 고정되지 않도록)
+    created_at: datetime = field(default_factory=datetime.now)
     
     def to_dict(self):
         return {
@@ -17,7 +39,7 @@ class Book:
             'title': self.title,
             'author': self.author,
             'isbn': self.isbn,
-            'published_date': self.published_date.strftime('%Y-%m-%d'),
+            'published_date': format_date(self.published_date),
             'quantity': self.quantity,
-            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S')
+            'created_at': format_datetime(self.created_at)
         }
@@ -0,0 +1,121 @@
+import sys
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from models.book import Book
+from utils.row_decoder import parse_datetime
+
+_SECONDS_PER_DAY = 86400
+
+def _parse(value):
+    return parse_datetime(value) if isinstance(value, str) else value
+
+def _date_to_ordinal(value: Optional[date]) -> int:
+    # 0 은 None (서기 1년 1월 1일의 서수가 1이므로 겹치지 않음)
+    return 0 if value is None else value.toordinal()
+
+def _ordinal_to_datetime(value: int) -> Optional[datetime]:
+    return None if value == 0 else datetime.fromordinal(value)
+
+def _datetime_to_seconds(value: Optional[datetime]) -> int:
+    if value is None:
+        return 0
+    return (value.toordinal() * _SECONDS_PER_DAY
+            + value.hour * 3600 + value.minute * 60 + value.second)
+
+def _seconds_to_datetime(value: int) -> Optional[datetime]:
+    if value == 0:
+        return None
+    days, seconds = divmod(value, _SECONDS_PER_DAY)
+    return datetime.fromordinal(days) + timedelta(seconds=seconds)
+
+class BookBatch:
+    """여러 도서를 컬럼별 배열로 담는 컨테이너
+
+    숫자와 날짜는 array 에 기계어 정수로, 문자열은 리스트에 담습니다(반복이 많은
+    저자는 intern 해서 같은 문자열 객체를 공유). Book 객체를 만들지 않고
+    저자별 합계 같은 일괄 처리를 할 수 있습니다.
+    저장 형식과 같게 published_date 는 날짜, created_at 은 초 단위까지만 보관합니다.
+    id 가 None 인 도서는 0 으로 저장됩니다.
+    """
+
+    __slots__ = ('ids', 'titles', 'authors', 'isbns', 'published_dates', 'quantities',
+                 'created_at')
+
+    def __init__(self):
+        self.ids = array('q')
+        self.titles: List[str] = []
+        self.authors: List[str] = []
+        self.isbns: List[str] = []
+        # date.toordinal() 값
+        self.published_dates = array('i')
+        self.quantities = array('q')
+        # 서수 * 86400 + 하루 중 초
+        self.created_at = array('q')
+
+    @classmethod
+    def from_books(cls, books: Iterable[Book]) -> 'BookBatch':
+        batch = cls()
+        batch.extend(books)
+        return batch
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> 'BookBatch':
+        """iter_books(raw=True) 처럼 BOOK_COLUMNS 순서의 행에서 바로 만듦 (Book 생성 없음)"""
+        batch = cls()
+        intern = sys.intern
+        for book_id, title, author, isbn, published_date, quantity, created_at in rows:
+            batch.ids.append(book_id or 0)
+            batch.titles.append(title)
+            batch.authors.append(intern(author))
+            batch.isbns.append(isbn)
+            batch.published_dates.append(_date_to_ordinal(_parse(published_date)))
+            batch.quantities.append(quantity or 0)
+            batch.created_at.append(_datetime_to_seconds(_parse(created_at)))
+        return batch
+
+    def append(self, book: Book):
+        self.extend((book,))
+
+    def extend(self, books: Iterable[Book]):
+        intern = sys.intern
+        for book in books:
+            self.ids.append(book.id or 0)
+            self.titles.append(book.title)
+            self.authors.append(intern(book.author))
+            self.isbns.append(book.isbn)
+            self.published_dates.append(_date_to_ordinal(book.published_date))
+            self.quantities.append(book.quantity or 0)
+            self.created_at.append(_datetime_to_seconds(book.created_at))
+
+    def __len__(self) -> int:
+        return len(self.isbns)
+
+    def __getitem__(self, index: int) -> Book:
+        return Book(self.ids[index] or None, self.titles[index], self.authors[index],
+                    self.isbns[index], _ordinal_to_datetime(self.published_dates[index]),
+                    self.quantities[index], _seconds_to_datetime(self.created_at[index]))
+
+    def __iter__(self) -> Iterator[Book]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_books(self) -> List[Book]:
+        return list(self)
+
+    def total_quantity_by_author(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        get = totals.get
+        for author, quantity in zip(self.authors, self.quantities):
+            totals[author] = get(author, 0) + quantity
+        return totals
+
+    def total_quantity(self) -> int:
+        return sum(self.quantities)
+
+    def memory_usage(self) -> int:
+        """배열과 리스트, 그리고 서로 다른 문자열 객체가 차지하는 대략적인 바이트 수"""
+        size = sum(sys.getsizeof(getattr(self, name)) for name in self.__slots__)
+        strings = {id(value): value for column in (self.titles, self.authors, self.isbns)
+                   for value in column}
+        return size + sum(map(sys.getsizeof, strings.values()))
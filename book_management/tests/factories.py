@@ -0,0 +1,7 @@
+from datetime import datetime
+from models.book import Book
+
+def make_book(isbn: str, title: str = "파이썬", author: str = "홍길동", quantity: int = 1) -> Book:
+    """테스트용 도서 (지정한 값 외에는 모든 테스트에서 같은 값)"""
+    return Book(id=None, title=title, author=author, isbn=isbn,
+                published_date=datetime(2024, 1, 1), quantity=quantity)
@@ -0,0 +1,40 @@
+import heapq
+import itertools
+import time
+
+class FakeTkRoot:
+    """디스플레이 없이 root.after 만 흉내내는 단일 스레드 이벤트 루프 (테스트용)"""
+
+    def __init__(self):
+        self._timers = []
+        self._counter = itertools.count()
+        self._cancelled = set()
+
+    def after(self, ms, func, *args):
+        after_id = f"after#{next(self._counter)}"
+        heapq.heappush(self._timers, (time.monotonic() + ms / 1000, after_id, func, args))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self._cancelled.add(after_id)
+
+    def run_until(self, predicate, timeout: float = 10.0) -> bool:
+        """predicate() 가 참이 되거나 timeout 이 지날 때까지 타이머를 실행"""
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            if not self._timers:
+                time.sleep(0.001)
+                continue
+            due, after_id, func, args = self._timers[0]
+            if due > now:
+                time.sleep(min(due - now, deadline - now))
+                continue
+            heapq.heappop(self._timers)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            func(*args)
+        return True
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from tests.factories import make_book
+from tests.fake_tk import FakeTkRoot
+from utils.async_database import AsyncDatabaseManager
+from utils.id_generator import SnowflakeIdGenerator
+from utils.tk_bridge import AsyncTkBridge
+
+class TestAsyncDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(os.path.join(self.tmpdir.name, 'books.db'))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_awaitable_methods(self):
+        async def scenario():
+            await self.db.initialize_db()
+            book_id = await self.db.add_book(make_book("ISBN-1"))
+            result = await self.db.add_books(make_book(f"ISBN-{i}") for i in range(2, 12))
+            book = await self.db.get_book_by_isbn("ISBN-1")
+            found = await self.db.get_books_by_isbns(["ISBN-1", "ISBN-5", "ISBN-99"])
+            return book_id, result, book, found
+
+        book_id, result, book, found = asyncio.run(scenario())
+        self.assertEqual(book.id, book_id)
+        self.assertEqual(result.written, 10)
+        self.assertEqual(set(found), {"ISBN-1", "ISBN-5"})
+
+    def test_runs_off_the_event_loop_thread(self):
+        async def scenario():
+            await self.db.initialize_db()
+            return await self.db._run(threading.get_ident)
+
+        self.assertNotEqual(asyncio.run(scenario()), threading.get_ident())
+
+    def test_isbn_generator_fills_empty_isbns(self):
+        db = AsyncDatabaseManager(os.path.join(self.tmpdir.name, 'generated.db'),
+                                  isbn_generator=SnowflakeIdGenerator(node_id=3))
+
+        async def scenario():
+            await db.initialize_db()
+            book = make_book("")
+            await db.add_book(book)
+            result = await db.add_books([{'title': "책", 'author': "저자", 'isbn': "", 'quantity': 1}])
+            return book, result, await db.get_book_by_isbn(book.isbn)
+
+        try:
+            book, result, found = asyncio.run(scenario())
+        finally:
+            db.close()
+        self.assertTrue(book.isbn.startswith("ISBN-"))
+        self.assertEqual(found.title, "파이썬")
+        self.assertEqual(result.written, 1)
+
+    def test_blocking_view_runs_on_db_thread(self):
+        async def scenario():
+            await self.db.initialize_db()
+            await self.db.add_books(make_book(f"ISBN-{i}") for i in range(5))
+            return await self.db._run(threading.get_ident)
+
+        db_thread = asyncio.run(scenario())
+        blocking = self.db.blocking()
+        self.assertEqual(blocking.count_books(), 5)
+        self.assertEqual([row[0] for row in blocking.fetch_page('id', after=2, limit=2)], [3, 4])
+        self.assertEqual(blocking.key_at('id', 0, descending=True), 5)
+        self.assertEqual(self.db._call(threading.get_ident), db_thread)
+
+class TestAsyncTkBridge(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(os.path.join(self.tmpdir.name, 'books.db'))
+        self.root = FakeTkRoot()
+        self.bridge = AsyncTkBridge(self.root, poll_interval=5)
+
+    def tearDown(self):
+        self.bridge.close()
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_callbacks_run_on_tk_thread(self):
+        results = []
+        self.bridge.submit(self.db.initialize_db())
+        self.bridge.submit(self.db.add_book(make_book("ISBN-1")),
+                           on_success=lambda book_id: results.append(
+                               (book_id, threading.get_ident())))
+        self.assertTrue(self.root.run_until(lambda: results))
+        self.assertEqual(results[0], (1, threading.get_ident()))
+
+    def test_errors_are_delivered(self):
+        errors = []
+        self.bridge.submit(self.db.initialize_db())
+        self.bridge.submit(self.db.add_book(make_book("ISBN-1")))
+        self.bridge.submit(self.db.add_book(make_book("ISBN-1")), on_error=errors.append)
+        self.assertTrue(self.root.run_until(lambda: errors))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import time
+import unittest
+from tests.factories import make_book
+from utils.autocomplete import AutocompleteIndex, PrefixIndex, normalize
+from utils.database import DatabaseManager
+
+class TestPrefixIndex(unittest.TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize("  Ｐｙｔｈｏｎ   Cookbook "), "python cookbook")
+
+    def test_suggest_in_order_with_limit(self):
+        index = PrefixIndex(["파이썬 입문", "파이썬 활용", "파스칼", "Python", "python", "자바"])
+        self.assertEqual(index.suggest("파이"), ["파이썬 입문", "파이썬 활용"])
+        self.assertEqual(index.suggest("파", limit=1), ["파스칼"])
+        # 정규화하면 같은 값은 하나만
+        self.assertEqual(len(index.suggest("PY")), 1)
+        self.assertEqual(index.suggest(""), [])
+        self.assertEqual(index.suggest("없음"), [])
+
+    def test_prefix_is_not_matched_past_separator(self):
+        index = PrefixIndex(["ab", "abc"])
+        self.assertEqual(index.suggest("abc"), ["abc"])
+
+    def test_incremental_add(self):
+        index = PrefixIndex(["b"])
+        index.add("a")
+        index.add("a")
+        index.update(["c", "b"])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.suggest("a"), ["a"])
+        self.assertEqual(index.suggest("c"), ["c"])
+
+    def test_suggest_under_one_millisecond(self):
+        index = PrefixIndex(f"title {n:06d}" for n in range(200000))
+        began = time.perf_counter()
+        for n in range(1000):
+            self.assertEqual(len(index.suggest(f"title {n:04d}", limit=10)), 10)
+        self.assertLess((time.perf_counter() - began) / 1000, 0.001)
+
+class TestAutocompleteIndex(unittest.TestCase):
+    def test_from_database_and_add_book(self):
+        with DatabaseManager(':memory:', pool_size=1) as db:
+            db.initialize_db()
+            db.add_books([make_book("ISBN-1", "파이썬 입문", "홍길동"),
+                          make_book("ISBN-2", "파이썬 입문", "김철수")])
+            index = AutocompleteIndex.from_database(db)
+        self.assertEqual(index.titles.suggest("파이"), ["파이썬 입문"])
+        self.assertEqual(index.authors.suggest("김"), ["김철수"])
+        index.add_book(make_book("ISBN-3", "데이터베이스", "이영희"))
+        self.assertEqual(index.titles.suggest("데이"), ["데이터베이스"])
+        self.assertEqual(index.authors.suggest("이"), ["이영희"])
+        self.assertGreater(index.memory_usage(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
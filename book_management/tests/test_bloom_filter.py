@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from tests.factories import make_book
+from utils.bloom_filter import BloomFilter, load_or_create
+from utils.database import DatabaseManager
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_rate_near_configured(self):
+        bloom = BloomFilter(10000, 0.01)
+        bloom.update(f"ISBN-{i}" for i in range(10000))
+        self.assertTrue(all(f"ISBN-{i}" in bloom for i in range(10000)))
+        false_positives = sum(f"MISSING-{i}" in bloom for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.02)
+        self.assertAlmostEqual(bloom.estimated_false_positive_rate, 0.01, delta=0.005)
+
+    def test_stats(self):
+        bloom = BloomFilter(100)
+        bloom.add("ISBN-1")
+        self.assertTrue(bloom.might_contain("ISBN-1"))
+        self.assertFalse(bloom.might_contain("ISBN-2"))
+        bloom.record_false_positive()
+        self.assertEqual(bloom.stats.checks, 2)
+        self.assertEqual(bloom.stats.skipped, 1)
+        self.assertEqual(bloom.stats.probe_savings, 0.5)
+        self.assertEqual(bloom.stats.measured_false_positive_rate, 0.5)
+
+    def test_save_and_load(self):
+        bloom = BloomFilter(1000, 0.001)
+        bloom.update(f"ISBN-{i}" for i in range(500))
+        bloom.watermark = 500
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'isbn.bloom')
+            bloom.save(path)
+            loaded, from_file = load_or_create(path, 1000, 0.001)
+            self.assertTrue(from_file)
+            self.assertEqual((loaded.count, loaded.watermark), (500, 500))
+            self.assertTrue(all(f"ISBN-{i}" in loaded for i in range(500)))
+            # 설정이 바뀌면 저장된 필터를 쓰지 않음
+            self.assertFalse(load_or_create(path, 2000, 0.001)[1])
+            with open(path, 'wb') as f:
+                f.write(b'garbage')
+            self.assertFalse(load_or_create(path, 1000, 0.001)[1])
+
+class TestDatabaseIsbnFilter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'books.db')
+        self.filter_path = os.path.join(self.tmpdir.name, 'isbn.bloom')
+        db = DatabaseManager(self.path)
+        db.initialize_db()
+        db.add_books(make_book(f"ISBN-{i}") for i in range(1000))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def open(self):
+        db = DatabaseManager(self.path, pool_size=1, isbn_filter_capacity=10000,
+                             isbn_filter_file=self.filter_path)
+        db.initialize_db()
+        return db
+
+    def test_definite_miss_skips_probe(self):
+        with self.open() as db:
+            self.assertEqual(len(db.isbn_filter), 1000)
+            self.assertIsNotNone(db.get_book_by_isbn("ISBN-10"))
+            for i in range(1000, 2000):
+                self.assertIsNone(db.get_book_by_isbn(f"ISBN-{i}"))
+            stats = db.isbn_filter.stats
+            self.assertEqual(stats.checks, 1001)
+            self.assertEqual(stats.skipped + stats.false_positives, 1000)
+            self.assertGreater(stats.probe_savings, 0.9)
+
+    def test_inserts_update_filter(self):
+        with self.open() as db:
+            db.add_book(make_book("ISBN-NEW"))
+            db.add_books([make_book("ISBN-BULK")])
+            self.assertIsNotNone(db.get_book_by_isbn("ISBN-NEW"))
+            self.assertIsNotNone(db.get_book_by_isbn("ISBN-BULK"))
+
+    def test_warm_start_reads_only_new_rows(self):
+        with self.open():
+            pass
+        self.assertTrue(os.path.exists(self.filter_path))
+        # 필터를 저장한 뒤 다른 프로세스가 추가한 행
+        other = DatabaseManager(self.path)
+        other.add_book(make_book("ISBN-OTHER"))
+        with self.open() as db:
+            self.assertEqual(db.isbn_filter.watermark, 1001)
+            self.assertEqual(len(db.isbn_filter), 1001)
+            self.assertIsNotNone(db.get_book_by_isbn("ISBN-OTHER"))
+            other.add_book(make_book("ISBN-LATER"))
+            self.assertEqual(db.refresh_isbn_filter(), 1)
+            self.assertIsNotNone(db.get_book_by_isbn("ISBN-LATER"))
+
+    def test_existing_isbns(self):
+        with self.open() as db:
+            found = db.existing_isbns(["ISBN-1", "ISBN-1", "ISBN-999", "ISBN-X"])
+            self.assertEqual(found, {"ISBN-1", "ISBN-999"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
-from datetime import datetime
-from models.book import Book
+from datetime import date, datetime, timedelta, timezone
+from models.book import Book, format_date, format_datetime
 
 class TestBook(unittest.TestCase):
     def setUp(self):
@@ -23,6 +23,34 @@ class TestBook(unittest.TestCase):
         self.assertIsInstance(book_dict, dict)
         self.assertEqual(book_dict['title'], "파이썬 프로그래밍")
         self.assertEqual(book_dict['author'], "홍길동")
+    
+    def test_created_at_default_is_per_instance(self):
+        later = Book(id=2, title="t", author="a", isbn="ISBN-2",
+                     published_date=datetime.now(), quantity=1)
+        self.assertGreaterEqual(later.created_at, self.book.created_at)
+        self.assertIsNot(later.created_at, self.book.created_at)
+    
+    def test_format_equal_aware_datetimes_in_different_zones(self):
+        utc = datetime(2024, 1, 1, 23, 30, tzinfo=timezone.utc)
+        seoul = utc.astimezone(timezone(timedelta(hours=9)))
+        self.assertEqual(utc, seoul)
+        for first, second in ((utc, seoul), (seoul, utc)):
+            self.assertEqual(format_date(first), first.strftime('%Y-%m-%d'))
+            self.assertEqual(format_date(second), second.strftime('%Y-%m-%d'))
+            self.assertEqual(format_datetime(second), second.strftime('%Y-%m-%d %H:%M:%S'))
+        self.assertEqual((format_date(utc), format_date(seoul)), ("2024-01-01", "2024-01-02"))
+        self.assertEqual((format_datetime(utc), format_datetime(seoul)),
+                         ("2024-01-01 23:30:00", "2024-01-02 08:30:00"))
+
+    def test_format_date_accepts_date(self):
+        self.assertEqual(format_date(date(2024, 1, 2)), "2024-01-02")
+        book = Book(1, "파이썬", "홍길동", "ISBN-1", date(2024, 1, 2), 1, datetime(2024, 1, 2, 3, 4, 5))
+        self.assertEqual(book.to_dict()['published_date'], "2024-01-02")
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.book, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.book.subtitle = "부제"
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime
+from models.book import Book
+from models.book_batch import BookBatch
+from utils.database import DatabaseManager
+
+def make_book(n, author="홍길동"):
+    return Book(id=n, title=f"책 {n}", author=author, isbn=f"ISBN-{n}",
+                published_date=datetime(2024, 1, n % 28 + 1), quantity=n,
+                created_at=datetime(2024, 2, 1, 12, 30, n % 60))
+
+class TestBookBatch(unittest.TestCase):
+    def test_round_trip(self):
+        books = [make_book(n) for n in range(1, 50)]
+        batch = BookBatch.from_books(books)
+        self.assertEqual(len(batch), 49)
+        self.assertEqual(batch.to_books(), books)
+        self.assertEqual(batch[0], books[0])
+
+    def test_none_values(self):
+        book = Book(id=None, title="t", author="a", isbn="ISBN-X",
+                    published_date=None, quantity=0, created_at=None)
+        self.assertEqual(BookBatch.from_books([book])[0], book)
+
+    def test_authors_are_interned(self):
+        batch = BookBatch.from_books([make_book(1, "".join(["홍", "길동"])),
+                                      make_book(2, "".join(["홍길", "동"]))])
+        self.assertIs(batch.authors[0], batch.authors[1])
+
+    def test_total_quantity_by_author(self):
+        batch = BookBatch()
+        batch.extend(make_book(n, "홍길동") for n in range(1, 4))
+        batch.append(make_book(10, "김철수"))
+        self.assertEqual(batch.total_quantity_by_author(), {"홍길동": 6, "김철수": 10})
+        self.assertEqual(batch.total_quantity(), 16)
+        self.assertGreater(batch.memory_usage(), 0)
+
+    def test_from_rows_matches_decoded_books(self):
+        with DatabaseManager(':memory:', pool_size=1) as db:
+            db.initialize_db()
+            db.add_books(make_book(n) for n in range(1, 20))
+            books = list(db.iter_books())
+            batch = BookBatch.from_rows(db.iter_books(raw=True))
+        self.assertEqual(batch.to_books(), books)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import threading
+import unittest
+from tests.factories import make_book
+from utils.cache import MISSING, LRUCache
+from utils.database import DatabaseManager
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIs(cache.get('b'), MISSING)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, ttl=5, clock=clock)
+        cache.put('a', 1)
+        clock.now = 4.9
+        self.assertEqual(cache.get('a'), 1)
+        clock.now = 5.0
+        self.assertIs(cache.get('a'), MISSING)
+        self.assertEqual(cache.stats().expirations, 1)
+
+    def test_caches_none(self):
+        cache = LRUCache()
+        cache.put('a', None)
+        self.assertIsNone(cache.get('a'))
+
+    def test_stale_put_is_dropped(self):
+        cache = LRUCache()
+        version = cache.version
+        cache.invalidate(['a'])
+        cache.put('a', 'stale', version=version)
+        self.assertIs(cache.get('a'), MISSING)
+
+    def test_thread_safety(self):
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(2000):
+                cache.put((offset, i % 80), i)
+                cache.get((offset, i % 70))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(stats.hits + stats.misses, 8000)
+
+class TestCachedDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'),
+                                  cache_size=100)
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_read_through(self):
+        self.db.add_book(make_book("ISBN-1"))
+        first = self.db.get_book_by_isbn("ISBN-1")
+        self.assertIs(self.db.get_book_by_isbn("ISBN-1"), first)
+        stats = self.db.cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_negative_entry_invalidated_by_add_book(self):
+        self.assertIsNone(self.db.get_book_by_isbn("ISBN-1"))
+        self.assertIsNone(self.db.get_book_by_isbn("ISBN-1"))
+        self.assertEqual(self.db.cache.stats().hits, 1)
+        self.db.add_book(make_book("ISBN-1"))
+        self.assertIsNotNone(self.db.get_book_by_isbn("ISBN-1"))
+
+    def test_invalidated_by_add_books(self):
+        self.assertIsNone(self.db.get_book_by_isbn("ISBN-2"))
+        self.db.add_books([make_book("ISBN-2")])
+        self.assertIsNotNone(self.db.get_book_by_isbn("ISBN-2"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from models.book import Book
+from utils.catalog_pager import CatalogPager
+from utils.database import BOOK_COLUMNS, SORTABLE_COLUMNS, DatabaseManager
+
+ROWS = 503
+
+def make_book(n):
+    # 제목과 저자가 겹치고 출판일 일부가 비어 있어 id 로 순서가 정해지는 경우를 포함
+    return Book(id=None, title=f"도서 {n % 50:02d}", author=f"저자 {n % 7}", isbn=f"ISBN-{(n * 37) % 1000:04d}",
+                published_date=None if n % 9 == 0 else datetime(2000 + n % 20, 1, 1), quantity=n)
+
+class TestCatalogPager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.db = DatabaseManager(os.path.join(cls.tmpdir.name, 'books.db'), pool_size=1)
+        cls.db.initialize_db()
+        cls.db.add_books(make_book(n) for n in range(ROWS))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.tmpdir.cleanup()
+
+    def expected(self, order_by, descending=False):
+        direction = ' DESC' if descending else ''
+        order = f'id{direction}' if order_by == 'id' else f'{order_by}{direction}, id{direction}'
+        with self.db.get_connection() as conn:
+            return conn.execute(f'SELECT {", ".join(BOOK_COLUMNS)} FROM books ORDER BY {order}').fetchall()
+
+    def test_fetch_page_walks_every_order(self):
+        for order_by in SORTABLE_COLUMNS:
+            for descending in (False, True):
+                rows, after = [], None
+                while True:
+                    page = self.db.fetch_page(order_by, after, 40, descending=descending)
+                    rows += page
+                    if len(page) < 40:
+                        break
+                    after = page[-1][0] if order_by == 'id' else (
+                        page[-1][BOOK_COLUMNS.index(order_by)], page[-1][0])
+                with self.subTest(order_by=order_by, descending=descending):
+                    self.assertEqual(rows, self.expected(order_by, descending))
+
+    def test_key_at_and_count(self):
+        expected = self.expected('author')
+        self.assertEqual(self.db.key_at('author', 10), (expected[10][2], expected[10][0]))
+        self.assertEqual(self.db.key_at('id', 0, descending=True), ROWS)
+        self.assertIsNone(self.db.key_at('author', ROWS))
+        self.assertEqual(self.db.count_books(), ROWS)
+        self.assertEqual(self.db.count_books('author = ?', ("저자 1",)),
+                         sum(1 for row in expected if row[2] == "저자 1"))
+        with self.assertRaises(ValueError):
+            self.db.key_at('id; DROP TABLE books', 0)
+
+    def test_sequential_pages_match_full_order(self):
+        pager = CatalogPager(self.db, page_size=25)
+        for order_by in ('title', 'published_date'):
+            for descending in (False, True):
+                pager.sort(order_by, descending)
+                pages = (ROWS + 24) // 25
+                rows = [row for number in range(pages) for row in pager.page(number)]
+                with self.subTest(order_by=order_by, descending=descending):
+                    self.assertEqual(rows, self.expected(order_by, descending))
+                    self.assertEqual(pager.page(pages), [])
+
+    def test_jump_to_page_without_reading_previous(self):
+        pager = CatalogPager(self.db, page_size=25, order_by='author', descending=True)
+        expected = self.expected('author', descending=True)
+        self.assertEqual(pager.page(13), expected[325:350])
+        # 읽은 페이지의 마지막 행으로 다음 페이지의 시작 키를 알고 있음
+        self.assertIn(14, pager._starts)
+        self.assertEqual(pager.page(14), expected[350:375])
+
+    def test_window_and_missing_pages(self):
+        pager = CatalogPager(self.db, page_size=25)
+        self.assertEqual(pager.missing_pages(40, 20), [1, 2])
+        self.assertEqual(pager.window(40, 20), [None] * 20)
+        pager.page(1)
+        window = pager.window(40, 20)
+        self.assertEqual(window[:10], self.expected('id')[40:50])
+        self.assertEqual(window[10:], [None] * 10)
+        self.assertEqual(pager.missing_pages(40, 20), [2])
+        # 마지막 페이지 뒤는 None
+        pager.page(20)
+        self.assertEqual(pager.window(495, 10)[8:], [None, None])
+
+    def test_prefetch_pages(self):
+        pager = CatalogPager(self.db, page_size=25)
+        self.assertEqual(pager.prefetch_pages(100, 20, ahead=2), [5, 6, 2, 3])
+        pager.page(5)
+        pager.count()
+        self.assertEqual(pager.prefetch_pages(470, 20, ahead=2), [20, 16, 17])
+        self.assertEqual(pager.prefetch_pages(100, 20, ahead=2), [6, 2, 3])
+
+    def test_lru_keeps_recent_pages(self):
+        pager = CatalogPager(self.db, page_size=25, cache_pages=3)
+        for number in range(6):
+            pager.page(number)
+        self.assertEqual(len(pager.cache), 3)
+        self.assertIsNone(pager.cached_page(0))
+        self.assertIsNotNone(pager.cached_page(5))
+
+    def test_sort_and_refresh_invalidate(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DatabaseManager(os.path.join(tmpdir, 'books.db'), pool_size=1) as db:
+                db.initialize_db()
+                db.add_books(make_book(n) for n in range(30))
+                pager = CatalogPager(db, page_size=10)
+                self.assertEqual(pager.count(), 30)
+                first = pager.page(0)
+                generation = pager.generation
+                pager.sort('title', descending=True)
+                self.assertGreater(pager.generation, generation)
+                self.assertIsNone(pager.cached_page(0))
+                self.assertNotEqual(pager.page(0), first)
+                self.assertEqual(pager.count(), 30)
+                db.add_book(Book(id=None, title="새 도서", author="저자", isbn="ISBN-NEW",
+                                 published_date=None, quantity=1))
+                self.assertEqual(pager.count(), 30)
+                pager.refresh()
+                self.assertEqual(pager.count(), 31)
+                with self.assertRaises(ValueError):
+                    pager.sort('quantity')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import unittest
+from tests.factories import make_book
+from utils.connection_pool import PoolClosedError, PoolTimeoutError
+from utils.database import DatabaseManager
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'),
+                                  pool_size=2, pool_timeout=0.2)
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_connection_is_reused(self):
+        with self.db.get_connection() as first:
+            pass
+        with self.db.get_connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(self.db.pool.open_connections, 1)
+
+    def test_add_and_get_book(self):
+        book_id = self.db.add_book(make_book("ISBN-1"))
+        book = self.db.get_book_by_isbn("ISBN-1")
+        self.assertEqual(book.id, book_id)
+
+    def test_uncommitted_transaction_is_rolled_back(self):
+        with self.db.get_connection() as conn:
+            conn.execute("INSERT INTO books (title, author, isbn) VALUES ('a', 'b', 'ISBN-X')")
+        self.assertIsNone(self.db.get_book_by_isbn("ISBN-X"))
+
+    def test_closed_connection_is_replaced(self):
+        with self.db.get_connection() as conn:
+            conn.close()
+        with self.db.get_connection() as conn2:
+            self.assertIsNot(conn, conn2)
+            conn2.execute('SELECT 1')
+
+    def test_pool_is_bounded(self):
+        with self.db.get_connection(), self.db.get_connection():
+            with self.assertRaises(PoolTimeoutError):
+                with self.db.get_connection():
+                    pass
+
+    def test_concurrent_writers(self):
+        # setUp 의 짧은 pool_timeout 은 부하가 있을 때 대기만으로도 넘길 수 있어 따로 만듦
+        db = DatabaseManager(self.db.db_file, pool_size=2, pool_timeout=30)
+        errors = []
+
+        def worker(start):
+            try:
+                for i in range(start, start + 20):
+                    db.add_book(make_book(f"ISBN-{i}"))
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            with db.get_connection() as conn:
+                count = conn.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+            self.assertEqual(count, 80)
+            self.assertLessEqual(db.pool.open_connections, 2)
+        finally:
+            db.close()
+
+    def test_close(self):
+        self.db.close()
+        self.assertEqual(self.db.pool.open_connections, 0)
+        with self.assertRaises(PoolClosedError):
+            with self.db.get_connection():
+                pass
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,289 @@
+import csv
+import io
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from models.book import Book
+from tests.factories import make_book
+from utils.csv_import import import_csv
+from utils.database import BulkInsertError, DatabaseManager
+from utils.serializer import write_csv
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'))
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def count(self):
+        with self.db.get_connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+
+class TestAddBooks(DatabaseTestCase):
+    def test_streams_generator_in_batches(self):
+        books = (make_book(f"ISBN-{i}") for i in range(250))
+        result = self.db.add_books(books, batch_size=100)
+        self.assertEqual((result.total, result.written, result.skipped), (250, 250, 0))
+        self.assertEqual(self.count(), 250)
+
+    def test_accepts_csv_rows(self):
+        data = io.StringIO("title,author,isbn,published_date,quantity\n"
+                           "파이썬,홍길동,ISBN-1,2024-01-01,3\n"
+                           "자바,김철수,ISBN-2,2023-05-05,2\n")
+        result = self.db.add_books(csv.DictReader(data))
+        self.assertEqual(result.written, 2)
+        self.assertEqual(self.db.get_book_by_isbn("ISBN-1").quantity, 3)
+
+    def test_csv_round_trip_with_null_date(self):
+        path = os.path.join(self.tmpdir.name, 'books.csv')
+        write_csv([make_book("ISBN-1"),
+                   Book(None, "자바", "김철수", "ISBN-2", None, 2)], path)
+        self.assertEqual(import_csv(self.db, path).written, 2)
+        self.assertIsNone(self.db.get_book_by_isbn("ISBN-2").published_date)
+        books = list(self.db.iter_books(order_by='published_date'))
+        self.assertEqual([book.isbn for book in books], ["ISBN-2", "ISBN-1"])
+
+    def test_rejects_unreadable_date_at_insert(self):
+        data = io.StringIO("title,author,isbn,published_date,quantity\n"
+                           "파이썬,홍길동,ISBN-1,2024/01/02,3\n")
+        with self.assertRaises(ValueError):
+            self.db.add_books(csv.DictReader(data))
+        self.assertEqual(self.count(), 0)
+
+    def test_skip_conflicts(self):
+        self.db.add_book(make_book("ISBN-1", title="원본"))
+        result = self.db.add_books([make_book("ISBN-1"), make_book("ISBN-2")],
+                                   on_conflict='skip')
+        self.assertEqual((result.written, result.skipped), (1, 1))
+        self.assertEqual(self.db.get_book_by_isbn("ISBN-1").title, "원본")
+
+    def test_replace_conflicts_keeps_id(self):
+        book_id = self.db.add_book(make_book("ISBN-1", title="원본"))
+        self.db.add_books([make_book("ISBN-1", title="개정판", quantity=7)],
+                          on_conflict='replace')
+        book = self.db.get_book_by_isbn("ISBN-1")
+        self.assertEqual((book.id, book.title, book.quantity), (book_id, "개정판", 7))
+
+    def test_fail_rolls_back_only_current_batch(self):
+        self.db.add_book(make_book("ISBN-5"))
+        books = [make_book(f"ISBN-{i}") for i in range(10)]
+        with self.assertRaises(BulkInsertError) as ctx:
+            self.db.add_books(books, batch_size=4)
+        # 0~3 은 커밋, 4~7 배치는 롤백
+        self.assertEqual(ctx.exception.result.written, 4)
+        self.assertEqual(self.count(), 5)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.db.add_books([], on_conflict='merge')
+
+class TestSearchBooks(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db.add_books([
+            Book(None, "Python Programming", "Guido", "ISBN-1", datetime(2020, 1, 1), 1),
+            Book(None, "Fluent Python", "Luciano", "ISBN-2", datetime(2021, 1, 1), 1),
+            Book(None, "Java Basics", "James", "ISBN-3", datetime(2019, 1, 1), 1),
+            Book(None, "파이썬 프로그래밍", "홍길동", "ISBN-4", datetime(2022, 1, 1), 1),
+        ])
+
+    def isbns(self, results):
+        return {book.isbn for book in results}
+
+    def test_prefix_match(self):
+        self.assertEqual(self.isbns(self.db.search_books("pyth")), {"ISBN-1", "ISBN-2"})
+        self.assertEqual(self.isbns(self.db.search_books("pyth prog")), {"ISBN-1"})
+        self.assertEqual(self.isbns(self.db.search_books("파이")), {"ISBN-4"})
+
+    def test_matches_author(self):
+        self.assertEqual(self.isbns(self.db.search_books("jam")), {"ISBN-3"})
+
+    def test_limit_offset(self):
+        first = self.db.search_books("python", limit=1)
+        second = self.db.search_books("python", limit=1, offset=1)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(self.isbns(first + second), {"ISBN-1", "ISBN-2"})
+
+    def test_index_follows_updates(self):
+        self.db.add_books([Book(None, "Rust Book", "Steve", "ISBN-1", datetime(2020, 1, 1), 1)],
+                          on_conflict='replace')
+        self.assertEqual(self.isbns(self.db.search_books("python")), {"ISBN-2"})
+        self.assertEqual(self.isbns(self.db.search_books("rust")), {"ISBN-1"})
+
+    def test_empty_or_symbol_query(self):
+        self.assertEqual(self.db.search_books(""), [])
+        self.assertEqual(self.db.search_books('"*'), [])
+
+    def test_existing_rows_are_indexed(self):
+        with self.db.get_connection() as conn:
+            # FTS 도입 이전 스키마를 흉내냄
+            conn.executescript('''
+                DROP TRIGGER books_fts_ai;
+                DROP TRIGGER books_fts_ad;
+                DROP TRIGGER books_fts_au;
+                DROP TABLE books_fts;
+            ''')
+        self.db.initialize_db()
+        self.assertEqual(self.isbns(self.db.search_books("java")), {"ISBN-3"})
+
+class TestIterBooks(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        books = [Book(None, f"책 {i}", f"저자 {i % 3}", f"ISBN-{i}",
+                      datetime(2020, 1, 1 + i % 5) if i % 4 else None, i)
+                 for i in range(23)]
+        self.db.add_books(books)
+
+    def test_iterates_all_rows_in_order(self):
+        ids = [book.id for book in self.db.iter_books(page_size=5)]
+        self.assertEqual(ids, list(range(1, 24)))
+
+    def test_is_lazy(self):
+        books = self.db.iter_books(page_size=5)
+        self.assertEqual(next(books).id, 1)
+
+    def test_order_by_nullable_column(self):
+        books = list(self.db.iter_books(order_by='published_date', page_size=4))
+        self.assertEqual(len(books), 23)
+        self.assertEqual(len({book.id for book in books}), 23)
+        dates = [book.published_date or datetime.min for book in books]
+        self.assertEqual(dates, sorted(dates))
+
+    def test_where(self):
+        books = list(self.db.iter_books(where='author = ?', params=("저자 1",), page_size=2))
+        self.assertEqual([book.quantity for book in books], list(range(1, 23, 3)))
+
+    def test_resume_after_key(self):
+        self.assertEqual([book.id for book in self.db.iter_books(after=20)], [21, 22, 23])
+        books = list(self.db.iter_books(order_by='author', after=("저자 2", 15)))
+        self.assertEqual([book.id for book in books], [18, 21])
+
+    def test_resume_with_book_values(self):
+        books = list(self.db.iter_books(order_by='published_date'))
+        last = books[-3]
+        resumed = self.db.iter_books(order_by='published_date', page_size=2,
+                                     after=(last.published_date, last.id))
+        self.assertEqual([book.id for book in resumed], [book.id for book in books[-2:]])
+
+    def test_resume_inside_null_keys(self):
+        books = list(self.db.iter_books(order_by='published_date'))
+        # 출판일이 빈 도서 6권 중 두 번째 다음부터 NULL 구간과 값이 있는 구간을 이어 읽음
+        self.assertIsNone(books[1].published_date)
+        resumed = self.db.iter_books(order_by='published_date', page_size=3,
+                                     after=(None, books[1].id))
+        self.assertEqual([book.id for book in resumed], [book.id for book in books[2:]])
+
+    def test_raw_rows(self):
+        row = next(self.db.iter_books(raw=True))
+        self.assertEqual(row[:4], (1, "책 0", "저자 0", "ISBN-0"))
+        self.assertIsNone(row[4])
+        self.assertIsInstance(row[6], str)
+
+    def test_rejects_unknown_column(self):
+        with self.assertRaises(ValueError):
+            list(self.db.iter_books(order_by='id; DROP TABLE books'))
+
+    def test_rejects_empty_page(self):
+        for page_size in (0, -1):
+            with self.assertRaises(ValueError):
+                list(self.db.iter_books(page_size=page_size))
+
+class TestGetBooksByIsbns(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db.add_books(make_book(f"ISBN-{i}") for i in range(0, 1200, 2))
+
+    def test_returns_found_books_only(self):
+        result = self.db.get_books_by_isbns(["ISBN-0", "ISBN-1", "ISBN-2", "ISBN-0"])
+        self.assertEqual(set(result), {"ISBN-0", "ISBN-2"})
+        self.assertEqual(result["ISBN-2"].isbn, "ISBN-2")
+
+    def test_chunks_large_input(self):
+        result = self.db.get_books_by_isbns(f"ISBN-{i}" for i in range(1200))
+        self.assertEqual(len(result), 600)
+
+    def test_temp_table_path(self):
+        isbns = [f"ISBN-{i}" for i in range(1200)] + [f"MISSING-{i}" for i in range(20000)]
+        result = self.db.get_books_by_isbns(isbns)
+        self.assertEqual(len(result), 600)
+        # 임시 테이블 내용이 다음 조회에 남지 않음
+        self.assertEqual(len(self.db.get_books_by_isbns(isbns[:10] + isbns[-20000:])), 5)
+
+    def test_uses_cache(self):
+        db = DatabaseManager(self.db.db_file, cache_size=100)
+        self.assertIsNotNone(db.get_book_by_isbn("ISBN-0"))
+        self.assertIsNone(db.get_book_by_isbn("ISBN-1"))
+        result = db.get_books_by_isbns(["ISBN-0", "ISBN-1", "ISBN-2"])
+        self.assertEqual(set(result), {"ISBN-0", "ISBN-2"})
+        self.assertEqual(db.cache.stats().hits, 2)
+
+class TestPragmaProfiles(DatabaseTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'books.db')
+        self.db = DatabaseManager(self.path, pool_size=4, profile='balanced')
+        self.db.initialize_db()
+        self.db.add_book(make_book("ISBN-0"))
+
+    def test_profile_is_applied(self):
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(conn.execute('PRAGMA synchronous').fetchone()[0], 1)
+            self.assertEqual(conn.execute('PRAGMA temp_store').fetchone()[0], 2)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            DatabaseManager(self.path, profile='fastest')
+
+    def test_readers_not_blocked_by_exclusive_writer(self):
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        try:
+            writer.execute('BEGIN EXCLUSIVE')
+            writer.execute("INSERT INTO books (title, author, isbn) VALUES ('a', 'b', 'ISBN-W')")
+            started = time.perf_counter()
+            self.assertIsNotNone(self.db.get_book_by_isbn("ISBN-0"))
+            self.assertIsNone(self.db.get_book_by_isbn("ISBN-W"))
+            self.assertLess(time.perf_counter() - started, 0.5)
+            writer.execute('COMMIT')
+        finally:
+            writer.close()
+        self.assertIsNotNone(self.db.get_book_by_isbn("ISBN-W"))
+
+    def test_concurrent_reads_during_write_burst(self):
+        stop = threading.Event()
+        errors = []
+
+        def write_loop():
+            n = 1
+            try:
+                while not stop.is_set():
+                    self.db.add_books(make_book(f"ISBN-{n + i}") for i in range(50))
+                    n += 50
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write_loop)
+        writer.start()
+        worst = 0.0
+        try:
+            deadline = time.perf_counter() + 0.5
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                self.db.get_book_by_isbn("ISBN-0")
+                worst = max(worst, time.perf_counter() - started)
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(errors, [])
+        self.assertLess(worst, 0.25)
+
+if __name__ == '__main__':
+    unittest.main()
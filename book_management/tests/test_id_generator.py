@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from models.book import Book
+from utils.database import DatabaseManager
+from utils.id_generator import (MAX_SEQUENCE, NODE_BITS, SEQUENCE_BITS, SnowflakeIdGenerator,
+                                format_isbn)
+
+def _generate_in_child(node_id, count, results):
+    results.put(SnowflakeIdGenerator(node_id=node_id).next_ids(count))
+
+class FrozenClock:
+    def __init__(self, ms):
+        self.ms = ms
+
+    def __call__(self):
+        return self.ms * 1_000_000
+
+class TestSnowflakeIdGenerator(unittest.TestCase):
+    def test_million_ids_per_second_without_duplicates(self):
+        generator = SnowflakeIdGenerator(node_id=1)
+        started = time.perf_counter()
+        ids = generator.next_ids(2_000_000)
+        elapsed = time.perf_counter() - started
+        self.assertEqual(len(set(ids)), 2_000_000)
+        self.assertEqual(ids, sorted(ids))
+        self.assertGreater(2_000_000 / elapsed, 1_000_000)
+
+    def test_parts(self):
+        clock = FrozenClock(1704067200000 + 42)
+        book_id = SnowflakeIdGenerator(node_id=7, clock=clock).next_id()
+        self.assertEqual(book_id >> (NODE_BITS + SEQUENCE_BITS), 42)
+        self.assertEqual(book_id >> SEQUENCE_BITS & ((1 << NODE_BITS) - 1), 7)
+        self.assertEqual(book_id & MAX_SEQUENCE, 0)
+
+    def test_sequence_overflow_and_clock_rollback_stay_monotonic(self):
+        clock = FrozenClock(1704067200000 + 1000)
+        generator = SnowflakeIdGenerator(node_id=1, clock=clock)
+        ids = [generator.next_id() for _ in range(MAX_SEQUENCE + 10)]
+        clock.ms -= 500
+        ids += generator.next_ids(10_000)
+        ids.append(generator.next_id())
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_threads_share_generator(self):
+        generator = SnowflakeIdGenerator(node_id=3)
+        results = [[] for _ in range(8)]
+
+        def worker(out):
+            for _ in range(20_000):
+                out.append(generator.next_id())
+            out.extend(generator.next_ids(20_000))
+
+        threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ids = [book_id for out in results for book_id in out]
+        self.assertEqual(len(set(ids)), len(ids))
+        for out in results:
+            self.assertEqual(out, sorted(out))
+
+    def test_processes_with_distinct_nodes(self):
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=_generate_in_child, args=(node, 50_000, results))
+                     for node in (1, 2)]
+        for process in processes:
+            process.start()
+        ids = results.get(timeout=30) + results.get(timeout=30)
+        for process in processes:
+            process.join()
+        self.assertEqual(len(set(ids)), 100_000)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires fork")
+    def test_fork_resets_pid_node(self):
+        generator = SnowflakeIdGenerator()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, str(generator.node_id).encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_node = int(os.read(read_fd, 16))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(child_node, pid & ((1 << NODE_BITS) - 1))
+
+    def test_invalid_node(self):
+        with self.assertRaises(ValueError):
+            SnowflakeIdGenerator(node_id=1 << NODE_BITS)
+
+class TestDatabaseIsbnGenerator(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.generator = SnowflakeIdGenerator(node_id=5)
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'),
+                                  isbn_generator=self.generator)
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_add_book_fills_empty_isbn(self):
+        book = Book(id=None, title="파이썬", author="홍길동", isbn="",
+                    published_date=datetime(2024, 1, 1), quantity=1)
+        self.db.add_book(book)
+        self.assertTrue(book.isbn.startswith("ISBN-"))
+        self.assertEqual(self.db.get_book_by_isbn(book.isbn).title, "파이썬")
+
+    def test_add_books_fills_only_missing_isbns(self):
+        rows = [{'title': f"책 {i}", 'author': "저자", 'isbn': "", 'quantity': 1}
+                for i in range(1000)]
+        rows.append({'title': "고정", 'author': "저자", 'isbn': "ISBN-FIXED", 'quantity': 1})
+        result = self.db.add_books(rows, batch_size=100)
+        self.assertEqual(result.written, 1001)
+        self.assertIsNotNone(self.db.get_book_by_isbn("ISBN-FIXED"))
+        self.assertEqual(sum(1 for _ in self.db.iter_books()), 1001)
+
+    def test_format_isbn(self):
+        self.assertEqual(format_isbn(123), "ISBN-123")
+
+if __name__ == '__main__':
+    unittest.main()
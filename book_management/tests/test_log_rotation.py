@@ -0,0 +1,107 @@
+import gzip
+import logging
+import os
+import tempfile
+import unittest
+from utils.log_rotation import RotatingArchiveHandler
+from utils.logger import setup_logger, shutdown_loggers
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def make_record(message):
+    return logging.makeLogRecord({'msg': message, 'levelno': logging.INFO,
+                                  'levelname': 'INFO'})
+
+class TestRotatingArchiveHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'app.log')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read_all(self, handler):
+        """보관 파일(오래된 것부터)과 현재 파일의 줄을 이어서 반환"""
+        lines = []
+        for archive in handler.compressor.archives():
+            opener = gzip.open if archive.endswith('.gz') else open
+            with opener(archive, 'rt', encoding='utf-8') as f:
+                lines += f.read().splitlines()
+        with open(self.path, encoding='utf-8') as f:
+            lines += f.read().splitlines()
+        return lines
+
+    def test_size_rotation_compresses_archives(self):
+        handler = RotatingArchiveHandler(self.path, max_bytes=1000)
+        for n in range(200):
+            handler.handle(make_record(f"도서 {n:04d}"))
+        handler.compressor.join()
+        archives = handler.compressor.archives()
+        self.assertGreater(len(archives), 1)
+        self.assertTrue(all(path.endswith('.gz') for path in archives))
+        self.assertEqual(self.read_all(handler), [f"도서 {n:04d}" for n in range(200)])
+        handler.close()
+
+    def test_time_rotation(self):
+        clock = FakeClock()
+        handler = RotatingArchiveHandler(self.path, rotate_interval=60, compress=False,
+                                         clock=clock)
+        handler.handle(make_record("첫 번째"))
+        clock.now += 30
+        handler.handle(make_record("두 번째"))
+        self.assertEqual(handler.compressor.archives(), [])
+        clock.now += 31
+        handler.handle(make_record("세 번째"))
+        handler.close()
+        archives = handler.compressor.archives()
+        self.assertEqual(len(archives), 1)
+        self.assertEqual(self.read_all(handler), ["첫 번째", "두 번째", "세 번째"])
+
+    def test_backup_count_keeps_newest(self):
+        handler = RotatingArchiveHandler(self.path, max_bytes=10, backup_count=3)
+        for n in range(10):
+            handler.handle(make_record(f"레코드 {n}"))
+        handler.close()
+        archives = handler.compressor.archives()
+        self.assertEqual(len(archives), 3)
+        # 가장 최근 보관 파일에는 현재 파일 직전의 레코드가 들어 있음
+        with gzip.open(archives[-1], 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "레코드 8\n")
+
+    def test_max_age_removes_old_archives(self):
+        clock = FakeClock()
+        handler = RotatingArchiveHandler(self.path, max_bytes=10, max_age_days=1,
+                                         compress=False, clock=clock)
+        handler.handle(make_record("오래된 레코드"))
+        handler.handle(make_record("다음 레코드"))
+        handler.compressor.join()
+        old_archive, = handler.compressor.archives()
+        os.utime(old_archive, (clock.now - 2 * 86400, clock.now - 2 * 86400))
+        handler.handle(make_record("새 레코드"))
+        handler.close()
+        archives = handler.compressor.archives()
+        self.assertEqual(len(archives), 1)
+        self.assertNotEqual(archives[0], old_archive)
+
+class TestSetupLoggerRotation(unittest.TestCase):
+    def test_setup_logger_with_queue_and_rotation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'app.log')
+            logger = setup_logger('test.rotation', path, max_bytes=2000, backup_count=2)
+            logger.propagate = False
+            for n in range(500):
+                logger.info("도서 추가됨: %d", n)
+            shutdown_loggers()
+            names = sorted(os.listdir(tmpdir))
+            self.assertEqual(len(names), 3)
+            self.assertEqual(sum(name.endswith('.gz') for name in names), 2)
+            with open(path, encoding='utf-8') as f:
+                self.assertTrue(f.read().rstrip().endswith("도서 추가됨: 499"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import logging
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from utils import log_queue
+from utils.log_queue import BoundedQueueHandler
+from utils import logger as logger_module
+from utils.logger import DEFAULT_LOGGER_NAME, get_logger, setup_logger, shutdown_loggers
+
+class BlockingHandler(logging.Handler):
+    """release 될 때까지 emit 이 멈추는 핸들러 (느린 디스크 흉내)"""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.unblock.wait()
+        self.records.append(self.format(record))
+
+class TestQueueLogging(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'app.log')
+
+    def tearDown(self):
+        shutdown_loggers()
+        self.tmpdir.cleanup()
+
+    def make_logger(self, name, **kwargs):
+        logger = setup_logger(name, self.path, **kwargs)
+        logger.propagate = False
+        self.addCleanup(lambda: [logger.removeHandler(h) for h in list(logger.handlers)])
+        return logger
+
+    def read_log(self):
+        with open(self.path, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def test_flush_on_shutdown(self):
+        logger = self.make_logger('test.flush')
+        for n in range(1000):
+            logger.info("도서 %d", n)
+        shutdown_loggers()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 1000)
+        self.assertTrue(lines[-1].endswith("INFO [test.flush] 도서 999"))
+
+    def test_args_are_merged_on_caller_thread(self):
+        logger = self.make_logger('test.args')
+        values = ["처음"]
+        logger.info("값: %s", values)
+        values.append("나중")
+        shutdown_loggers()
+        self.assertTrue(self.read_log()[0].endswith("값: ['처음']"))
+
+    def test_exception_is_formatted(self):
+        logger = self.make_logger('test.exc')
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            logger.exception("실패")
+        shutdown_loggers()
+        self.assertIn("ValueError: 잘못된 값", "\n".join(self.read_log()))
+
+    def test_drop_policy_never_blocks(self):
+        handler = BoundedQueueHandler(queue.Queue(10), overflow='drop')
+        for n in range(25):
+            handler.handle(logging.makeLogRecord({'msg': f"레코드 {n}"}))
+        self.assertEqual(handler.queue.qsize(), 10)
+        self.assertEqual(handler.dropped, 15)
+
+    def test_block_policy_waits_for_room(self):
+        handler = BoundedQueueHandler(queue.Queue(1), overflow='block', block_timeout=0.01)
+        handler.handle(logging.makeLogRecord({'msg': "첫째"}))
+        handler.handle(logging.makeLogRecord({'msg': "둘째"}))
+        self.assertEqual(handler.dropped, 1)
+
+        handler = BoundedQueueHandler(queue.Queue(1), overflow='block')
+        handler.handle(logging.makeLogRecord({'msg': "첫째"}))
+        consumer = threading.Timer(0.05, handler.queue.get)
+        consumer.start()
+        handler.handle(logging.makeLogRecord({'msg': "둘째"}))
+        consumer.join()
+        self.assertEqual(handler.dropped, 0)
+
+    def test_dropped_count_written_at_shutdown(self):
+        logger = self.make_logger('test.dropped', queue_size=5)
+        slow = BlockingHandler()
+        slow.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        for name, queue_handler, listener, handler in log_queue._listeners:
+            if queue_handler in logger.handlers:
+                listener.handlers = (slow,)
+        for n in range(100):
+            logger.info("레코드 %d", n)
+        slow.unblock.set()
+        shutdown_loggers()
+        self.assertLess(len(slow.records), 100)
+        self.assertRegex(self.read_log()[-1], r"WARNING .* records dropped")
+
+    def test_synchronous_mode(self):
+        logger = self.make_logger('test.sync', queue_size=0)
+        logger.info("바로 기록")
+        for handler in logger.handlers:
+            handler.flush()
+        self.assertEqual(len(self.read_log()), 1)
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(queue.Queue(1), overflow='wait')
+
+class TestLazyLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'app.log')
+
+    def tearDown(self):
+        shutdown_loggers()
+        self.tmpdir.cleanup()
+
+    def test_setup_is_idempotent(self):
+        logger = setup_logger('test.idempotent', self.path, queue_size=0)
+        setup_logger('test.idempotent', self.path, queue_size=0)
+        self.assertEqual(len(logger.handlers), 1)
+        # 설정이 바뀌면 기존 핸들러를 교체
+        setup_logger('test.idempotent', self.path, queue_size=10)
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], BoundedQueueHandler)
+        setup_logger('test.idempotent', self.path, queue_size=0)
+        self.assertEqual(len(logger.handlers), 1)
+        logger.removeHandler(logger.handlers[0])
+
+    def test_file_is_opened_on_first_record(self):
+        logger = setup_logger('test.delay', self.path, queue_size=0)
+        self.assertFalse(os.path.exists(self.path))
+        logger.warning("처음")
+        self.assertTrue(os.path.exists(self.path))
+        logger.handlers[0].close()
+        logger.removeHandler(logger.handlers[0])
+
+    def test_get_logger_reads_environment(self):
+        env = {'BOOK_MANAGEMENT_LOG_FILE': self.path, 'BOOK_MANAGEMENT_LOG_LEVEL': 'warning',
+               'BOOK_MANAGEMENT_LOG_QUEUE_SIZE': '100'}
+        saved = logger_module._configured.pop(DEFAULT_LOGGER_NAME, None)
+        try:
+            with mock.patch.dict(os.environ, env):
+                logger = get_logger()
+                self.assertIs(get_logger(), logger)
+                self.assertIs(logger_module.logger, logger)
+                self.assertEqual(logger.level, logging.WARNING)
+                logger.info("무시됨")
+                logger.warning("기록됨")
+                shutdown_loggers()
+            with open(self.path, encoding='utf-8') as f:
+                self.assertEqual(len(f.read().splitlines()), 1)
+        finally:
+            logger_module._configured.pop(DEFAULT_LOGGER_NAME, None)
+            if saved is not None:
+                logger_module._configured[DEFAULT_LOGGER_NAME] = saved
+
+    def test_import_has_no_side_effects(self):
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys, utils.logger; "
+                "print('logging.handlers' in sys.modules, "
+                "len(__import__('logging').getLogger('book_management').handlers))")
+        output = subprocess.run([sys.executable, '-c', code], cwd=self.tmpdir.name,
+                                env={**os.environ, 'PYTHONPATH': package_dir},
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', '0'])
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from utils.database import HOT_QUERIES, DatabaseManager, QueryPlanError
+
+class TestQueryPlans(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'))
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_hot_queries_use_indexes(self):
+        self.db.check_query_plans()
+
+    def test_explain(self):
+        plan = self.db.explain('SELECT * FROM books WHERE author = ?', ('홍길동',))
+        self.assertEqual(len(plan), 1)
+        self.assertIn('idx_books_author', plan[0])
+
+    def test_scan_is_reported(self):
+        queries = {'by_quantity': ('SELECT * FROM books WHERE quantity = ?', (1,))}
+        with self.assertRaises(QueryPlanError) as ctx:
+            self.db.check_query_plans(queries)
+        self.assertIn('by_quantity: SCAN books', str(ctx.exception))
+
+    def test_missing_index_is_reported(self):
+        with self.db.get_connection() as conn:
+            conn.execute('DROP INDEX idx_books_created_at')
+        with self.assertRaises(QueryPlanError) as ctx:
+            self.db.check_query_plans()
+        self.assertIn('iter_books(created_at)', str(ctx.exception))
+
+    def test_registry_covers_builtin_queries(self):
+        self.assertIn('get_book_by_isbn', HOT_QUERIES)
+        self.assertIn('search_books', HOT_QUERIES)
+        self.assertIn('fetch_page(title desc)', HOT_QUERIES)
+        self.assertIn('fetch_page(published_date, null)', HOT_QUERIES)
+        self.assertIn('fetch_page(published_date, not null)', HOT_QUERIES)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+from tests.factories import make_book
+from utils.database import DatabaseManager
+from utils.replica import HotReplicaDatabaseManager
+
+class TestHotReplica(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'books.db')
+        seed = DatabaseManager(self.path)
+        seed.initialize_db()
+        seed.add_books(make_book(f"ISBN-{i}") for i in range(10))
+        self.other_process = seed
+        self.replica = HotReplicaDatabaseManager(self.path)
+        self.replica.initialize_db()
+
+    def tearDown(self):
+        self.replica.close()
+        self.tmpdir.cleanup()
+
+    def test_loads_existing_rows(self):
+        self.assertEqual(self.replica.watermark, 10)
+        self.assertEqual(self.replica.get_book_by_isbn("ISBN-3").id, 4)
+        self.assertEqual(len(self.replica.search_books("파이썬", limit=50)), 10)
+
+    def test_reads_do_not_touch_disk(self):
+        self.replica.disk.close()
+        self.assertIsNotNone(self.replica.get_book_by_isbn("ISBN-3"))
+        self.assertEqual(len(list(self.replica.iter_books())), 10)
+
+    def test_writes_go_to_both(self):
+        book_id = self.replica.add_book(make_book("ISBN-NEW"))
+        self.assertEqual(self.replica.get_book_by_isbn("ISBN-NEW").id, book_id)
+        self.assertEqual(self.other_process.get_book_by_isbn("ISBN-NEW").id, book_id)
+        self.assertEqual(len(self.replica.search_books("파이썬", limit=50)), 11)
+
+    def test_sync_picks_up_external_writes(self):
+        self.other_process.add_books(make_book(f"EXT-{i}") for i in range(5))
+        self.assertIsNone(self.replica.get_book_by_isbn("EXT-0"))
+        self.assertEqual(self.replica.sync(), 5)
+        self.assertIsNotNone(self.replica.get_book_by_isbn("EXT-0"))
+        self.assertEqual(self.replica.sync(), 0)
+
+    def test_replace_refreshes_existing_rows(self):
+        self.replica.add_books([make_book("ISBN-1", title="개정판", quantity=9)],
+                               on_conflict='replace')
+        book = self.replica.get_book_by_isbn("ISBN-1")
+        self.assertEqual((book.id, book.title, book.quantity), (2, "개정판", 9))
+        self.assertEqual([b.isbn for b in self.replica.search_books("개정")], ["ISBN-1"])
+
+    def test_read_options_apply_to_memory(self):
+        replica = HotReplicaDatabaseManager(self.path, cache_size=100, isbn_filter_capacity=1000)
+        replica.initialize_db()
+        try:
+            self.assertIsNone(replica.disk.cache)
+            self.assertIsNotNone(replica.get_book_by_isbn("ISBN-3"))
+            self.assertIsNotNone(replica.get_book_by_isbn("ISBN-3"))
+            self.assertIsNone(replica.get_book_by_isbn("MISSING"))
+            stats = replica.memory.cache.stats()
+            self.assertEqual((stats.hits, stats.misses), (1, 1))
+            self.assertTrue(replica.memory.isbn_filter.might_contain("ISBN-3"))
+            replica.add_book(make_book("ISBN-NEW"))
+            self.assertIsNotNone(replica.get_book_by_isbn("ISBN-NEW"))
+        finally:
+            replica.close()
+
+    def test_rejects_filter_file(self):
+        with self.assertRaises(ValueError):
+            HotReplicaDatabaseManager(self.path,
+                                      isbn_filter_file=os.path.join(self.tmpdir.name, 'filter'))
+
+    def test_periodic_sync(self):
+        replica = HotReplicaDatabaseManager(self.path, sync_interval=0.01)
+        replica.initialize_db()
+        try:
+            self.other_process.add_book(make_book("EXT-1"))
+            deadline = time.monotonic() + 5
+            while replica.get_book_by_isbn("EXT-1") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(replica.get_book_by_isbn("EXT-1"))
+        finally:
+            replica.close()
+
+    def test_periodic_sync_survives_errors(self):
+        replica = HotReplicaDatabaseManager(self.path, sync_interval=0.01)
+        replica.initialize_db()
+        iter_books = replica.disk.iter_books
+        failures = []
+
+        def flaky_iter_books(*args, **kwargs):
+            if not failures:
+                failures.append(1)
+                raise sqlite3.OperationalError("database is locked")
+            return iter_books(*args, **kwargs)
+
+        try:
+            with mock.patch('utils.replica.get_logger') as get_logger, \
+                    mock.patch.object(replica.disk, 'iter_books', flaky_iter_books):
+                self.other_process.add_book(make_book("EXT-1"))
+                deadline = time.monotonic() + 5
+                while replica.get_book_by_isbn("EXT-1") is None and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertIsNotNone(replica.get_book_by_isbn("EXT-1"))
+                get_logger.return_value.error.assert_called_once()
+            self.assertIsNone(replica.last_sync_error)
+        finally:
+            replica.close()
+
+    def test_memory_connection_is_never_replaced(self):
+        with self.replica.memory.get_connection() as first:
+            pass
+        self.replica.sync()
+        with self.replica.memory.get_connection() as second:
+            self.assertIs(first, second)
+
+    def test_memory_usage(self):
+        self.assertGreater(self.replica.memory_usage(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import sqlite3
+import unittest
+from datetime import datetime
+from utils.row_decoder import BookRowFactory, make_book_decoder, parse_datetime
+
+class TestRowDecoder(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute('''
+            CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, author TEXT, isbn TEXT,
+                                published_date DATE, quantity INTEGER,
+                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)
+        ''')
+        self.conn.execute("INSERT INTO books VALUES (1, '파이썬', '홍길동', 'ISBN-1', "
+                          "'2024-03-01', 5, '2024-03-02 10:20:30')")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_row_factory_maps_columns_by_name(self):
+        cursor = self.conn.cursor()
+        cursor.row_factory = BookRowFactory()
+        cursor.execute('SELECT quantity, isbn, created_at, id, author, title, published_date FROM books')
+        book = cursor.fetchone()
+        self.assertEqual((book.id, book.isbn, book.quantity), (1, 'ISBN-1', 5))
+        self.assertEqual(book.published_date, datetime(2024, 3, 1))
+        self.assertEqual(book.created_at, datetime(2024, 3, 2, 10, 20, 30))
+        self.assertEqual(book.to_dict()['created_at'], '2024-03-02 10:20:30')
+
+    def test_null_dates(self):
+        self.conn.execute("UPDATE books SET published_date = NULL")
+        cursor = self.conn.cursor()
+        cursor.row_factory = BookRowFactory()
+        self.assertIsNone(cursor.execute('SELECT * FROM books').fetchone().published_date)
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            make_book_decoder(['id', 'title'])
+
+    def test_parser_is_cached(self):
+        self.assertIs(parse_datetime('2024-01-01'), parse_datetime('2024-01-01'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from models.book import Book
+from utils.database import DatabaseManager
+from utils.serializer import iter_jsonl, write_csv, write_jsonl
+
+def make_book(n, book_id=None):
+    return Book(id=book_id, title=f"파이썬 \"{n}\"\n", author="홍길동", isbn=f"ISBN-{n}",
+                published_date=datetime(2024, 1, n % 28 + 1, 15, 30),
+                quantity=n, created_at=datetime(2024, 2, 1, 9, 5, n % 60, 123456))
+
+class TestSerializer(unittest.TestCase):
+    def setUp(self):
+        self.books = [make_book(n, book_id=n if n % 2 else None) for n in range(1, 100)]
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_to_dict_formats(self):
+        book_dict = self.books[0].to_dict()
+        self.assertEqual(book_dict['published_date'], "2024-01-02")
+        self.assertEqual(book_dict['created_at'], "2024-02-01 09:05:01")
+
+    def test_jsonl_lines_match_json_dumps(self):
+        for ensure_ascii in (True, False):
+            lines = list(iter_jsonl(self.books, ensure_ascii=ensure_ascii))
+            expected = [json.dumps(book.to_dict(), ensure_ascii=ensure_ascii) + '\n'
+                        for book in self.books]
+            self.assertEqual(lines, expected)
+
+    def test_equal_aware_datetimes_in_different_zones(self):
+        utc = datetime(2024, 1, 1, 23, 30, tzinfo=timezone.utc)
+        seoul = utc.astimezone(timezone(timedelta(hours=9)))
+        books = [Book(id=n, title="t", author="a", isbn=f"ISBN-{n}", published_date=value,
+                      quantity=1, created_at=value) for n, value in enumerate((utc, seoul, utc))]
+        records = [json.loads(line) for line in iter_jsonl(books)]
+        self.assertEqual([record['published_date'] for record in records],
+                         ["2024-01-01", "2024-01-02", "2024-01-01"])
+        self.assertEqual([record['created_at'] for record in records],
+                         ["2024-01-01 23:30:00", "2024-01-02 08:30:00",
+                          "2024-01-01 23:30:00"])
+
+    def test_plain_date_published(self):
+        book = Book(1, "t", "a", "ISBN-1", date(2024, 1, 2), 1, datetime(2024, 1, 2, 3, 4, 5))
+        self.assertEqual(json.loads(next(iter_jsonl([book])))['published_date'], "2024-01-02")
+        out = io.StringIO()
+        write_csv([book], out)
+        self.assertIn("ISBN-1,2024-01-02,1,2024-01-02 03:04:05", out.getvalue())
+
+    def test_write_jsonl_gzip(self):
+        path = os.path.join(self.tmpdir.name, 'books.jsonl.gz')
+        self.assertEqual(write_jsonl(self.books, path, compress=True), 99)
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records, [book.to_dict() for book in self.books])
+
+    def test_write_to_file_object(self):
+        buffer = io.StringIO()
+        write_jsonl(self.books[:3], buffer)
+        self.assertEqual(len(buffer.getvalue().splitlines()), 3)
+
+    def test_csv_can_be_imported(self):
+        path = os.path.join(self.tmpdir.name, 'books.csv')
+        self.assertEqual(write_csv(self.books, path), 99)
+        with DatabaseManager(':memory:', pool_size=1) as db:
+            db.initialize_db()
+            with open(path, newline='', encoding='utf-8') as f:
+                result = db.add_books(csv.DictReader(f))
+            self.assertEqual(result.written, 99)
+            book = db.get_book_by_isbn("ISBN-5")
+        self.assertEqual(book.title, self.books[4].title)
+        self.assertEqual(book.published_date, datetime(2024, 1, 6))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from models.book import Book
+from utils.database import BulkInsertError, DatabaseManager
+from utils.sharding import ShardedDatabaseManager, rebalance_shards, shard_index
+
+def make_book(i, title=None):
+    return Book(id=None, title=title or f"파이썬 {i}", author=f"저자 {i % 5}",
+                isbn=f"ISBN-{i}", published_date=datetime(2020, 1, 1 + i % 28), quantity=i)
+
+class TestShardedDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.files = [os.path.join(self.tmpdir.name, f'books-{i}.db') for i in range(3)]
+        self.db = ShardedDatabaseManager(self.files)
+        self.db.initialize_db()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def shard_counts(self, files):
+        counts = []
+        for db_file in files:
+            with DatabaseManager(db_file).get_connection() as conn:
+                counts.append(conn.execute('SELECT COUNT(*) FROM books').fetchone()[0])
+        return counts
+
+    def test_routes_by_isbn(self):
+        self.db.add_book(make_book(1))
+        counts = self.shard_counts(self.files)
+        self.assertEqual(counts[shard_index("ISBN-1", 3)], 1)
+        self.assertEqual(sum(counts), 1)
+        self.assertEqual(self.db.get_book_by_isbn("ISBN-1").quantity, 1)
+
+    def test_add_books_spreads_across_shards(self):
+        result = self.db.add_books((make_book(i) for i in range(300)), batch_size=40)
+        self.assertEqual(result.written, 300)
+        counts = self.shard_counts(self.files)
+        self.assertEqual(sum(counts), 300)
+        self.assertTrue(all(count > 50 for count in counts))
+
+    def test_add_books_conflict(self):
+        self.db.add_book(make_book(5))
+        with self.assertRaises(BulkInsertError) as ctx:
+            self.db.add_books(make_book(i) for i in range(10))
+        # 충돌이 난 샤드의 배치만 롤백되고 다른 샤드의 배치는 커밋됨
+        failed_shard = shard_index("ISBN-5", 3)
+        others = sum(1 for i in range(10) if shard_index(f"ISBN-{i}", 3) != failed_shard)
+        self.assertEqual(ctx.exception.result.written, others)
+        result = self.db.add_books((make_book(i) for i in range(10)), on_conflict='skip')
+        self.assertEqual(result.written, 10 - others - 1)
+        self.assertEqual(sum(self.shard_counts(self.files)), 10)
+
+    def test_get_books_by_isbns(self):
+        self.db.add_books(make_book(i) for i in range(50))
+        found = self.db.get_books_by_isbns([f"ISBN-{i}" for i in range(40, 60)])
+        self.assertEqual(set(found), {f"ISBN-{i}" for i in range(40, 50)})
+
+    def test_search_merges_shards(self):
+        self.db.add_books(make_book(i) for i in range(30))
+        self.db.add_book(make_book(100, title="Fluent Python"))
+        self.db.add_book(make_book(101, title="Python Cookbook"))
+        results = self.db.search_books("pyth")
+        self.assertEqual({book.isbn for book in results}, {"ISBN-100", "ISBN-101"})
+        ranks = [rank for rank, _ in self.db.search_books_ranked("파이", limit=10)]
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(self.db.search_books("파이", limit=10, offset=25)), 5)
+
+    def test_iter_books_merges_in_order(self):
+        self.db.add_books(make_book(i) for i in range(100))
+        books = list(self.db.iter_books(order_by='author', page_size=7))
+        self.assertEqual(len(books), 100)
+        keys = [(book.author, book.id) for book in books]
+        self.assertEqual(keys, sorted(keys))
+        rows = list(self.db.iter_books(order_by='published_date', raw=True, page_size=7))
+        self.assertEqual([row[4] for row in rows], sorted(row[4] for row in rows))
+
+    def test_writes_to_different_shards_run_concurrently(self):
+        threads = {}
+        original = [shard.add_book for shard in self.db.shards]
+        for shard, add_book in zip(self.db.shards, original):
+            def recording(book, _add_book=add_book, _shard=shard):
+                threads[id(_shard)] = threading.current_thread().name
+                return _add_book(book)
+            shard.add_book = recording
+        for i in range(30):
+            self.db.add_book(make_book(i))
+        self.assertEqual(len(set(threads.values())), 3)
+
+    def test_rebalance(self):
+        self.db.add_books(make_book(i) for i in range(200))
+        self.db.close()
+        new_files = [os.path.join(self.tmpdir.name, f'new-{i}.db') for i in range(5)]
+        self.assertEqual(rebalance_shards(self.files, new_files, batch_size=30), 200)
+        counts = self.shard_counts(new_files)
+        self.assertEqual(sum(counts), 200)
+        self.db = ShardedDatabaseManager(new_files)
+        self.assertEqual(self.db.get_book_by_isbn("ISBN-123").quantity, 123)
+        self.assertEqual(len(self.db.search_books("파이썬", limit=500)), 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+from utils import logger as logger_module
+from utils.logger import DEFAULT_LOGGER_NAME, setup_logger, shutdown_loggers
+from utils.structured_log import Event, EventLog, JsonFormatter, flush_event_logs
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class CountingRepr:
+    """문자열로 바뀐 횟수를 세는 값 (지연 포맷 확인용)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self):
+        self.calls += 1
+        return 'counted'
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger(f'test.structured.{self.id()}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.handler = RecordingHandler()
+        self.logger.addHandler(self.handler)
+
+    def fields(self):
+        return [record.msg.fields for record in self.handler.records]
+
+    def test_logs_event_without_formatting(self):
+        value = CountingRepr()
+        event_log = EventLog('book_added', logger_name=self.logger.name)
+        event_log(book_id=1, title=value)
+        record, = self.handler.records
+        self.assertIsInstance(record.msg, Event)
+        self.assertEqual(record.msg.name, 'book_added')
+        self.assertEqual(value.calls, 0)
+        self.assertEqual(record.getMessage(), "book_added book_id=1 title=counted")
+        # stacklevel 로 EventLog 가 아닌 호출한 위치가 기록됨
+        self.assertEqual(record.funcName, 'test_logs_event_without_formatting')
+
+    def test_disabled_level_is_not_emitted(self):
+        event_log = EventLog('debug_event', level=logging.DEBUG, logger_name=self.logger.name)
+        event_log(n=1)
+        self.assertEqual(self.handler.records, [])
+
+    def test_sampling(self):
+        event_log = EventLog('sampled', logger_name=self.logger.name, sample_every=10)
+        for n in range(1, 31):
+            event_log(n=n)
+        self.assertEqual([fields['n'] for fields in self.fields()], [10, 20, 30])
+        self.assertEqual(self.fields()[1]['suppressed'], 9)
+
+    def test_rate_limit_with_suppressed_summary(self):
+        clock = FakeClock()
+        event_log = EventLog('limited', logger_name=self.logger.name, max_per_second=2,
+                             clock=clock)
+        for n in range(100):
+            event_log(n=n)
+        self.assertEqual([fields['n'] for fields in self.fields()], [0, 1])
+        clock.now += 1
+        event_log(n=100)
+        self.assertEqual(self.fields()[-1], {'n': 100, 'suppressed': 98})
+        for n in range(101, 105):
+            event_log(n=n)
+        flush_event_logs()
+        self.assertEqual(self.fields()[-1], {'suppressed': 3, 'summary': True})
+        # 모든 호출이 기록되었거나 집계됨
+        self.assertEqual(len(self.handler.records) - 1 + 98 + 3, 105)
+
+class TestDefaultLoggerBinding(unittest.TestCase):
+    """기본 로거를 쓰는 EventLog 는 실제로 기록할 때만 로거를 구성"""
+
+    def setUp(self):
+        patcher = mock.patch.dict(logger_module._configured)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        logger_module._configured.pop(DEFAULT_LOGGER_NAME, None)
+
+    def test_disabled_and_sampled_out_events_do_not_configure(self):
+        with mock.patch.dict(os.environ, {'BOOK_MANAGEMENT_LOG_LEVEL': 'INFO'}), \
+                mock.patch('utils.structured_log.get_logger') as get_logger:
+            EventLog('debug_event', level=logging.DEBUG)(n=1)
+            sampled = EventLog('sampled', sample_every=10)
+            for n in range(9):
+                sampled(n=n)
+            get_logger.assert_not_called()
+            sampled(n=9)
+            get_logger.assert_called_once()
+        self.assertNotIn(DEFAULT_LOGGER_NAME, logger_module._configured)
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_event_and_plain_records(self):
+        formatter = JsonFormatter()
+        record = logging.makeLogRecord({'name': 'book_management', 'levelno': logging.INFO,
+                                        'levelname': 'INFO',
+                                        'msg': Event('book_added', {'book_id': 7, 'title': "파이썬"})})
+        entry = json.loads(formatter.format(record))
+        self.assertEqual(list(entry), ['ts', 'level', 'logger', 'event', 'fields'])
+        self.assertEqual(entry['event'], 'book_added')
+        self.assertEqual(entry['fields'], {'book_id': 7, 'title': "파이썬"})
+        record = logging.makeLogRecord({'levelname': 'ERROR', 'msg': "실패: %s",
+                                        'args': ("디스크",)})
+        entry = json.loads(formatter.format(record))
+        self.assertIsNone(entry['event'])
+        self.assertEqual(entry['message'], "실패: 디스크")
+
+    def test_setup_logger_json_format(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'app.log')
+            logger = setup_logger('test.structured.json', path, log_format='json')
+            logger.propagate = False
+            event_log = EventLog('book_added', logger_name=logger.name)
+            for n in range(3):
+                event_log(book_id=n)
+            shutdown_loggers()
+            with open(path, encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f]
+        self.assertEqual([entry['fields']['book_id'] for entry in entries], [0, 1, 2])
+        self.assertTrue(all(entry['level'] == 'INFO' for entry in entries))
+
+    def test_fields_do_not_overwrite_fixed_keys(self):
+        record = logging.makeLogRecord({'name': 'book_management', 'levelname': 'INFO',
+                                        'msg': Event('spoof', {'ts': 0, 'level': 'DEBUG',
+                                                               'logger': 'other', 'event': 'x'})})
+        entry = json.loads(JsonFormatter().format(record))
+        self.assertEqual((entry['level'], entry['logger'], entry['event']),
+                         ('INFO', 'book_management', 'spoof'))
+        self.assertEqual(entry['fields']['level'], 'DEBUG')
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            setup_logger('test.structured.bad', 'unused.log', log_format='xml')
+
+if __name__ == '__main__':
+    unittest.main()
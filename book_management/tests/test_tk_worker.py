@@ -0,0 +1,181 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from models.book import Book
+from tests.fake_tk import FakeTkRoot
+from utils.async_database import AsyncDatabaseManager
+from utils.csv_import import import_csv
+from utils.database import DatabaseManager
+from utils.serializer import write_csv
+from utils.tk_bridge import AsyncTkBridge, TkResultPump
+from utils.tk_worker import BackgroundJob, JobCancelled, TkWorker
+
+ROWS = 100000
+
+def make_books(count):
+    for n in range(count):
+        yield Book(id=None, title=f"도서 {n}", author=f"저자 {n % 100}", isbn=f"ISBN-{n:08d}",
+                   published_date=datetime(2024, 1, 1), quantity=1)
+
+class Heartbeat:
+    """root.after 로 주기적으로 실행되며 실행 간격을 기록 (이벤트 루프가 멈추지 않는지 확인)"""
+
+    def __init__(self, root, interval_ms=10):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.times = []
+        self.root.after(interval_ms, self.tick)
+
+    def tick(self):
+        self.times.append(time.monotonic())
+        self.root.after(self.interval_ms, self.tick)
+
+    def max_gap(self) -> float:
+        return max(b - a for a, b in zip(self.times, self.times[1:]))
+
+class TestTkWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'), pool_size=1,
+                                  profile='balanced')
+        self.db.initialize_db()
+        self.root = FakeTkRoot()
+        self.pump = TkResultPump(self.root, poll_interval=5)
+        self.worker = TkWorker(self.pump)
+
+    def tearDown(self):
+        self.worker.close()
+        self.pump.stop()
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_callbacks_run_on_tk_thread(self):
+        results, errors = [], []
+        self.worker.submit(lambda x, job: (x * 2, threading.get_ident()), 21,
+                           on_success=lambda value: results.append((value, threading.get_ident())))
+
+        def fail(job):
+            raise ValueError("실패")
+
+        self.worker.submit(fail, on_error=errors.append)
+        self.assertTrue(self.root.run_until(lambda: results and errors))
+        (value, worker_thread), tk_thread = results[0]
+        self.assertEqual(value, 42)
+        self.assertNotEqual(worker_thread, threading.get_ident())
+        self.assertEqual(tk_thread, threading.get_ident())
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_progress_is_coalesced(self):
+        progress, done = [], []
+
+        def report_many(job):
+            for n in range(1, 100001):
+                job.report(n, 100000)
+
+        self.worker.submit(report_many, on_success=done.append, on_progress=lambda *p: progress.append(p))
+        self.assertTrue(self.root.run_until(lambda: done))
+        self.assertTrue(self.root.run_until(lambda: progress and progress[-1] == (100000, 100000)))
+        self.assertLess(len(progress), 1000)
+
+    def test_close_cancels_queued_jobs(self):
+        started = threading.Event()
+        release = threading.Event()
+        cancelled = []
+
+        def blocker(job):
+            started.set()
+            release.wait(5)
+            job.check_cancelled()
+
+        first = self.worker.submit(blocker, on_cancelled=cancelled.append)
+        second = self.worker.submit(lambda job: None, on_cancelled=cancelled.append)
+        self.assertTrue(started.wait(5))
+        self.assertEqual(self.worker.active_jobs, 2)
+        closing = threading.Thread(target=self.worker.close)
+        closing.start()
+        release.set()
+        closing.join(5)
+        self.assertTrue(first.cancelled and second.future.cancelled())
+        self.assertTrue(self.root.run_until(lambda: len(cancelled) == 2))
+
+    def test_import_csv_on_worker_thread(self):
+        # DB 를 혼자 쓰는 도구에서는 csv_import.import_csv 를 작업 스레드에서 바로 실행
+        path = os.path.join(self.tmpdir.name, 'small.csv')
+        write_csv(make_books(1200), path)
+        progress, results = [], []
+        self.worker.submit(import_csv, self.db, path, on_success=results.append,
+                           on_progress=lambda done, total: progress.append(done))
+        self.assertTrue(self.root.run_until(lambda: results))
+        self.assertEqual(results[0].written, 1200)
+        self.assertTrue(progress)
+
+class TestAsyncCsvImport(unittest.TestCase):
+    """GUI 처럼 AsyncDatabaseManager.import_csv 를 AsyncTkBridge 로 실행"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.csv_dir = tempfile.TemporaryDirectory()
+        cls.csv_path = os.path.join(cls.csv_dir.name, 'books.csv')
+        write_csv(make_books(ROWS), cls.csv_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.csv_dir.cleanup()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(os.path.join(self.tmpdir.name, 'books.db'),
+                                       profile='balanced')
+        self.root = FakeTkRoot()
+        self.bridge = AsyncTkBridge(self.root, poll_interval=5)
+        self.bridge.submit(self.db.initialize_db()).result(timeout=10)
+
+    def tearDown(self):
+        self.bridge.close()
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def start_import(self, progress, results, errors):
+        job = BackgroundJob(self.bridge.pump, lambda done, total: progress.append(done / total))
+        self.bridge.submit(self.db.import_csv(self.csv_path, job=job),
+                           on_success=results.append, on_error=errors.append)
+        return job
+
+    def test_event_loop_keeps_running_during_import(self):
+        heartbeat = Heartbeat(self.root)
+        progress, results, errors, counts = [], [], [], []
+        self.start_import(progress, results, errors)
+        # 가져오는 동안에도 다른 DB 호출이 청크 사이에 처리됨
+        self.bridge.submit(self.db.count_books(), on_success=counts.append)
+        began = time.monotonic()
+        self.assertTrue(self.root.run_until(lambda: results or errors, timeout=120))
+        elapsed = time.monotonic() - began
+        self.assertEqual(errors, [])
+        self.assertEqual(results[0].written, ROWS)
+        self.assertTrue(counts and counts[0] < ROWS)
+        book = self.bridge.submit(self.db.get_book_by_isbn(f"ISBN-{ROWS - 1:08d}")).result(timeout=10)
+        self.assertEqual(book.title, f"도서 {ROWS - 1}")
+        # 가져오는 동안 진행률이 여러 번 갱신되고, 타이머가 계속 실행됨
+        self.assertGreater(len(progress), 5)
+        self.assertEqual(progress, sorted(progress))
+        self.assertGreater(len(heartbeat.times), elapsed / 0.1)
+        self.assertLess(heartbeat.max_gap(), 0.25)
+
+    def test_cancel_keeps_committed_chunks(self):
+        progress, results, errors = [], [], []
+        job = self.start_import(progress, results, errors)
+        self.assertTrue(self.root.run_until(lambda: progress))
+        job.cancel()
+        self.assertTrue(self.root.run_until(lambda: results or errors))
+        self.assertIsInstance(errors[0], JobCancelled)
+        partial = errors[0].args[0]
+        self.assertGreater(partial.written, 0)
+        self.assertLess(partial.written, ROWS)
+        count = self.bridge.submit(self.db.count_books()).result(timeout=10)
+        self.assertEqual(count, partial.written)
+
+if __name__ == '__main__':
+    unittest.main()
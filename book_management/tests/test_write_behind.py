@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from tests.factories import make_book
+from utils.database import DatabaseManager
+from utils.write_behind import WriteBehindWriter
+
+class TestWriteBehindWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, 'books.db'), pool_size=2)
+        self.db.initialize_db()
+        self.writer = WriteBehindWriter(self.db, max_batch_size=50, max_latency=0.01)
+
+    def tearDown(self):
+        self.writer.close()
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_future_returns_row_id(self):
+        book_id = self.writer.submit(make_book("ISBN-1")).result(timeout=5)
+        self.assertEqual(self.db.get_book_by_isbn("ISBN-1").id, book_id)
+
+    def test_written_isbn_passes_bloom_filter(self):
+        with DatabaseManager(os.path.join(self.tmpdir.name, 'filtered.db'), pool_size=2,
+                             isbn_filter_capacity=1000) as db:
+            db.initialize_db()
+            with WriteBehindWriter(db, max_latency=0.01) as writer:
+                book_id = writer.submit(make_book("ISBN-WB")).result(timeout=5)
+            self.assertEqual(db.get_book_by_isbn("ISBN-WB").id, book_id)
+            self.assertIsNone(db.get_book_by_isbn("ISBN-NONE"))
+
+    def test_concurrent_submitters(self):
+        futures = []
+        lock = threading.Lock()
+
+        def producer(offset):
+            for i in range(offset, offset + 100):
+                future = self.writer.submit(make_book(f"ISBN-{i}"))
+                with lock:
+                    futures.append(future)
+
+        threads = [threading.Thread(target=producer, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ids = [future.result(timeout=5) for future in futures]
+        self.assertEqual(len(set(ids)), 400)
+
+    def test_conflict_fails_only_its_future(self):
+        first = self.writer.submit(make_book("ISBN-1"))
+        duplicate = self.writer.submit(make_book("ISBN-1"))
+        other = self.writer.submit(make_book("ISBN-2"))
+        self.assertIsInstance(first.result(timeout=5), int)
+        with self.assertRaises(sqlite3.IntegrityError):
+            duplicate.result(timeout=5)
+        self.assertIsInstance(other.result(timeout=5), int)
+
+    def test_close_drains_queue(self):
+        futures = [self.writer.submit(make_book(f"ISBN-{i}")) for i in range(120)]
+        self.writer.close()
+        self.assertTrue(all(future.done() for future in futures))
+        with self.assertRaises(RuntimeError):
+            self.writer.submit(make_book("ISBN-X"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import multiprocessing as mp
+import os
+import sqlite3
+import tempfile
+import unittest
+from tests.factories import make_book
+from utils.database import BulkInsertError, DatabaseManager
+from utils.id_generator import SnowflakeIdGenerator
+from utils.writer_service import WriterService, WriterStoppedError
+
+def import_worker(client, offset):
+    for start in range(offset, offset + 100, 20):
+        client.add_books(make_book(f"ISBN-{i}") for i in range(start, start + 20))
+
+class TestWriterService(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'books.db')
+        self.service = WriterService(self.path).start()
+        self.client = self.service.client()
+
+    def tearDown(self):
+        self.service.stop()
+        self.tmpdir.cleanup()
+
+    def count(self):
+        reader = DatabaseManager(self.path, read_only=True)
+        with reader.get_connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+
+    def test_add_book_returns_id(self):
+        book_id = self.client.add_book(make_book("ISBN-1"), timeout=10)
+        reader = DatabaseManager(self.path, read_only=True)
+        self.assertEqual(reader.get_book_by_isbn("ISBN-1").id, book_id)
+
+    def test_failed_request_does_not_affect_others(self):
+        self.client.add_book(make_book("ISBN-1"), timeout=10)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.client.add_book(make_book("ISBN-1"), timeout=10)
+        with self.assertRaises(BulkInsertError):
+            self.client.add_books([make_book("ISBN-2"), make_book("ISBN-1")], timeout=10)
+        result = self.client.add_books([make_book("ISBN-1"), make_book("ISBN-3")],
+                                       on_conflict='skip', timeout=10)
+        self.assertEqual((result.written, result.skipped), (1, 1))
+        self.assertEqual(self.count(), 2)
+
+    def test_multiple_client_processes(self):
+        workers = [mp.Process(target=import_worker, args=(self.service.client(), n * 1000))
+                   for n in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+        self.assertEqual(self.count(), 300)
+
+    def test_client_fills_empty_isbns(self):
+        client = self.service.client(isbn_generator=SnowflakeIdGenerator(node_id=7))
+        book = make_book("")
+        book_id = client.add_book(book, timeout=10)
+        self.assertTrue(book.isbn.startswith("ISBN-"))
+        result = client.add_books([{'title': "책", 'author': "저자", 'isbn': "", 'quantity': 1}],
+                                  timeout=10)
+        self.assertEqual(result.written, 1)
+        reader = DatabaseManager(self.path, read_only=True)
+        self.assertEqual(reader.get_book_by_isbn(book.isbn).id, book_id)
+        self.assertEqual(self.count(), 2)
+
+    def test_attached_reader_sees_written_isbns(self):
+        self.client.add_book(make_book("ISBN-0"), timeout=10)
+        reader = DatabaseManager(self.path, read_only=True, isbn_filter_capacity=1000)
+        reader.load_isbn_filter()
+        self.client.attach(reader)
+        self.client.add_book(make_book("ISBN-1"), timeout=10)
+        self.client.add_books([make_book("ISBN-2")], timeout=10)
+        for isbn in ("ISBN-0", "ISBN-1", "ISBN-2"):
+            self.assertIsNotNone(reader.get_book_by_isbn(isbn))
+        reader.close()
+
+    def test_reader_is_read_only(self):
+        self.client.add_book(make_book("ISBN-1"), timeout=10)
+        reader = DatabaseManager(self.path, read_only=True)
+        with self.assertRaises(sqlite3.OperationalError):
+            reader.add_book(make_book("ISBN-2"))
+
+    def test_startup_error_is_raised(self):
+        service = WriterService(os.path.join(self.tmpdir.name, 'missing', 'books.db'))
+        with self.assertRaises(sqlite3.OperationalError):
+            service.start()
+        with self.assertRaises(RuntimeError):
+            service.client()
+
+    def test_dead_writer_is_reported(self):
+        self.client.add_book(make_book("ISBN-1"), timeout=10)
+        self.service._process.kill()
+        self.service._process.join(10)
+        for timeout in (None, 10):
+            with self.assertRaises(WriterStoppedError):
+                self.client.add_book(make_book("ISBN-2"), timeout=timeout)
+
+    def test_timeout(self):
+        # 응답을 보내지 않는 writer 를 흉내내려고 다른 큐로 요청을 보냄
+        self.client._requests = mp.Queue()
+        with self.assertRaises(TimeoutError):
+            self.client.add_book(make_book("ISBN-1"), timeout=0.3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.book import Book
+from utils.autocomplete import AutocompleteIndex
+from utils.csv_import import read_csv_chunks
+from utils.database import BookLike, BulkInsertResult, DatabaseManager
+from utils.id_generator import SnowflakeIdGenerator
+
+class BlockingDatabase:
+    """작업 스레드에서 AsyncDatabaseManager 의 DB 스레드로 조회를 보내고 결과를 기다리는 동기 창구
+
+    CatalogPager 처럼 동기 인터페이스를 기대하는 코드를 TkWorker 에서 실행할 때 씁니다.
+    조회는 다른 모든 호출과 같은 DB 스레드에서 순서대로 실행됩니다. DB 스레드나
+    이벤트 루프 스레드에서 부르면 안 됩니다.
+    """
+
+    def __init__(self, manager: 'AsyncDatabaseManager'):
+        self._manager = manager
+
+    def count_books(self, where: Optional[str] = None, params: Tuple = ()) -> int:
+        return self._manager._call(self._manager.db.count_books, where, params)
+
+    def fetch_page(self, order_by: str = 'id', after=None, limit: int = 100,
+                   descending: bool = False) -> List[Tuple]:
+        return self._manager._call(self._manager.db.fetch_page, order_by, after, limit,
+                                   descending=descending)
+
+    def key_at(self, order_by: str, position: int, descending: bool = False):
+        return self._manager._call(self._manager.db.key_at, order_by, position, descending)
+
+class AsyncDatabaseManager:
+    """DatabaseManager 를 전용 DB 스레드에서 실행하는 asyncio 래퍼
+
+    모든 호출은 하나의 스레드와 하나의 커넥션에서 순서대로 실행되므로
+    이벤트 루프(또는 Tk 메인 스레드)는 디스크 I/O 나 잠금 대기로 멈추지 않습니다.
+    """
+
+    def __init__(self, db_file: str, profile: Optional[str] = None,
+                 isbn_generator: Optional[SnowflakeIdGenerator] = None, **kwargs):
+        # isbn_generator 는 add_book/add_books/import_csv 에서 비어 있는 isbn 을 채움
+        self.db = DatabaseManager(db_file, pool_size=1, profile=profile,
+                                  isbn_generator=isbn_generator, **kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-db')
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    def _call(self, func, *args, **kwargs):
+        return self._executor.submit(func, *args, **kwargs).result()
+
+    def blocking(self) -> BlockingDatabase:
+        return BlockingDatabase(self)
+
+    async def initialize_db(self):
+        await self._run(self.db.initialize_db)
+
+    async def add_book(self, book: Book) -> int:
+        return await self._run(self.db.add_book, book)
+
+    async def add_books(self, books: Iterable[BookLike], batch_size: int = 10000,
+                        on_conflict: str = 'fail') -> BulkInsertResult:
+        return await self._run(self.db.add_books, books,
+                               batch_size=batch_size, on_conflict=on_conflict)
+
+    async def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
+        return await self._run(self.db.get_book_by_isbn, isbn)
+
+    async def get_books_by_isbns(self, isbns: Iterable[str]) -> Dict[str, Book]:
+        return await self._run(self.db.get_books_by_isbns, isbns)
+
+    async def search_books(self, query: str, limit: int = 20, offset: int = 0) -> List[Book]:
+        return await self._run(self.db.search_books, query, limit, offset)
+
+    async def count_books(self, where: Optional[str] = None, params: Tuple = ()) -> int:
+        return await self._run(self.db.count_books, where, params)
+
+    async def fetch_page(self, order_by: str = 'id', after=None, limit: int = 100,
+                         descending: bool = False) -> List[Tuple]:
+        return await self._run(self.db.fetch_page, order_by, after, limit, descending=descending)
+
+    async def key_at(self, order_by: str, position: int, descending: bool = False):
+        return await self._run(self.db.key_at, order_by, position, descending)
+
+    async def import_csv(self, path: str, job=None, chunk_size: int = 5000,
+                         on_conflict: str = 'skip') -> BulkInsertResult:
+        """CSV(.gz 가능)를 청크마다 DB 스레드에서 읽고 저장
+
+        청크 하나가 DB 스레드의 호출 하나이므로 가져오는 동안에도 청크 사이사이에
+        다른 호출(도서 추가, 목록 조회)이 처리됩니다. job(BackgroundJob)을 주면
+        청크마다 진행률을 보고하고, 취소 요청이 있으면 그때까지의 결과를 담아
+        JobCancelled 를 발생시킵니다 (이미 커밋된 청크는 남음).
+        """
+        chunks = read_csv_chunks(path, chunk_size)
+        result = BulkInsertResult()
+        try:
+            while True:
+                if job is not None:
+                    job.check_cancelled(result)
+                step = await self._run(self._import_chunk, chunks, chunk_size, on_conflict)
+                if step is None:
+                    break
+                written, done, total = step
+                result.total += written.total
+                result.written += written.written
+                if job is not None:
+                    job.report(done, total)
+        finally:
+            await self._run(chunks.close)
+        return result
+
+    def _import_chunk(self, chunks, chunk_size: int, on_conflict: str):
+        chunk, done, total = next(chunks, (None, 0, 0))
+        if chunk is None:
+            return None
+        return self.db.add_books(chunk, batch_size=chunk_size, on_conflict=on_conflict), done, total
+
+    async def build_autocomplete(self) -> AutocompleteIndex:
+        """조회와 정렬 모두 DB 스레드에서 해서 호출한 쪽은 멈추지 않음"""
+        return await self._run(AutocompleteIndex.from_database, self.db)
+
+    def close(self):
+        """진행 중인 작업이 끝나길 기다린 뒤 커넥션과 DB 스레드를 정리"""
+        self._executor.submit(self.db.close).result()
+        self._executor.shutdown(wait=True)
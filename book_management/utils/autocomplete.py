@@ -0,0 +1,93 @@
+import bisect
+import sys
+import threading
+import unicodedata
+from typing import Iterable, List
+from models.book import Book
+
+# 정규화된 키와 화면에 보일 원래 문자열을 한 문자열에 담아 항목당 객체 수를 줄임.
+# '\0' 은 어떤 문자보다 작으므로 정규화된 키 순서가 그대로 유지됨
+_SEPARATOR = '\0'
+
+def normalize(text: str) -> str:
+    """대소문자, 전각/반각, 연속 공백 차이를 없앤 검색용 키"""
+    return ' '.join(unicodedata.normalize('NFKC', text).casefold().split())
+
+class PrefixIndex:
+    """정렬된 리스트와 bisect 로 접두어 검색을 하는 인덱스
+
+    suggest 는 O(log n + limit) 이라 항목 수와 관계없이 빠르며, add 는 리스트
+    중간에 삽입하므로 O(n) 이지만 100만 건에서도 1 ms 안쪽입니다.
+    읽기는 락 없이 하고 쓰기끼리만 락으로 직렬화합니다.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self._entries: List[str] = sorted({self._entry(value) for value in values if value})
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry(value: str) -> str:
+        return f'{normalize(value)}{_SEPARATOR}{value}'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, value: str):
+        if not value:
+            return
+        entry = self._entry(value)
+        with self._lock:
+            index = bisect.bisect_left(self._entries, entry)
+            if index == len(self._entries) or self._entries[index] != entry:
+                self._entries.insert(index, entry)
+
+    def update(self, values: Iterable[str]):
+        """여러 값을 한꺼번에 추가 (많을 때는 다시 정렬하는 편이 빠름)"""
+        new_entries = {self._entry(value) for value in values if value}
+        with self._lock:
+            self._entries = sorted(new_entries.union(self._entries))
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """prefix 로 시작하는 값을 정규화된 키 순서로 최대 limit 개 반환"""
+        key = normalize(prefix)
+        if not key or limit < 1:
+            return []
+        entries = self._entries
+        index = bisect.bisect_left(entries, key)
+        suggestions: List[str] = []
+        last_key = None
+        while index < len(entries) and len(suggestions) < limit:
+            entry = entries[index]
+            if not entry.startswith(key):
+                break
+            normalized, _, value = entry.partition(_SEPARATOR)
+            # 정규화하면 같아지는 값("Python", "python")은 하나만 제안
+            if normalized != last_key:
+                suggestions.append(value)
+                last_key = normalized
+            index += 1
+        return suggestions
+
+    def memory_usage(self) -> int:
+        """리스트와 항목 문자열이 차지하는 대략적인 바이트 수"""
+        entries = self._entries
+        return sys.getsizeof(entries) + sum(map(sys.getsizeof, entries))
+
+class AutocompleteIndex:
+    """도서 제목과 저자의 자동 완성 인덱스"""
+
+    def __init__(self, titles: Iterable[str] = (), authors: Iterable[str] = ()):
+        self.titles = PrefixIndex(titles)
+        self.authors = PrefixIndex(authors)
+
+    @classmethod
+    def from_database(cls, db) -> 'AutocompleteIndex':
+        """DatabaseManager 에 저장된 제목과 저자로 인덱스를 만듦"""
+        return cls(db.distinct_values('title'), db.distinct_values('author'))
+
+    def add_book(self, book: Book):
+        self.titles.add(book.title)
+        self.authors.add(book.author)
+
+    def memory_usage(self) -> int:
+        return self.titles.memory_usage() + self.authors.memory_usage()
@@ -0,0 +1,162 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+# 파일 형식: 매직, 버전, 비트 수, 해시 수, 원소 수, capacity, 오탐률, 워터마크 + 비트 배열
+_MAGIC = b'BKBLOOM'
+_HEADER = struct.Struct('<7sBQIQQdq')
+_FORMAT_VERSION = 1
+# 해시 하나(blake2b 최대 64바이트)를 32비트씩 잘라 쓰므로 해시 함수는 최대 16개
+_MAX_HASHES = 16
+
+@dataclass
+class BloomStats:
+    checks: int = 0
+    # 필터가 '확실히 없음'이라고 해서 DB 조회를 건너뛴 횟수
+    skipped: int = 0
+    # 필터는 '있을 수 있음'이었지만 DB 에 없었던 횟수
+    false_positives: int = 0
+
+    @property
+    def probe_savings(self) -> float:
+        """DB 조회를 건너뛴 비율"""
+        return self.skipped / self.checks if self.checks else 0.0
+
+    @property
+    def measured_false_positive_rate(self) -> float:
+        """실제로 없는 키 가운데 필터를 통과한 비율"""
+        negatives = self.skipped + self.false_positives
+        return self.false_positives / negatives if negatives else 0.0
+
+class BloomFilter:
+    """문자열 키의 존재 여부를 근사하는 Bloom 필터
+
+    '없음'은 확실하고 '있음'은 false_positive_rate 정도의 확률로 틀릴 수 있습니다.
+    capacity 개까지 넣었을 때 설정한 오탐률이 유지되며, 그보다 많이 넣으면 오탐률이
+    올라가므로 estimated_false_positive_rate 로 확인해 다시 만들어야 합니다.
+    삭제는 지원하지 않습니다.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.num_bits = max(8, bits)
+        self.num_hashes = min(_MAX_HASHES, max(1, round(self.num_bits / capacity * math.log(2))))
+        self._digest_size = 4 * self.num_hashes
+        self._unpack = struct.Struct(f'<{self.num_hashes}I').unpack
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        # 저장 시점까지 반영된 books.id (이후 행만 다시 읽어 오도록)
+        self.watermark = 0
+        self.stats = BloomStats()
+        self._lock = threading.Lock()
+
+    def _hashes(self, key: str) -> Tuple[int, ...]:
+        # blake2b 다이제스트 하나를 32비트씩 잘라 k 개의 독립적인 해시로 사용
+        return self._unpack(hashlib.blake2b(key.encode('utf-8'),
+                                            digest_size=self._digest_size).digest())
+
+    def add(self, key: str):
+        self.update((key,))
+
+    def update(self, keys: Iterable[str]):
+        num_bits = self.num_bits
+        with self._lock:
+            bits = self._bits
+            count = 0
+            for key in keys:
+                for value in self._hashes(key):
+                    position = value % num_bits
+                    bits[position >> 3] |= 1 << (position & 7)
+                count += 1
+            self.count += count
+
+    def __contains__(self, key: str) -> bool:
+        # 비트는 켜지기만 하므로 읽기에는 락이 필요 없음
+        bits = self._bits
+        num_bits = self.num_bits
+        for value in self._hashes(key):
+            position = value % num_bits
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def might_contain(self, key: str) -> bool:
+        """key 가 있을 수 있으면 True, 확실히 없으면 False (통계에 반영)"""
+        found = key in self
+        with self._lock:
+            self.stats.checks += 1
+            if not found:
+                self.stats.skipped += 1
+        return found
+
+    def record_false_positive(self, count: int = 1):
+        """might_contain 이 True 였지만 실제로는 없었던 경우 호출"""
+        with self._lock:
+            self.stats.false_positives += count
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """현재 넣은 원소 수로 계산한 이론적 오탐률"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def save(self, path: str):
+        """임시 파일에 쓴 뒤 교체해 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함"""
+        tmp_path = f'{path}.tmp'
+        with self._lock:
+            header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.num_bits, self.num_hashes,
+                                  self.count, self.capacity, self.false_positive_rate,
+                                  self.watermark)
+            data = bytes(self._bits)
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'BloomFilter':
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            data = f.read()
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path} is not a bloom filter file")
+        (magic, version, num_bits, num_hashes, count, capacity,
+         false_positive_rate, watermark) = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _FORMAT_VERSION or len(data) != (num_bits + 7) // 8:
+            raise ValueError(f"{path} is not a bloom filter file")
+        bloom = cls(capacity, false_positive_rate)
+        if (bloom.num_bits, bloom.num_hashes) != (num_bits, num_hashes):
+            raise ValueError(f"{path} was written with different parameters")
+        bloom._bits = bytearray(data)
+        bloom.count = count
+        bloom.watermark = watermark
+        return bloom
+
+def load_or_create(path: Optional[str], capacity: int,
+                   false_positive_rate: float) -> Tuple[BloomFilter, bool]:
+    """path 의 필터를 읽고, 없거나 설정이 다르면 새로 만듦 (필터, 읽었는지 여부)"""
+    if path is not None and os.path.exists(path):
+        try:
+            bloom = BloomFilter.load(path)
+        except (OSError, ValueError):
+            pass
+        else:
+            if (bloom.capacity, bloom.false_positive_rate) == (capacity, false_positive_rate):
+                return bloom, True
+    return BloomFilter(capacity, false_positive_rate), False
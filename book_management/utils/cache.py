@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+# 캐시에 값이 없음을 나타내는 표식 (None 도 캐시할 수 있도록 별도로 둠)
+MISSING = object()
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class LRUCache:
+    """TTL 을 지원하는 스레드 안전 LRU 캐시
+
+    invalidate 할 때마다 version 이 증가합니다. 조회 전에 읽어 둔 version 을
+    put 에 넘기면, 그 사이 무효화가 있었던 경우 오래된 값을 저장하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """값을 반환하고, 없거나 만료되었으면 MISSING 을 반환"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return MISSING
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._data[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, version: Optional[int] = None):
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            expires_at = None if self.ttl is None else self._clock() + self.ttl
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, keys: Iterable[Hashable]):
+        with self._lock:
+            self.version += 1
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    self._stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.version += 1
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
@@ -0,0 +1,138 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+from utils.cache import MISSING, LRUCache
+from utils.database import BOOK_COLUMNS, SORTABLE_COLUMNS
+
+class CatalogPager:
+    """정렬된 도서 목록을 page_size 행 단위 페이지로 읽는 가상 목록의 데이터 소스
+
+    페이지는 DatabaseManager.fetch_page 로 키셋 페이지네이션해서 읽고 최근
+    cache_pages 개를 LRU 로 보관합니다. 페이지 n 의 시작 키는 앞 페이지의 마지막
+    행에서 얻으므로 차례로 스크롤할 때는 목록 크기와 관계없이 비용이 같고, 멀리
+    건너뛸 때만 key_at 으로 시작 키를 한 번 찾습니다.
+    page 는 DB 를 조회하므로 작업 스레드에서, window 와 missing_pages 는 캐시만
+    보므로 Tk 메인 스레드에서 호출합니다. 정렬을 바꾸거나 refresh 하면
+    generation 이 올라가고, 그 전에 시작된 조회 결과는 버려집니다.
+    """
+
+    def __init__(self, db, page_size: int = 100, cache_pages: int = 64,
+                 order_by: str = 'id', descending: bool = False):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.db = db
+        self.page_size = page_size
+        self.cache = LRUCache(cache_pages)
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None
+        # 페이지 번호 -> 그 페이지를 읽을 after 키 (앞 페이지의 마지막 행)
+        self._starts: Dict[int, object] = {}
+        self.order_by = 'id'
+        self.descending = False
+        self.sort(order_by, descending)
+
+    def sort(self, order_by: str, descending: bool = False):
+        if order_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"cannot sort by {order_by!r}")
+        with self._lock:
+            self.order_by = order_by
+            self.descending = descending
+            self._reset()
+
+    def refresh(self):
+        """도서가 추가/삭제된 뒤 캐시와 전체 행 수를 다시 읽도록 함"""
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self.generation += 1
+        self._count = None
+        self._starts = {}
+        self.cache.clear()
+
+    def _key_of(self, row: Tuple):
+        if self.order_by == 'id':
+            return row[0]
+        return (row[BOOK_COLUMNS.index(self.order_by)], row[0])
+
+    def count(self) -> int:
+        """전체 행 수 (한 번 센 뒤에는 refresh 전까지 캐시)"""
+        count = self._count
+        if count is None:
+            generation = self.generation
+            count = self.db.count_books()
+            with self._lock:
+                if generation == self.generation:
+                    self._count = count
+        return count
+
+    def page(self, number: int) -> List[Tuple]:
+        """number 번째 페이지의 행 (BOOK_COLUMNS 순서 튜플)"""
+        generation = self.generation
+        key = (generation, number)
+        rows = self.cache.get(key)
+        if rows is not MISSING:
+            return rows
+        order_by, descending = self.order_by, self.descending
+        if number == 0:
+            after = None
+        else:
+            after = self._starts.get(number, MISSING)
+            if after is MISSING:
+                previous = self.cache.get((generation, number - 1))
+                if previous is not MISSING and len(previous) == self.page_size:
+                    after = self._key_of(previous[-1])
+                else:
+                    after = self.db.key_at(order_by, number * self.page_size - 1, descending)
+                    if after is None:
+                        return []
+        rows = self.db.fetch_page(order_by, after, self.page_size, descending=descending)
+        with self._lock:
+            if generation == self.generation:
+                self.cache.put(key, rows)
+                if len(rows) == self.page_size:
+                    self._starts[number + 1] = self._key_of(rows[-1])
+        return rows
+
+    def page_range(self, start: int, count: int) -> range:
+        """start 행부터 count 행을 덮는 페이지 번호"""
+        if count < 1:
+            return range(0)
+        return range(start // self.page_size, (start + count - 1) // self.page_size + 1)
+
+    def cached_page(self, number: int) -> Optional[List[Tuple]]:
+        rows = self.cache.get((self.generation, number))
+        return None if rows is MISSING else rows
+
+    def missing_pages(self, start: int, count: int) -> List[int]:
+        return [number for number in self.page_range(start, count)
+                if self.cached_page(number) is None]
+
+    def window(self, start: int, count: int) -> List[Optional[Tuple]]:
+        """start 행부터 count 행 (아직 읽지 않은 행은 None)"""
+        rows: List[Optional[Tuple]] = []
+        for number in self.page_range(start, count):
+            page = self.cached_page(number)
+            first = number * self.page_size
+            lo = max(start - first, 0)
+            hi = min(start + count - first, self.page_size)
+            if page is None:
+                rows.extend([None] * (hi - lo))
+            else:
+                rows.extend(page[lo:hi])
+                # 마지막 페이지는 짧을 수 있음
+                rows.extend([None] * (hi - lo - len(page[lo:hi])))
+        return rows
+
+    def prefetch_pages(self, start: int, count: int, ahead: int = 1) -> List[int]:
+        """보이는 범위 앞뒤 ahead 페이지 중 아직 캐시에 없는 페이지 번호"""
+        visible = self.page_range(start, count)
+        if not visible:
+            return []
+        candidates = [*range(visible.stop, visible.stop + ahead),
+                      *range(max(visible.start - ahead, 0), visible.start)]
+        total = self._count
+        if total is not None:
+            last_page = (total - 1) // self.page_size
+            candidates = [number for number in candidates if number <= last_page]
+        return [number for number in candidates if self.cached_page(number) is None]
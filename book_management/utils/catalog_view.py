@@ -0,0 +1,145 @@
+from tkinter import ttk
+from typing import Set, Tuple
+from utils.catalog_pager import CatalogPager
+from utils.database import BOOK_COLUMNS, SORTABLE_COLUMNS
+from utils.tk_worker import TkWorker
+
+# 표시할 컬럼: (컬럼 이름, 제목, 너비)
+CATALOG_COLUMNS = (('id', "ID", 60), ('title', "제목", 240), ('author', "저자", 120),
+                   ('isbn', "ISBN", 170), ('published_date', "출판일", 90),
+                   ('quantity', "수량", 50))
+_COLUMN_INDEXES = [BOOK_COLUMNS.index(name) for name, _, _ in CATALOG_COLUMNS]
+_PLACEHOLDER = ("…",) + ("",) * (len(CATALOG_COLUMNS) - 1)
+
+class CatalogView:
+    """보이는 행만 Treeview 에 두는 가상 도서 목록
+
+    Treeview 에는 화면 높이만큼의 항목만 만들어 두고, 스크롤하면 그 항목들의
+    값만 CatalogPager 캐시의 해당 구간으로 바꿉니다. 스크롤바는 Treeview 가
+    아니라 전체 행 수 기준으로 직접 계산합니다. 캐시에 없는 페이지는 작업
+    스레드에서 읽고 도착하면 다시 그리며, 그 사이에는 '…' 를 보여 줍니다.
+    보이는 구간 앞뒤 페이지는 미리 읽어 둡니다.
+    """
+
+    def __init__(self, parent, pager: CatalogPager, worker: TkWorker, height: int = 20,
+                 prefetch_pages: int = 2):
+        self.pager = pager
+        self.worker = worker
+        self.height = height
+        self.prefetch_ahead = prefetch_pages
+        self.top = 0
+        self.total = 0
+        # 조회 중인 (generation, 페이지 번호)
+        self._pending: Set[Tuple[int, int]] = set()
+
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=[name for name, _, _ in CATALOG_COLUMNS],
+                                 show='headings', height=height, selectmode='browse')
+        for name, heading, width in CATALOG_COLUMNS:
+            self.tree.column(name, width=width, stretch=name == 'title')
+            if name in SORTABLE_COLUMNS:
+                self.tree.heading(name, text=heading, command=lambda n=name: self.sort_by(n))
+            else:
+                self.tree.heading(name, text=heading)
+        self._iids = [self.tree.insert('', 'end', values=()) for _ in range(height)]
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.tree.bind('<MouseWheel>', self.on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll_to(self.top - 3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll_to(self.top + 3))
+        for key, rows in (('<Up>', -1), ('<Down>', 1), ('<Prior>', -height), ('<Next>', height)):
+            self.tree.bind(key, lambda event, rows=rows: self.scroll_to(self.top + rows) or 'break')
+        self.tree.bind('<Home>', lambda event: self.scroll_to(0) or 'break')
+        self.tree.bind('<End>', lambda event: self.scroll_to(self.total) or 'break')
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def reload(self):
+        """전체 행 수를 다시 세고 현재 위치를 다시 그림 (도서 추가/가져오기 후)"""
+        self.pager.refresh()
+        generation = self.pager.generation
+
+        def on_count(total):
+            if generation == self.pager.generation:
+                self.total = total
+                self.scroll_to(self.top)
+
+        self.worker.submit(lambda job: self.pager.count(), on_success=on_count)
+
+    def sort_by(self, column: str):
+        # 같은 컬럼을 다시 누르면 순서를 뒤집음
+        descending = column == self.pager.order_by and not self.pager.descending
+        self.pager.sort(column, descending)
+        for name, heading, _ in CATALOG_COLUMNS:
+            arrow = (" ▼" if descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=heading + arrow)
+        self.top = 0
+        self.reload()
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(value) * self.total))
+        elif action == 'scroll':
+            step = self.height if unit == 'pages' else 1
+            self.scroll_to(self.top + int(value) * step)
+
+    def on_mousewheel(self, event):
+        self.scroll_to(self.top - event.delta // 40 if abs(event.delta) >= 40
+                       else self.top - event.delta)
+
+    def scroll_to(self, top: int):
+        self.top = max(0, min(top, self.total - self.height))
+        self.render()
+
+    def render(self):
+        rows = self.pager.window(self.top, self.height)
+        for index, iid in enumerate(self._iids):
+            if self.top + index >= self.total:
+                self.tree.item(iid, values=())
+            elif rows[index] is None:
+                self.tree.item(iid, values=_PLACEHOLDER)
+            else:
+                row = rows[index]
+                self.tree.item(iid, values=[row[i] if row[i] is not None else ""
+                                            for i in _COLUMN_INDEXES])
+        if self.total > 0:
+            self.scrollbar.set(self.top / self.total,
+                               min(self.top + self.height, self.total) / self.total)
+        else:
+            self.scrollbar.set(0, 1)
+        for number in self.pager.missing_pages(self.top, self.height):
+            self.request_page(number)
+        for number in self.pager.prefetch_pages(self.top, self.height, self.prefetch_ahead):
+            self.request_page(number)
+
+    def request_page(self, number: int):
+        generation = self.pager.generation
+        key = (generation, number)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+
+        def on_loaded(_rows):
+            self._pending.discard(key)
+            # 미리 읽던 페이지가 그 사이 화면에 들어왔을 수도 있으므로 도착 시점에 판단
+            if (generation == self.pager.generation
+                    and number in self.pager.page_range(self.top, self.height)):
+                self.render()
+
+        def load(job):
+            # 빠르게 스크롤하면 요청이 쌓이므로 차례가 왔을 때 더 이상 필요 없는 페이지는 건너뜀
+            if self._is_wanted(number, generation):
+                self.pager.page(number)
+
+        self.worker.submit(load, on_success=on_loaded,
+                           on_error=lambda e: self._pending.discard(key))
+
+    def _is_wanted(self, number: int, generation: int) -> bool:
+        visible = self.pager.page_range(self.top, self.height)
+        return (generation == self.pager.generation
+                and visible.start - self.prefetch_ahead <= number < visible.stop + self.prefetch_ahead)
@@ -0,0 +1,125 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Set
+
+
+class PoolError(Exception):
+    """커넥션 풀 관련 오류"""
+
+
+class PoolClosedError(PoolError):
+    """이미 종료된 풀에서 커넥션을 요청한 경우"""
+
+
+class PoolTimeoutError(PoolError):
+    """제한 시간 안에 커넥션을 얻지 못한 경우"""
+
+
+class ConnectionPool:
+    """체크아웃/체크인 방식으로 재사용되는 SQLite 커넥션 풀
+
+    한 번에 한 스레드만 커넥션을 사용하므로 커넥션은
+    check_same_thread=False 로 생성되어야 합니다.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = 5,
+                 timeout: float = 30.0, health_check: bool = True):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.health_check = health_check
+        # LIFO 로 꺼내서 최근에 사용된(캐시가 따뜻한) 커넥션을 우선 재사용
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._connections: Set[sqlite3.Connection] = set()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def open_connections(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def _create(self) -> sqlite3.Connection:
+        conn = self._connect()
+        with self._lock:
+            self._connections.add(conn)
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            self._connections.discard(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise PoolClosedError("connection pool is closed")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError(
+                f"no connection available within {self.timeout} seconds")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._create()
+            if self.health_check and not self._is_healthy(conn):
+                self._discard(conn)
+                return self._create()
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: sqlite3.Connection, broken: bool = False):
+        try:
+            if broken or self._closed:
+                self._discard(conn)
+                return
+            try:
+                # 커밋되지 않은 트랜잭션은 다음 사용자에게 넘기지 않음
+                # (닫힌 커넥션이면 여기서 오류가 나고 폐기됨)
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """유휴 커넥션을 모두 닫고, 사용 중인 커넥션은 반납 시 닫습니다."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
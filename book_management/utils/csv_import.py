@@ -0,0 +1,44 @@
+import csv
+import gzip
+import io
+import os
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+from utils.database import BulkInsertResult
+
+def read_csv_chunks(path: str, chunk_size: int = 5000) -> Iterator[Tuple[List[Dict[str, str]], int, int]]:
+    """write_csv 형식의 CSV(.gz 가능)를 chunk_size 행씩 (행 목록, 읽은 바이트 수, 파일 크기)로 냄
+
+    읽은 바이트 수는 TextIOWrapper 가 미리 읽어 둔 만큼 앞서 있으므로 진행률용 대략적인 값입니다.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    with open(path, 'rb') as raw:
+        total = os.fstat(raw.fileno()).st_size
+        binary = gzip.GzipFile(fileobj=raw) if path.endswith('.gz') else raw
+        with io.TextIOWrapper(binary, encoding='utf-8', newline='') as f:
+            rows = csv.DictReader(f)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                yield chunk, raw.tell(), total
+
+def import_csv(db, path: str, job=None, chunk_size: int = 5000,
+               on_conflict: str = 'skip') -> BulkInsertResult:
+    """CSV 를 chunk_size 행씩 db.add_books 로 저장 (호출한 스레드에서 실행)
+
+    db 를 혼자 쓰는 스크립트나 도구용입니다. GUI 처럼 DB 스레드를 따로 두는 경우에는
+    AsyncDatabaseManager.import_csv 를 씁니다. job(BackgroundJob)을 주면 청크마다
+    진행률을 보고하고, 취소 요청이 있으면 그때까지의 결과를 담아 JobCancelled 를 발생시킵니다.
+    """
+    result = BulkInsertResult()
+    for chunk, done, total in read_csv_chunks(path, chunk_size):
+        if job is not None:
+            job.check_cancelled(result)
+        written = db.add_books(chunk, batch_size=chunk_size, on_conflict=on_conflict)
+        result.total += written.total
+        result.written += written.written
+        if job is not None:
+            job.report(done, total)
+    return result
@@ -1,21 +1,361 @@
+import logging
+import re
 import sqlite3
+import time
 from contextlib import contextmanager
-from typing import List, Optional
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 from models.book import Book
+from utils.bloom_filter import BloomFilter, load_or_create
+from utils.cache import MISSING, LRUCache
+from utils.connection_pool import ConnectionPool
+from utils.id_generator import SnowflakeIdGenerator
+from utils.row_decoder import BookRowFactory, make_book_decoder
+from utils.structured_log import EventLog
+
+# add_book 과 다른 쓰기 경로(write_behind, writer_service)가 함께 쓰는 INSERT 컬럼과 값 자리
+INSERT_COLUMNS = '(title, author, isbn, published_date, quantity) VALUES (?, ?, ?, ?, ?)'
+
+# 대량 저장 중 배치마다 남기는 이벤트 (초당 5 줄까지, 나머지는 suppressed 로 집계)
+_BATCH_WRITTEN = EventLog('books_batch_written', level=logging.DEBUG, max_per_second=5)
+
+# isbn UNIQUE 충돌 시 처리 방식별 INSERT 문
+BULK_INSERT_SQL = {
+    'fail': f'INSERT INTO books {INSERT_COLUMNS}',
+    'skip': f'INSERT OR IGNORE INTO books {INSERT_COLUMNS}',
+    # REPLACE 는 행을 지우고 다시 넣어 id 가 바뀌므로 UPSERT 로 갱신
+    'replace': f'''INSERT INTO books {INSERT_COLUMNS}
+        ON CONFLICT(isbn) DO UPDATE SET
+            title = excluded.title,
+            author = excluded.author,
+            published_date = excluded.published_date,
+            quantity = excluded.quantity''',
+}
+
+# 커넥션마다 적용하는 성능 프로파일 (journal_mode=WAL 은 파일에 유지됨)
+PRAGMA_PROFILES = {
+    # 커밋마다 fsync, 전원 장애에도 커밋된 트랜잭션 보존
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -16000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000,
+    },
+    # WAL + NORMAL: 체크포인트 때만 fsync, 전원 장애 시 마지막 커밋만 유실 가능
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    # 대량 적재 전용: fsync 를 생략하므로 적재 중 장애 시 다시 적재해야 함
+    'bulk-load': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -256000,
+        'mmap_size': 1024 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 30000,
+    },
+}
+
+# books 의 title/author 를 색인하는 외부 콘텐츠 FTS5 테이블과 동기화 트리거
+_FTS_SCHEMA = '''
+    CREATE VIRTUAL TABLE books_fts USING fts5(
+        title, author,
+        content='books', content_rowid='id',
+        prefix='2 3'
+    );
+    CREATE TRIGGER books_fts_ai AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts (rowid, title, author)
+        VALUES (new.id, new.title, new.author);
+    END;
+    CREATE TRIGGER books_fts_ad AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+    END;
+    CREATE TRIGGER books_fts_au AFTER UPDATE OF title, author ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO books_fts (rowid, title, author)
+        VALUES (new.id, new.title, new.author);
+    END;
+    INSERT INTO books_fts (books_fts) VALUES ('rebuild');
+'''
+
+_TOKEN_RE = re.compile(r'\w+')
+
+def _fts_query(query: str) -> str:
+    """사용자 입력을 단어별 접두어 검색 FTS5 쿼리로 변환 (예: 'pyth pro' -> '"pyth"* "pro"*')"""
+    return ' '.join(f'"{token}"*' for token in _TOKEN_RE.findall(query))
+
+# books 테이블의 컬럼 순서 (Book 필드 순서와 같음)
+BOOK_COLUMNS = ('id', 'title', 'author', 'isbn', 'published_date', 'quantity', 'created_at')
+# datetime 값을 DB 에 저장된 문자열 형식으로 바꿀 때 사용
+_STORAGE_FORMATS = {'published_date': '%Y-%m-%d', 'created_at': '%Y-%m-%d %H:%M:%S'}
+# 인덱스가 있어 fetch_page 로 정렬할 수 있는 컬럼 (isbn 은 UNIQUE 인덱스)
+SORTABLE_COLUMNS = ('id', 'title', 'author', 'isbn', 'published_date', 'created_at')
+# NULL 이 들어갈 수 있는 정렬 컬럼
+_NULLABLE_COLUMNS = frozenset({'published_date', 'created_at'})
+
+def _keyset_condition(order_by: str, after, descending: bool = False) -> Tuple[str, Tuple]:
+    """(order_by, id) 정렬에서 after 다음 행을 고르는 WHERE 조건
+
+    SQLite 는 NULL 을 가장 작은 값으로 정렬하지만 (NULL, id) > (?, ?) 같은
+    비교는 NULL 이 되므로 NULL 구간은 따로 처리합니다. 두 구간을 OR 로 묶으면
+    인덱스 검색을 못 하므로 after 가 속한 구간만 고르고, 그 구간이 끝나면
+    다음 구간(오름차순은 값이 있는 구간, 내림차순은 NULL 구간)을 fetch_page 가
+    이어서 읽습니다.
+    """
+    op = '<' if descending else '>'
+    if order_by == 'id':
+        return f'id {op} ?', (after,)
+    value, last_id = after
+    if isinstance(value, datetime):
+        value = value.strftime(_STORAGE_FORMATS[order_by])
+    if value is None:
+        return f'({order_by} IS NULL AND id {op} ?)', (last_id,)
+    return f'({order_by}, id) {op} (?, ?)', (value, last_id)
+
+def _order_clause(order_by: str, descending: bool = False) -> str:
+    direction = ' DESC' if descending else ''
+    if order_by == 'id':
+        return f'id{direction}'
+    return f'{order_by}{direction}, id{direction}'
+
+def _page_sql(order_by: str, conditions: Iterable[str] = (), descending: bool = False) -> str:
+    conditions = list(conditions)
+    sql = f'SELECT {", ".join(BOOK_COLUMNS)} FROM books'
+    if conditions:
+        sql += ' WHERE ' + ' AND '.join(conditions)
+    return sql + f' ORDER BY {_order_clause(order_by, descending)} LIMIT ?'
+
+_SELECT_BY_ISBN_SQL = 'SELECT * FROM books WHERE isbn = ?'
+
+# IN (...) 한 번에 넣는 isbn 수 (구버전 SQLite 의 변수 999개 제한보다 작게)
+_ISBN_CHUNK_SIZE = 500
+# 이보다 많으면 임시 테이블에 넣고 조인
+_ISBN_TEMP_TABLE_THRESHOLD = 20000
+
+_SEARCH_SQL = '''
+    SELECT books.*, bm25(books_fts) AS rank FROM books_fts
+    JOIN books ON books.id = books_fts.rowid
+    WHERE books_fts MATCH ?
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+'''
+
+# 인덱스를 타야 하는 자주 쓰는 쿼리: 이름 -> (sql, EXPLAIN 용 예시 파라미터)
+HOT_QUERIES: Dict[str, Tuple[str, Tuple]] = {}
+
+def register_hot_query(name: str, sql: str, params: Tuple = ()):
+    """DatabaseManager.check_query_plans 가 검사할 쿼리를 등록"""
+    HOT_QUERIES[name] = (sql, tuple(params))
+
+register_hot_query('get_book_by_isbn', _SELECT_BY_ISBN_SQL, ('ISBN',))
+register_hot_query('get_books_by_isbns', 'SELECT * FROM books WHERE isbn IN (?, ?)',
+                   ('ISBN-1', 'ISBN-2'))
+register_hot_query('existing_isbns', 'SELECT isbn FROM books WHERE isbn IN (?, ?)',
+                   ('ISBN-1', 'ISBN-2'))
+register_hot_query('search_books', _SEARCH_SQL, ('"python"*', 20, 0))
+for _column, _value in (('id', 0), ('author', ''), ('published_date', '2000-01-01'),
+                        ('created_at', '2000-01-01 00:00:00')):
+    _condition, _args = _keyset_condition(_column, _value if _column == 'id' else (_value, 0))
+    register_hot_query(f'iter_books({_column})', _page_sql(_column, [_condition]),
+                       _args + (5000,))
+# 카탈로그 화면의 정렬 (내림차순은 인덱스를 거꾸로 읽음)
+for _column, _value in (('title', ''), ('isbn', ''), ('author', 'z'), ('published_date', '2100-01-01')):
+    for _descending in (False, True):
+        _condition, _args = _keyset_condition(_column, (_value, 0), _descending)
+        register_hot_query(f'fetch_page({_column}{" desc" if _descending else ""})',
+                           _page_sql(_column, [_condition], _descending), _args + (100,))
+# NULL 구간과 그 다음 구간 (fetch_page 가 나눠 읽음)
+for _column in ('published_date', 'created_at'):
+    for _descending in (False, True):
+        _condition, _args = _keyset_condition(_column, (None, 0), _descending)
+        register_hot_query(f'fetch_page({_column}{" desc" if _descending else ""}, null)',
+                           _page_sql(_column, [_condition], _descending), _args + (100,))
+    register_hot_query(f'fetch_page({_column}, not null)',
+                       _page_sql(_column, [f'{_column} IS NOT NULL']), (100,))
+    register_hot_query(f'fetch_page({_column} desc, null rest)',
+                       _page_sql(_column, [f'{_column} IS NULL'], True), (100,))
+
+class QueryPlanError(AssertionError):
+    """등록된 쿼리가 인덱스 검색(SEARCH) 대신 테이블 스캔(SCAN)을 하는 경우"""
+
+@dataclass
+class BulkInsertResult:
+    total: int = 0
+    written: int = 0
+
+    @property
+    def skipped(self) -> int:
+        return self.total - self.written
+
+class BulkInsertError(Exception):
+    """on_conflict='fail' 에서 충돌이 발생한 경우
+
+    실패한 배치만 롤백되며, 그 전에 커밋된 배치의 결과는 result 에 담깁니다.
+    """
+
+    def __init__(self, message: str, result: BulkInsertResult):
+        super().__init__(message)
+        self.result = result
+
+BookLike = Union[Book, Mapping[str, Any]]
+
+@lru_cache(maxsize=65536)
+def _normalize_date(value: str) -> Optional[str]:
+    """CSV 등에서 읽은 날짜 문자열을 저장 형식('%Y-%m-%d')으로 바꿈 (빈 문자열은 None)
+
+    읽을 때 datetime.fromisoformat 으로 바꾸므로 같은 함수로 먼저 확인해, 읽을 수 없는
+    값은 저장하지 않고 ValueError 를 냅니다.
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value).strftime('%Y-%m-%d')
+
+def _format_date(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return _normalize_date(value)
+    return value.strftime('%Y-%m-%d')
+
+def book_params(book: BookLike) -> Tuple:
+    """Book 또는 csv.DictReader 의 행을 INSERT 파라미터로 변환"""
+    if isinstance(book, Mapping):
+        return (book['title'], book['author'], book['isbn'],
+                _format_date(book.get('published_date')),
+                int(book.get('quantity') or 0))
+    return (book.title, book.author, book.isbn,
+            _format_date(book.published_date), book.quantity)
+
+def assign_isbn(book: BookLike, generator: Optional[SnowflakeIdGenerator]) -> BookLike:
+    """isbn 이 비어 있으면 생성기로 채운 도서를 반환 (Book 은 그 자리에서 채움)"""
+    if generator is None:
+        return book
+    if isinstance(book, Mapping):
+        if book.get('isbn'):
+            return book
+        return {**book, 'isbn': generator.next_isbn()}
+    if not book.isbn:
+        book.isbn = generator.next_isbn()
+    return book
 
 class DatabaseManager:
-    def __init__(self, db_file: str):
+    def __init__(self, db_file: str, pool_size: int = 0, pool_timeout: float = 30.0,
+                 profile: Optional[str] = None, cache_size: int = 0,
+                 cache_ttl: Optional[float] = None, read_only: bool = False,
+                 isbn_generator: Optional[SnowflakeIdGenerator] = None,
+                 isbn_filter_capacity: int = 0, isbn_filter_fpr: float = 0.01,
+                 isbn_filter_file: Optional[str] = None):
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise ValueError(f"unknown pragma profile: {profile!r}")
         self.db_file = db_file
-    
+        # None 이면 SQLite 기본 설정 (rollback journal, synchronous=FULL)
+        self.profile = profile
+        # 읽기 전용 커넥션은 쓰기 잠금을 잡지 않음 (initialize_db 등 쓰기는 실패)
+        self.read_only = read_only
+        # pool_size > 0 이면 커넥션을 매번 새로 열지 않고 풀에서 재사용
+        self.pool: Optional[ConnectionPool] = None
+        if pool_size > 0:
+            self.pool = ConnectionPool(
+                lambda: self._connect(check_same_thread=False),
+                size=pool_size, timeout=pool_timeout)
+        # cache_size > 0 이면 get_book_by_isbn 결과(없음 포함)를 LRU 캐시에 보관.
+        # 캐시된 Book 은 호출자 간에 공유되므로 수정하지 말 것
+        self.cache: Optional[LRUCache] = None
+        if cache_size > 0:
+            self.cache = LRUCache(cache_size, ttl=cache_ttl)
+        # isbn 이 비어 있는 도서를 저장할 때 next_isbn() 으로 채움
+        # (next_isbn() 을 가진 다른 생성기로 바꿔 끼울 수 있음)
+        self.isbn_generator = isbn_generator
+        # isbn_filter_capacity > 0 이면 initialize_db 에서 기존 isbn 으로 Bloom 필터를 만들고
+        # '확실히 없음'인 isbn 은 DB 를 조회하지 않음. isbn_filter_file 이 있으면
+        # close 할 때 저장했다가 다음 시작 때 그 이후 추가된 행만 반영해 재사용
+        self.isbn_filter_capacity = isbn_filter_capacity
+        self.isbn_filter_fpr = isbn_filter_fpr
+        self.isbn_filter_file = isbn_filter_file
+        self.isbn_filter: Optional[BloomFilter] = None
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        if self.read_only:
+            uri = Path(self.db_file).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+        else:
+            conn = sqlite3.connect(self.db_file, check_same_thread=check_same_thread)
+        if self.profile is not None:
+            for name, value in PRAGMA_PROFILES[self.profile].items():
+                if name == 'journal_mode' and self.read_only:
+                    continue
+                conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
     @contextmanager
     def get_connection(self):
-        conn = sqlite3.connect(self.db_file)
+        if self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+        conn = self._connect()
         try:
             yield conn
         finally:
             conn.close()
-    
+
+    def invalidate(self, isbns: Iterable[str]):
+        """isbn 에 해당하는 행을 바꾼 뒤 반드시 호출해 캐시를 무효화"""
+        if self.cache is not None:
+            self.cache.invalidate(isbns)
+
+    def admit_isbns(self, isbns: Iterable[str]):
+        """저장하기 전에 isbn 을 Bloom 필터에 넣음
+
+        커밋 전에 넣어야 다른 스레드가 방금 저장된 isbn 을 '확실히 없음'으로 놓치지 않음
+        """
+        if self.isbn_filter is not None:
+            self.isbn_filter.update(isbns)
+
+    def write_rows(self, conn: sqlite3.Connection, isbns: List[str], write):
+        """모든 쓰기 경로가 거치는 순서: Bloom 필터에 추가 -> write(cursor) -> 커밋 -> 캐시 무효화
+
+        write 가 예외를 내면 롤백하고 그대로 다시 발생시킵니다. write 의 반환값을 반환합니다.
+        자체 커넥션으로 쓰는 WriteBehindWriter 나 복제본도 이 순서를 따르도록 이 메서드를 씁니다.
+        """
+        self.admit_isbns(isbns)
+        cursor = conn.cursor()
+        try:
+            value = write(cursor)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        self.invalidate(isbns)
+        return value
+
+    def close(self):
+        if self.isbn_filter is not None and self.isbn_filter_file is not None:
+            self.isbn_filter.save(self.isbn_filter_file)
+        if self.pool is not None:
+            self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def initialize_db(self):
+        # 프로파일의 PRAGMA 는 커넥션을 열 때 _connect 에서 적용됨
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -30,24 +370,325 @@ class DatabaseManager:
                 )
             ''')
             conn.commit()
-    
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_books_author ON books (author)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_books_title ON books (title)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_books_published_date ON books (published_date)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_books_created_at ON books (created_at)')
+            conn.commit()
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'books_fts'")
+            if cursor.fetchone() is None:
+                # 기존 데이터베이스면 rebuild 로 이미 있는 행까지 색인
+                conn.executescript(_FTS_SCHEMA)
+        if self.isbn_filter_capacity > 0 and self.isbn_filter is None:
+            self.load_isbn_filter()
+
+    def load_isbn_filter(self) -> BloomFilter:
+        """저장된 필터를 읽거나 새로 만들고 DB 의 isbn 을 반영"""
+        bloom, _ = load_or_create(self.isbn_filter_file, self.isbn_filter_capacity,
+                                  self.isbn_filter_fpr)
+        # 만드는 동안 추가되는 도서도 필터에 들어가도록 먼저 연결
+        self.isbn_filter = bloom
+        self.refresh_isbn_filter()
+        return bloom
+
+    def refresh_isbn_filter(self) -> int:
+        """필터의 워터마크 이후에 추가된 행의 isbn 을 반영하고 그 수를 반환
+
+        이 인스턴스를 거친 쓰기는 바로 반영되므로, 다른 프로세스도 같은 파일에
+        쓰는 경우에만 조회 전에 주기적으로 호출하면 됩니다.
+        """
+        bloom = self.isbn_filter
+        if bloom is None:
+            raise RuntimeError("isbn filter is not enabled")
+        with self.get_connection() as conn:
+            watermark = conn.execute('SELECT IFNULL(MAX(id), 0) FROM books').fetchone()[0]
+            if watermark < bloom.watermark:
+                # 저장된 필터가 다른(다시 만든) 데이터베이스의 것이면 처음부터 다시 만듦
+                bloom = self.isbn_filter = BloomFilter(self.isbn_filter_capacity,
+                                                       self.isbn_filter_fpr)
+            if bloom.watermark == 0:
+                # 처음 만들 때는 테이블 대신 isbn 인덱스만 훑음 (커버링 인덱스)
+                cursor = conn.execute('SELECT isbn FROM books')
+            else:
+                cursor = conn.execute('SELECT isbn FROM books WHERE id > ?', (bloom.watermark,))
+            before = bloom.count
+            bloom.update(isbn for (isbn,) in cursor)
+        bloom.watermark = max(bloom.watermark, watermark)
+        return bloom.count - before
+
     def add_book(self, book: Book) -> int:
+        params = book_params(assign_isbn(book, self.isbn_generator))
+        with self.get_connection() as conn:
+            return self.write_rows(conn, [params[2]], lambda cursor: cursor.execute(
+                f'INSERT INTO books {INSERT_COLUMNS}', params).lastrowid)
+
+    def add_books(self, books: Iterable[BookLike], batch_size: int = 10000,
+                  on_conflict: str = 'fail') -> BulkInsertResult:
+        """여러 도서를 batch_size 단위 트랜잭션으로 나눠 executemany 로 저장
+
+        books 는 Book 또는 csv.DictReader 의 행 같은 매핑을 내는 어떤 이터러블이든
+        가능하며 한 배치 분량만 메모리에 올립니다. on_conflict 는 isbn 충돌 시
+        'fail'(해당 배치 롤백 후 BulkInsertError), 'skip'(무시),
+        'replace'(기존 행 갱신) 중 하나입니다. isbn_generator 가 있으면 isbn 이
+        비어 있는 도서에 새 isbn 을 붙여 저장합니다.
+        """
+        if on_conflict not in BULK_INSERT_SQL:
+            raise ValueError(f"unknown on_conflict policy: {on_conflict!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        sql = BULK_INSERT_SQL[on_conflict]
+        result = BulkInsertResult()
+        if self.isbn_generator is not None:
+            books = (assign_isbn(book, self.isbn_generator) for book in books)
+        rows = map(book_params, books)
+        with self.get_connection() as conn:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                began = time.perf_counter()
+                try:
+                    written = self.write_rows(conn, [row[2] for row in batch],
+                                              lambda cursor: cursor.executemany(sql, batch).rowcount)
+                except sqlite3.IntegrityError as e:
+                    raise BulkInsertError(str(e), result) from e
+                result.total += len(batch)
+                result.written += written
+                _BATCH_WRITTEN(rows=len(batch), written=written,
+                               total=result.total, on_conflict=on_conflict,
+                               ms=round((time.perf_counter() - began) * 1000, 1))
+        return result
+
+    def search_books(self, query: str, limit: int = 20, offset: int = 0) -> List[Book]:
+        """제목/저자 전문 검색 결과를 bm25 순위순으로 반환 (각 단어는 접두어 일치)"""
+        match = _fts_query(query)
+        if not match:
+            return []
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO books (title, author, isbn, published_date, quantity)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (book.title, book.author, book.isbn,
-                 book.published_date.strftime('%Y-%m-%d'),
-                 book.quantity))
-            conn.commit()
-            return cursor.lastrowid
-    
+            cursor.row_factory = BookRowFactory()
+            cursor.execute(_SEARCH_SQL, (match, limit, offset))
+            return cursor.fetchall()
+
+    def search_books_ranked(self, query: str, limit: int = 20,
+                            offset: int = 0) -> List[Tuple[float, Book]]:
+        """search_books 와 같지만 (bm25 점수, Book) 을 반환 (작을수록 관련도 높음)"""
+        match = _fts_query(query)
+        if not match:
+            return []
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SEARCH_SQL, (match, limit, offset))
+            columns = [column[0] for column in cursor.description]
+            decode = make_book_decoder(columns)
+            rank_index = columns.index('rank')
+            return [(row[rank_index], decode(row)) for row in cursor]
+
+    def explain(self, sql: str, params: Tuple = ()) -> List[str]:
+        """EXPLAIN QUERY PLAN 결과의 각 단계 설명을 반환"""
+        with self.get_connection() as conn:
+            rows = conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+        return [row[3] for row in rows]
+
+    def check_query_plans(self, queries: Optional[Mapping[str, Tuple[str, Tuple]]] = None):
+        """등록된 쿼리 중 테이블을 SCAN 하는 것이 있으면 QueryPlanError 를 발생
+
+        테스트에서 호출해 인덱스가 빠지거나 쿼리가 바뀌어 전체 스캔이 생기는 것을
+        막습니다. FTS5 가상 테이블 검색(VIRTUAL TABLE INDEX)은 스캔으로 보지 않습니다.
+        """
+        problems = []
+        for name, (sql, params) in (queries or HOT_QUERIES).items():
+            for detail in self.explain(sql, params):
+                if detail.startswith('SCAN') and 'VIRTUAL TABLE INDEX' not in detail:
+                    problems.append(f"{name}: {detail}")
+        if problems:
+            raise QueryPlanError("queries without index search:\n" + "\n".join(problems))
+
+    def iter_books(self, order_by: str = 'id', page_size: int = 5000,
+                   where: Optional[str] = None, params: Tuple = (),
+                   after=None, raw: bool = False) -> Iterator[Book]:
+        """전체(또는 where 조건) 도서를 키셋 페이지 단위로 읽어 하나씩 반환
+
+        OFFSET 대신 마지막 키 다음부터 읽으므로 페이지마다 비용이 일정하고,
+        메모리에는 한 페이지만 올라갑니다. 페이지마다 커넥션을 새로 얻어 긴 읽기
+        트랜잭션을 만들지 않습니다. 중단한 지점부터 이어 읽으려면 after 에
+        order_by='id' 이면 마지막 id 를, 아니면 (마지막 Book 의 해당 값, id) 를 넘깁니다.
+        where 는 신뢰할 수 있는 SQL 조각이어야 하며 값은 params 로 넘깁니다.
+        raw=True 이면 Book 대신 BOOK_COLUMNS 순서의 저장된 값 튜플을 그대로 반환합니다.
+        """
+        if order_by not in BOOK_COLUMNS:
+            raise ValueError(f"cannot order by {order_by!r}")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        key_index = BOOK_COLUMNS.index(order_by)
+        decode = make_book_decoder(BOOK_COLUMNS)
+        while True:
+            rows = self.fetch_page(order_by, after, page_size, where, params)
+            if raw:
+                yield from rows
+            else:
+                yield from map(decode, rows)
+            if len(rows) < page_size:
+                return
+            last = rows[-1]
+            after = last[0] if order_by == 'id' else (last[key_index], last[0])
+
+    def fetch_page(self, order_by: str = 'id', after=None, limit: int = 100,
+                   where: Optional[str] = None, params: Tuple = (),
+                   descending: bool = False) -> List[Tuple]:
+        """(order_by, id) 순서에서 after 다음 limit 개 행을 BOOK_COLUMNS 순서 튜플로 반환
+
+        after 는 iter_books 와 같은 형식(마지막 행의 id 또는 (값, id))이며 None 이면
+        처음부터 읽습니다. 인덱스를 따라 after 위치부터 읽으므로 몇 번째 페이지든
+        비용이 같습니다.
+        """
+        if order_by not in BOOK_COLUMNS:
+            raise ValueError(f"cannot order by {order_by!r}")
+        rows = self._select_page(order_by, after, limit, where, params, descending)
+        if (order_by in _NULLABLE_COLUMNS and len(rows) < limit and after is not None
+                and (after[0] is None) != descending):
+            # after 가 속한 구간이 끝났으면 다음 구간을 이어서 읽음: 오름차순은 NULL 구간
+            # 다음의 값이 있는 구간, 내림차순은 값이 있는 구간 다음의 맨 뒤 NULL 구간
+            rest = f'{order_by} IS NOT NULL' if after[0] is None else f'{order_by} IS NULL'
+            rows += self._select_page(order_by, None, limit - len(rows), where, params,
+                                      descending, [rest])
+        return rows
+
+    def _select_page(self, order_by: str, after, limit: int, where: Optional[str],
+                     params: Tuple, descending: bool = False,
+                     extra_conditions: Iterable[str] = ()) -> List[Tuple]:
+        conditions, args = list(extra_conditions), []
+        if where:
+            conditions.append(f'({where})')
+            args.extend(params)
+        if after is not None:
+            condition, condition_args = _keyset_condition(order_by, after, descending)
+            conditions.append(condition)
+            args.extend(condition_args)
+        args.append(limit)
+        with self.get_connection() as conn:
+            return conn.execute(_page_sql(order_by, conditions, descending), args).fetchall()
+
+    def key_at(self, order_by: str, position: int, descending: bool = False,
+               where: Optional[str] = None, params: Tuple = ()):
+        """정렬 순서에서 position 번째(0부터) 행의 키를 반환 (없으면 None)
+
+        fetch_page(after=key_at(..., n - 1)) 는 n 번째 행부터 읽습니다. 정렬 컬럼의
+        인덱스만 읽지만 OFFSET 이라 position 에 비례하므로 스크롤바를 끌어 멀리
+        건너뛸 때만 씁니다.
+        """
+        if order_by not in BOOK_COLUMNS:
+            raise ValueError(f"cannot order by {order_by!r}")
+        columns = 'id' if order_by == 'id' else f'{order_by}, id'
+        sql = f'SELECT {columns} FROM books'
+        if where:
+            sql += f' WHERE {where}'
+        sql += f' ORDER BY {_order_clause(order_by, descending)} LIMIT 1 OFFSET ?'
+        with self.get_connection() as conn:
+            row = conn.execute(sql, (*params, position)).fetchone()
+        if row is None:
+            return None
+        return row[0] if order_by == 'id' else row
+
+    def count_books(self, where: Optional[str] = None, params: Tuple = ()) -> int:
+        sql = 'SELECT COUNT(*) FROM books'
+        if where:
+            sql += f' WHERE {where}'
+        with self.get_connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
     def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
+        if self.isbn_filter is not None and not self.isbn_filter.might_contain(isbn):
+            return None
+        if self.cache is None:
+            return self._select_book_by_isbn(isbn)
+        cached = self.cache.get(isbn)
+        if cached is not MISSING:
+            return cached
+        version = self.cache.version
+        book = self._select_book_by_isbn(isbn)
+        self.cache.put(isbn, book, version=version)
+        return book
+
+    def get_books_by_isbns(self, isbns: Iterable[str]) -> Dict[str, Book]:
+        """여러 isbn 을 한꺼번에 조회해 {isbn: Book} 으로 반환 (없는 isbn 은 제외)"""
+        wanted = list(dict.fromkeys(isbns))
+        found: Dict[str, Book] = {}
+        if self.cache is not None:
+            missing = []
+            for isbn in wanted:
+                cached = self.cache.get(isbn)
+                if cached is MISSING:
+                    missing.append(isbn)
+                elif cached is not None:
+                    found[isbn] = cached
+            version = self.cache.version
+            selected = self._select_books_by_isbns(missing)
+            for isbn in missing:
+                self.cache.put(isbn, selected.get(isbn), version=version)
+            found.update(selected)
+            return found
+        return self._select_books_by_isbns(wanted)
+
+    def existing_isbns(self, isbns: Iterable[str]) -> Set[str]:
+        """isbns 가운데 이미 저장된 것만 반환 (가져오기 전 중복 확인용)
+
+        IN 으로 묶어 조회하면 isbn 하나당 비용이 Bloom 필터 검사보다 작으므로
+        여기서는 필터를 쓰지 않습니다.
+        """
+        wanted = sorted(set(isbns))
+        existing: Set[str] = set()
+        with self.get_connection() as conn:
+            for start in range(0, len(wanted), _ISBN_CHUNK_SIZE):
+                chunk = wanted[start:start + _ISBN_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor = conn.execute(
+                    f'SELECT isbn FROM books WHERE isbn IN ({placeholders})', chunk)
+                existing.update(isbn for (isbn,) in cursor)
+        return existing
+
+    def distinct_values(self, column: str) -> List[str]:
+        """column 의 서로 다른 값 목록 (NULL 제외, 순서 없음)"""
+        if column not in BOOK_COLUMNS:
+            raise ValueError(f"unknown column: {column!r}")
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'SELECT DISTINCT {column} FROM books WHERE {column} IS NOT NULL')
+            return [value for (value,) in cursor]
+
+    def _select_books_by_isbns(self, isbns: List[str]) -> Dict[str, Book]:
+        found: Dict[str, Book] = {}
+        if not isbns:
+            return found
+        # 정렬해서 넣으면 isbn 인덱스를 순서대로 읽어 페이지 캐시 적중률이 높아짐
+        isbns = sorted(isbns)
+        with self.get_connection() as conn:
+            if len(isbns) > _ISBN_TEMP_TABLE_THRESHOLD:
+                conn.execute('CREATE TEMP TABLE IF NOT EXISTS isbn_lookup (isbn TEXT PRIMARY KEY)')
+                conn.executemany('INSERT OR IGNORE INTO isbn_lookup VALUES (?)',
+                                 ((isbn,) for isbn in isbns))
+                cursor = conn.cursor()
+                cursor.row_factory = BookRowFactory()
+                cursor.execute('SELECT books.* FROM isbn_lookup JOIN books USING (isbn)')
+                books = cursor.fetchall()
+                # 임시 테이블에 넣은 행은 롤백으로 비움
+                conn.rollback()
+                return {book.isbn: book for book in books}
+            for start in range(0, len(isbns), _ISBN_CHUNK_SIZE):
+                chunk = isbns[start:start + _ISBN_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor = conn.cursor()
+                cursor.row_factory = BookRowFactory()
+                cursor.execute(f'SELECT * FROM books WHERE isbn IN ({placeholders})', chunk)
+                for book in cursor:
+                    found[book.isbn] = book
+        return found
+
+    def _select_book_by_isbn(self, isbn: str) -> Optional[Book]:
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM books WHERE isbn = ?', (isbn,))
-            row = cursor.fetchone()
-            if row:
-                return Book(*row)
-            return None
+            cursor.row_factory = BookRowFactory()
+            cursor.execute(_SELECT_BY_ISBN_SQL, (isbn,))
+            book = cursor.fetchone()
+        if book is None and self.isbn_filter is not None:
+            self.isbn_filter.record_false_positive()
+        return book
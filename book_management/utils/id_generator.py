@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+import weakref
+from typing import Callable, List, Optional
+
+# 2024-01-01 00:00:00 UTC (밀리초). 41비트 타임스탬프로 약 69년 사용 가능
+DEFAULT_EPOCH_MS = 1704067200000
+NODE_BITS = 10
+SEQUENCE_BITS = 12
+MAX_NODE_ID = (1 << NODE_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+def _default_node_id() -> int:
+    """환경 변수 BOOK_MANAGEMENT_NODE_ID, 없으면 프로세스 id 로 노드 번호를 정함"""
+    value = os.environ.get('BOOK_MANAGEMENT_NODE_ID')
+    if value is not None:
+        return int(value)
+    return os.getpid() & MAX_NODE_ID
+
+# node_id 를 pid 에서 정한 생성기들 (fork 후 자식에서 노드 번호를 다시 정함)
+_pid_nodes: "weakref.WeakSet[SnowflakeIdGenerator]" = weakref.WeakSet()
+
+def _reset_after_fork():
+    for generator in list(_pid_nodes):
+        generator._after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+class SnowflakeIdGenerator:
+    """시간(41비트) + 노드(10비트) + 순번(12비트)으로 된 단조 증가 64비트 id 생성기
+
+    같은 밀리초 안에서는 순번을 올리고, 순번이 다 차거나 시계가 뒤로 가면
+    다음 밀리초를 미리 당겨 써서 기다리지 않고도 항상 증가하는 값을 냅니다.
+    스레드 간에는 락으로, 프로세스 간에는 노드 번호로 중복을 막습니다.
+    node_id 를 주지 않으면 프로세스 id 의 하위 10비트를 쓰므로, 여러 호스트나
+    pid 가 1024 배수만큼 차이 나는 프로세스가 함께 쓰면 node_id 를 직접 지정해야 합니다.
+    """
+
+    def __init__(self, node_id: Optional[int] = None, epoch_ms: int = DEFAULT_EPOCH_MS,
+                 clock: Callable[[], int] = time.time_ns):
+        self.node_id = _default_node_id() if node_id is None else node_id
+        if not 0 <= self.node_id <= MAX_NODE_ID:
+            raise ValueError(f"node_id must be between 0 and {MAX_NODE_ID}")
+        self.epoch_ms = epoch_ms
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._sequence = 0
+        if node_id is None:
+            _pid_nodes.add(self)
+
+    def _after_fork(self):
+        # fork 된 자식은 부모와 다른 노드 번호를 써야 함
+        self._lock = threading.Lock()
+        self.node_id = _default_node_id()
+
+    def _now_ms(self) -> int:
+        return self._clock() // 1_000_000 - self.epoch_ms
+
+    def next_id(self) -> int:
+        with self._lock:
+            now = self._now_ms()
+            if now > self._last_ms:
+                self._last_ms = now
+                self._sequence = 0
+            elif self._sequence < MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last_ms += 1
+                self._sequence = 0
+            return (self._last_ms << (NODE_BITS + SEQUENCE_BITS)
+                    | self.node_id << SEQUENCE_BITS
+                    | self._sequence)
+
+    def next_ids(self, count: int) -> List[int]:
+        """count 개의 연속된 id 를 락 한 번으로 할당"""
+        ids: List[int] = []
+        with self._lock:
+            now = self._now_ms()
+            if now > self._last_ms:
+                self._last_ms, self._sequence = now, -1
+            node_bits = self.node_id << SEQUENCE_BITS
+            while len(ids) < count:
+                if self._sequence >= MAX_SEQUENCE:
+                    self._last_ms += 1
+                    self._sequence = -1
+                start = self._sequence + 1
+                stop = min(MAX_SEQUENCE + 1, start + count - len(ids))
+                base = self._last_ms << (NODE_BITS + SEQUENCE_BITS) | node_bits
+                ids.extend(range(base + start, base + stop))
+                self._sequence = stop - 1
+        return ids
+
+    def next_isbn(self) -> str:
+        return format_isbn(self.next_id())
+
+    def next_isbns(self, count: int) -> List[str]:
+        return [format_isbn(book_id) for book_id in self.next_ids(count)]
+
+def format_isbn(book_id: int) -> str:
+    """생성된 id 를 books.isbn 에 저장할 문자열로 변환"""
+    return f"ISBN-{book_id}"
@@ -0,0 +1,97 @@
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+OVERFLOW_POLICIES = ('drop', 'block')
+
+class BoundedQueueHandler(QueueHandler):
+    """크기가 제한된 큐에 레코드를 넣는 QueueHandler
+
+    큐가 가득 찼을 때 overflow='drop' 이면 레코드를 버리고 dropped 를 올리며,
+    'block' 이면 자리가 날 때까지(block_timeout 초까지) 기다린 뒤에도 자리가 없으면 버립니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = 'drop',
+                 block_timeout: Optional[float] = None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 스레드로 넘기므로 레코드를 복사하거나 포맷하지 않고
+        # 나중에 바뀔 수 있는 인자만 메시지에 합쳐 둠 (포맷은 기록 스레드에서)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.overflow == 'block':
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+class _FlushingQueueListener(QueueListener):
+    """종료 신호를 큐가 가득 차 있어도 넣을 수 있도록 기다리는 QueueListener"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+# 프로세스 종료 시 남은 레코드를 모두 쓰고 닫을 (로거 이름, 큐 핸들러, 리스너, 파일 핸들러) 목록
+_listeners: List[tuple] = []
+_listeners_lock = threading.Lock()
+
+def _stop_listener(name: str, queue_handler: BoundedQueueHandler, listener: QueueListener,
+                   handler: logging.Handler):
+    listener.stop()
+    if queue_handler.dropped:
+        # 큐가 넘쳐 버린 레코드 수를 마지막에 남김
+        handler.handle(logging.makeLogRecord({
+            'name': name, 'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': f"log queue overflow: {queue_handler.dropped} records dropped"}))
+    handler.close()
+
+def start_queue_logging(name: str, handler: logging.Handler, queue_size: int,
+                        overflow: str = 'drop') -> BoundedQueueHandler:
+    """handler 를 백그라운드 스레드에서 실행하고, 로거에 붙일 큐 핸들러를 반환"""
+    queue_handler = BoundedQueueHandler(queue.Queue(queue_size), overflow)
+    listener = _FlushingQueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    listener.start()
+    with _listeners_lock:
+        _listeners.append((name, queue_handler, listener, handler))
+    return queue_handler
+
+def stop_queue_logging(queue_handler: BoundedQueueHandler):
+    """queue_handler 의 기록 스레드를 멈추고 남은 레코드를 씀"""
+    with _listeners_lock:
+        entries = [entry for entry in _listeners if entry[1] is queue_handler]
+        for entry in entries:
+            _listeners.remove(entry)
+    for entry in entries:
+        _stop_listener(*entry)
+
+def shutdown_loggers():
+    """백그라운드 기록 스레드를 모두 멈추고 큐에 남은 레코드를 파일에 씀 (atexit 에서도 호출)"""
+    with _listeners_lock:
+        listeners, _listeners[:] = list(_listeners), []
+    for entry in listeners:
+        _stop_listener(*entry)
+
+def _shutdown_at_exit():
+    # utils.logger.shutdown_loggers 는 EventLog 요약을 먼저 남긴 뒤 이 모듈의 shutdown_loggers 를 부름
+    from utils.logger import shutdown_loggers as shutdown_all
+    shutdown_all()
+
+atexit.register(_shutdown_at_exit)
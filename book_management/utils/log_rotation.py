@@ -0,0 +1,171 @@
+import glob
+import gzip
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from logging.handlers import BaseRotatingHandler
+from typing import Callable, List, Optional
+
+_ARCHIVE_TIME_FORMAT = '%Y%m%d-%H%M%S'
+
+class ArchiveCompressor:
+    """순환된 로그 파일을 백그라운드 스레드에서 gzip 으로 압축하고 보존 기간을 적용
+
+    로그를 쓰는 스레드는 submit 으로 파일 경로만 넘기고 바로 돌아갑니다.
+    압축은 '.gz.tmp' 에 쓴 뒤 이름을 바꾸므로 중간에 종료돼도 깨진 .gz 가 남지 않습니다.
+    """
+
+    def __init__(self, base_filename: str, compress: bool = True, backup_count: int = 0,
+                 max_age_days: float = 0, clock: Callable[[], float] = time.time):
+        self.base_filename = base_filename
+        self.compress = compress
+        self.backup_count = backup_count
+        self.max_age_days = max_age_days
+        self.clock = clock
+        self.failures = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, path: str):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name='log-archive-compressor')
+                self._thread.start()
+        self._queue.put(path)
+
+    def join(self):
+        """대기 중인 압축이 모두 끝날 때까지 기다림"""
+        self._queue.join()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                if self.compress:
+                    self._compress(path)
+                self.apply_retention()
+            except OSError:
+                # 압축에 실패하면 원본 파일을 그대로 남겨 둠
+                self.failures += 1
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _compress(path: str):
+        temp_path = f'{path}.gz.tmp'
+        with open(path, 'rb') as source, gzip.open(temp_path, 'wb', compresslevel=6) as target:
+            shutil.copyfileobj(source, target, 1 << 20)
+        os.replace(temp_path, f'{path}.gz')
+        os.remove(path)
+
+    def archives(self) -> List[str]:
+        """보관된 로그 파일 목록 (오래된 것부터)"""
+        pattern = f'{glob.escape(self.base_filename)}.[0-9]*'
+        archives = [path for path in glob.glob(pattern) if not path.endswith('.tmp')]
+        return sorted(archives, key=lambda path: path[:-3] if path.endswith('.gz') else path)
+
+    def apply_retention(self):
+        """backup_count 개를 넘거나 max_age_days 보다 오래된 보관 파일을 삭제"""
+        archives = self.archives()
+        expired = []
+        if self.backup_count > 0 and len(archives) > self.backup_count:
+            expired = archives[:len(archives) - self.backup_count]
+            archives = archives[len(expired):]
+        if self.max_age_days > 0:
+            cutoff = self.clock() - self.max_age_days * 86400
+            expired += [path for path in archives if os.path.getmtime(path) < cutoff]
+        for path in expired:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+class RotatingArchiveHandler(BaseRotatingHandler):
+    """크기(max_bytes) 또는 시간(rotate_interval 초) 기준으로 순환하는 파일 핸들러
+
+    순환할 때 로그를 쓰는 스레드는 현재 파일을 'app.log.20240101-120000' 처럼
+    이름만 바꾸고 새 파일을 엽니다. gzip 압축과 보존 기간 적용(backup_count,
+    max_age_days)은 ArchiveCompressor 의 스레드가 하므로 로그 호출이 압축을
+    기다리지 않습니다. 0 인 기준은 쓰지 않습니다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, rotate_interval: float = 0,
+                 backup_count: int = 0, max_age_days: float = 0, compress: bool = True,
+                 encoding: Optional[str] = 'utf-8', delay: bool = True,
+                 clock: Callable[[], float] = time.time):
+        super().__init__(filename, 'a', encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.clock = clock
+        self.compressor = ArchiveCompressor(self.baseFilename, compress, backup_count,
+                                            max_age_days, clock)
+        self.rollover_at = self._next_rollover(self._opened_at())
+        self._last_stamp = None
+        self._sequence = 0
+
+    def _opened_at(self) -> float:
+        # 이미 있는 파일에 이어 쓸 때는 파일의 수정 시각부터 주기를 셈
+        try:
+            return os.path.getmtime(self.baseFilename)
+        except OSError:
+            return self.clock()
+
+    def _next_rollover(self, began: float) -> float:
+        return began + self.rotate_interval if self.rotate_interval > 0 else float('inf')
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.clock() >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            # RotatingFileHandler 와 달리 레코드를 미리 포맷하지 않고 이미 쓴 크기만 봄
+            # (파일이 max_bytes 보다 레코드 하나만큼 커질 수 있음)
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def _archive_name(self) -> str:
+        stamp = time.strftime(_ARCHIVE_TIME_FORMAT, time.localtime(self.clock()))
+        # 같은 초에 여러 번 순환하면 일련번호를 붙임 (이름 순서가 곧 시간 순서).
+        # 보존 기간으로 지워진 이름을 다시 쓰지 않도록 번호는 핸들러가 기억함
+        if stamp == self._last_stamp:
+            self._sequence += 1
+        else:
+            self._last_stamp, self._sequence = stamp, 0
+        name = f'{self.baseFilename}.{stamp}'
+        while True:
+            candidate = f'{name}-{self._sequence:03d}' if self._sequence else name
+            if not (os.path.exists(candidate) or os.path.exists(f'{candidate}.gz')):
+                return candidate
+            self._sequence += 1
+
+    def doRollover(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            archive = self._archive_name()
+            os.rename(self.baseFilename, archive)
+            self.compressor.submit(archive)
+        self.rollover_at = self._next_rollover(self.clock())
+        if not self.delay:
+            self.stream = self._open()
+
+    def close(self):
+        # 진행 중인 압축을 마친 뒤 닫아서 종료 시 압축되지 않은 파일이 남지 않게 함
+        super().close()
+        self.compressor.stop()
@@ -1,19 +1,140 @@
 import logging
-from datetime import datetime
-
-def setup_logger(name: str, log_file: str, level=logging.INFO):
-    formatter = logging.Formatter(
-        '%(asctime)s %(levelname)s [%(name)s] %(message)s'
-    )
-    
-    handler = logging.FileHandler(log_file)
-    handler.setFormatter(formatter)
-    
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    logger.addHandler(handler)
-    
-    return logger
-
-# 로거 생성
-logger = setup_logger('book_management', 'app.log')
+import os
+import sys
+import threading
+from typing import Dict, Tuple
+
+DEFAULT_LOGGER_NAME = 'book_management'
+
+# setup_logger 로 설정한 로거 이름 -> (설정값, 로거에 붙인 핸들러)
+_configured: Dict[str, Tuple[Tuple, logging.Handler]] = {}
+_lock = threading.RLock()
+
+def _detach(logger: logging.Logger, handler: logging.Handler):
+    logger.removeHandler(handler)
+    if 'utils.log_queue' in sys.modules:
+        from utils.log_queue import BoundedQueueHandler, stop_queue_logging
+        if isinstance(handler, BoundedQueueHandler):
+            stop_queue_logging(handler)
+            return
+    handler.close()
+
+def setup_logger(name: str, log_file: str, level=logging.INFO, queue_size: int = 10000,
+                 overflow: str = 'drop', max_bytes: int = 0, rotate_interval: float = 0,
+                 backup_count: int = 0, max_age_days: float = 0, compress: bool = True,
+                 log_format: str = 'text'):
+    """파일에 기록하는 로거를 설정
+
+    queue_size > 0 이면 호출한 스레드는 레코드를 큐에 넣기만 하고 파일 쓰기는
+    백그라운드 스레드(QueueListener)가 합니다. 큐가 가득 차면 overflow 정책을 따르며,
+    종료 시(atexit 또는 shutdown_loggers) 큐에 남은 레코드를 모두 씁니다.
+    queue_size=0 이면 호출한 스레드에서 바로 파일에 씁니다.
+    같은 이름으로 다시 호출해도 핸들러가 쌓이지 않으며(설정이 다르면 교체),
+    로그 파일은 첫 레코드를 쓸 때 엽니다.
+
+    max_bytes 나 rotate_interval(초)을 주면 그 크기나 주기마다 파일을 순환합니다.
+    순환된 파일은 백그라운드 스레드에서 gzip 으로 압축되고(compress), 최근
+    backup_count 개와 max_age_days 일 이내의 파일만 남습니다 (0 이면 제한 없음).
+    log_format='json' 이면 한 줄에 JSON 객체 하나씩 씁니다 (utils.structured_log).
+    """
+    with _lock:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        settings = (log_file, queue_size, overflow,
+                    (max_bytes, rotate_interval, backup_count, max_age_days, compress),
+                    log_format)
+        previous = _configured.get(name)
+        if previous is not None:
+            if previous[0] == settings:
+                return logger
+            _detach(logger, previous[1])
+
+        if log_format == 'json':
+            from utils.structured_log import JsonFormatter
+            formatter = JsonFormatter()
+        elif log_format == 'text':
+            formatter = logging.Formatter(
+                '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+            )
+        else:
+            raise ValueError(f"unknown log format: {log_format!r}")
+
+        if max_bytes > 0 or rotate_interval > 0:
+            from utils.log_rotation import RotatingArchiveHandler
+            handler = RotatingArchiveHandler(log_file, max_bytes, rotate_interval, backup_count,
+                                             max_age_days, compress)
+        else:
+            handler = logging.FileHandler(log_file, delay=True)
+        handler.setFormatter(formatter)
+
+        if queue_size > 0:
+            # logging.handlers 는 import 비용이 커서 큐를 쓸 때만 불러옴
+            from utils.log_queue import start_queue_logging
+            handler = start_queue_logging(name, handler, queue_size, overflow)
+        logger.addHandler(handler)
+        _configured[name] = (settings, handler)
+        return logger
+
+def _settings_from_env() -> dict:
+    return {
+        'log_file': os.environ.get('BOOK_MANAGEMENT_LOG_FILE', 'app.log'),
+        'level': os.environ.get('BOOK_MANAGEMENT_LOG_LEVEL', 'INFO').upper(),
+        'queue_size': int(os.environ.get('BOOK_MANAGEMENT_LOG_QUEUE_SIZE', '10000')),
+        'overflow': os.environ.get('BOOK_MANAGEMENT_LOG_OVERFLOW', 'drop'),
+        'max_bytes': int(os.environ.get('BOOK_MANAGEMENT_LOG_MAX_BYTES', '0')),
+        'rotate_interval': float(os.environ.get('BOOK_MANAGEMENT_LOG_ROTATE_INTERVAL', '0')),
+        'backup_count': int(os.environ.get('BOOK_MANAGEMENT_LOG_BACKUP_COUNT', '0')),
+        'max_age_days': float(os.environ.get('BOOK_MANAGEMENT_LOG_MAX_AGE_DAYS', '0')),
+        'log_format': os.environ.get('BOOK_MANAGEMENT_LOG_FORMAT', 'text'),
+    }
+
+def default_logger_enabled_for(level: int) -> bool:
+    """기본 로거가 level 레코드를 기록할지 (아직 구성 전이면 구성하지 않고 환경 변수로 판단)
+
+    EventLog 처럼 기록하지 않을 레코드 때문에 로그 파일과 기록 스레드가 생기지 않게 합니다.
+    """
+    if DEFAULT_LOGGER_NAME in _configured:
+        return logging.getLogger(DEFAULT_LOGGER_NAME).isEnabledFor(level)
+    if logging.root.manager.disable >= level:
+        return False
+    threshold = logging.getLevelName(os.environ.get('BOOK_MANAGEMENT_LOG_LEVEL', 'INFO').upper())
+    # 알 수 없는 레벨 이름이면 get_logger 가 구성하면서 오류를 내도록 함
+    return not isinstance(threshold, int) or level >= threshold
+
+def get_logger() -> logging.Logger:
+    """book_management 로거를 반환 (처음 호출할 때 환경 변수 설정으로 한 번만 구성)
+
+    BOOK_MANAGEMENT_LOG_FILE, _LEVEL, _QUEUE_SIZE, _OVERFLOW, _MAX_BYTES,
+    _ROTATE_INTERVAL, _BACKUP_COUNT, _MAX_AGE_DAYS, _FORMAT 으로 설정하며,
+    그 전에 setup_logger(DEFAULT_LOGGER_NAME, ...) 를 직접 호출했다면 그 설정을 씁니다.
+    """
+    if DEFAULT_LOGGER_NAME not in _configured:
+        with _lock:
+            if DEFAULT_LOGGER_NAME not in _configured:
+                setup_logger(DEFAULT_LOGGER_NAME, **_settings_from_env())
+    return logging.getLogger(DEFAULT_LOGGER_NAME)
+
+def shutdown_loggers():
+    """큐에 남은 레코드를 모두 파일에 쓰고 기록 스레드를 멈춤
+
+    큐를 쓰던 로거는 설정이 해제되어 다음 get_logger/setup_logger 때 다시 구성됩니다.
+    그 전에 EventLog 가 억제한 채 남은 건수를 요약 줄로 남깁니다.
+    """
+    if 'utils.structured_log' in sys.modules:
+        from utils.structured_log import flush_event_logs
+        flush_event_logs()
+    if 'utils.log_queue' not in sys.modules:
+        return
+    from utils.log_queue import shutdown_loggers as shutdown_queues
+    with _lock:
+        for name, (settings, handler) in list(_configured.items()):
+            if settings[1] > 0:
+                logging.getLogger(name).removeHandler(handler)
+                del _configured[name]
+        shutdown_queues()
+
+def __getattr__(name: str):
+    # 예전처럼 `from utils.logger import logger` 로 가져오는 코드를 위한 지연 생성
+    if name == 'logger':
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
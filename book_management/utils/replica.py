@@ -0,0 +1,192 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from models.book import Book
+from utils.database import BOOK_COLUMNS, BookLike, BulkInsertResult, DatabaseManager, assign_isbn
+from utils.logger import get_logger
+
+# 읽기에 쓰이는 옵션이라 디스크가 아닌 메모리 복제본에 적용
+_MEMORY_OPTIONS = ('cache_size', 'cache_ttl', 'isbn_filter_capacity', 'isbn_filter_fpr')
+
+_UPSERT_SQL = f'''
+    INSERT INTO books ({", ".join(BOOK_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        author = excluded.author,
+        isbn = excluded.isbn,
+        published_date = excluded.published_date,
+        quantity = excluded.quantity,
+        created_at = excluded.created_at
+'''
+
+class _MemoryDatabase(DatabaseManager):
+    """전용 커넥션 하나만 쓰는 :memory: DatabaseManager
+
+    :memory: 는 커넥션마다 별도 DB 라서 커넥션을 닫고 새로 열면 복제본이 통째로
+    사라지므로 풀을 쓰지 않고 커넥션 하나를 닫을 때까지 유지합니다. 여러 스레드가
+    함께 쓰므로 잠금으로 한 번에 한 스레드만 사용합니다.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(':memory:', **kwargs)
+        self._conn = self._connect(check_same_thread=False)
+        self._conn_lock = threading.RLock()
+
+    @contextmanager
+    def get_connection(self):
+        with self._conn_lock:
+            yield self._conn
+
+    def close(self):
+        super().close()
+        with self._conn_lock:
+            self._conn.close()
+
+class HotReplicaDatabaseManager:
+    """books 테이블을 :memory: SQLite 에 복제해 두고 읽기를 메모리에서 처리
+
+    시작할 때 backup API 로 디스크 파일 전체(인덱스, FTS 포함)를 메모리로 복사합니다.
+    쓰기는 디스크에 먼저 한 뒤 sync() 로 반영하고, 다른 프로세스가 쓴 행은
+    sync() 가 id 워터마크 이후의 행만 읽어 가져옵니다. sync_interval 을 주면
+    백그라운드 스레드가 주기적으로 sync() 를 호출합니다.
+    id 워터마크로는 다른 프로세스가 기존 행을 고친 것은 알 수 없으므로
+    그런 경우에는 reload() 로 다시 적재해야 합니다. 백그라운드 sync() 가 실패하면
+    기록하고 다음 주기에 다시 시도하며, 마지막 오류는 last_sync_error 에 남습니다.
+    kwargs 중 cache_size, cache_ttl, isbn_filter_capacity, isbn_filter_fpr 는 읽기를
+    맡는 메모리 복제본에, 나머지는 디스크 DatabaseManager 에 적용합니다. Bloom 필터는
+    적재할 때마다 다시 만드므로 isbn_filter_file 은 받지 않습니다.
+    """
+
+    def __init__(self, db_file: str, profile: Optional[str] = 'balanced',
+                 sync_interval: Optional[float] = None, **kwargs):
+        if 'isbn_filter_file' in kwargs:
+            raise ValueError("isbn_filter_file is not supported by the hot replica")
+        memory_options = {name: kwargs.pop(name) for name in _MEMORY_OPTIONS if name in kwargs}
+        self.disk = DatabaseManager(db_file, pool_size=2, profile=profile, **kwargs)
+        self.memory = _MemoryDatabase(**memory_options)
+        self.watermark = 0
+        self._sync_lock = threading.Lock()
+        self.sync_interval = sync_interval
+        self._stop = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+        self.last_sync_error: Optional[Exception] = None
+
+    def initialize_db(self):
+        self.disk.initialize_db()
+        self.reload()
+        if self.sync_interval and self._sync_thread is None:
+            self._sync_thread = threading.Thread(target=self._sync_loop,
+                                                 name='replica-sync', daemon=True)
+            self._sync_thread.start()
+
+    def reload(self):
+        """디스크 파일 전체를 메모리로 다시 복사"""
+        with self._sync_lock:
+            with self.disk.get_connection() as source, self.memory.get_connection() as target:
+                source.backup(target)
+                self.watermark = target.execute(
+                    'SELECT IFNULL(MAX(id), 0) FROM books').fetchone()[0]
+                # 내용이 통째로 바뀌었으므로 캐시를 비우고 필터를 새로 만듦
+                if self.memory.cache is not None:
+                    self.memory.cache.clear()
+                if self.memory.isbn_filter_capacity > 0:
+                    self.memory.load_isbn_filter()
+
+    def sync(self) -> int:
+        """디스크에 새로 추가된 행(id > watermark)을 메모리에 반영하고 그 수를 반환"""
+        with self._sync_lock:
+            rows = list(self.disk.iter_books(after=self.watermark, raw=True))
+            if rows:
+                self._upsert(rows)
+                self.watermark = rows[-1][0]
+            return len(rows)
+
+    def _upsert(self, rows: List[Tuple]):
+        with self.memory.get_connection() as conn:
+            self.memory.write_rows(conn, [row[3] for row in rows],
+                                   lambda cursor: cursor.executemany(_UPSERT_SQL, rows))
+
+    def _sync_loop(self):
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self.sync()
+            except Exception as e:
+                # 디스크가 잠겨 있는 등 일시적인 오류일 수 있으므로 스레드를 끝내지 않고 다음 주기에 재시도
+                self.last_sync_error = e
+                get_logger().error("복제본 동기화 실패: %s", e)
+            else:
+                self.last_sync_error = None
+
+    def add_book(self, book: Book) -> int:
+        book_id = self.disk.add_book(book)
+        self.sync()
+        return book_id
+
+    def add_books(self, books: Iterable[BookLike], batch_size: int = 10000,
+                  on_conflict: str = 'fail') -> BulkInsertResult:
+        if on_conflict != 'replace':
+            try:
+                return self.disk.add_books(books, batch_size, on_conflict)
+            finally:
+                self.sync()
+        # 'replace' 는 기존 행을 고치므로 워터마크와 별개로 고친 isbn 을 다시 읽어 옴
+        isbns: List[str] = []
+
+        def remember(items):
+            for book in items:
+                book = assign_isbn(book, self.disk.isbn_generator)
+                isbns.append(book['isbn'] if isinstance(book, Mapping) else book.isbn)
+                yield book
+
+        try:
+            return self.disk.add_books(remember(books), batch_size, on_conflict)
+        finally:
+            self.sync()
+            for start in range(0, len(isbns), 500):
+                self._refresh(isbns[start:start + 500])
+
+    def _refresh(self, isbns: List[str]):
+        placeholders = ', '.join('?' * len(isbns))
+        rows = list(self.disk.iter_books(where=f'isbn IN ({placeholders})',
+                                         params=tuple(isbns), raw=True))
+        if rows:
+            with self._sync_lock:
+                self._upsert(rows)
+
+    def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
+        return self.memory.get_book_by_isbn(isbn)
+
+    def get_books_by_isbns(self, isbns: Iterable[str]) -> Dict[str, Book]:
+        return self.memory.get_books_by_isbns(isbns)
+
+    def search_books(self, query: str, limit: int = 20, offset: int = 0) -> List[Book]:
+        return self.memory.search_books(query, limit, offset)
+
+    def search_books_ranked(self, query: str, limit: int = 20,
+                            offset: int = 0) -> List[Tuple[float, Book]]:
+        return self.memory.search_books_ranked(query, limit, offset)
+
+    def iter_books(self, order_by: str = 'id', page_size: int = 5000,
+                   where: Optional[str] = None, params: Tuple = (),
+                   after=None, raw: bool = False) -> Iterator[Book]:
+        return self.memory.iter_books(order_by, page_size, where, params, after, raw)
+
+    def memory_usage(self) -> int:
+        """메모리 복제본이 차지하는 바이트 수 (page_count * page_size)"""
+        with self.memory.get_connection() as conn:
+            page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        return page_count * page_size
+
+    def close(self):
+        self._stop.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+        self.disk.close()
+        self.memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
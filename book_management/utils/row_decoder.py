@@ -0,0 +1,53 @@
+from dataclasses import fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Tuple
+from models.book import Book
+
+BOOK_FIELDS = tuple(field.name for field in fields(Book))
+
+# 같은 날짜/시각 문자열이 반복되므로 파싱 결과를 캐시
+@lru_cache(maxsize=65536)
+def parse_datetime(value: str) -> datetime:
+    """'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM:SS' 형식의 저장 값을 datetime 으로 변환"""
+    return datetime.fromisoformat(value)
+
+def _parse_optional(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return parse_datetime(value)
+
+def make_book_decoder(columns: Sequence[str]) -> Callable[[Tuple], Book]:
+    """컬럼 이름 순서에 맞춰 행 튜플을 Book 으로 바꾸는 함수를 만듦
+
+    컬럼 위치는 여기서 한 번만 계산하므로 행마다 이름을 찾지 않습니다.
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    missing = [name for name in BOOK_FIELDS if name not in index]
+    if missing:
+        raise ValueError(f"columns missing for Book: {', '.join(missing)}")
+    i_id, i_title, i_author, i_isbn, i_published, i_quantity, i_created = (
+        index[name] for name in BOOK_FIELDS)
+
+    def decode(row, _book=Book, _parse=_parse_optional):
+        return _book(row[i_id], row[i_title], row[i_author], row[i_isbn],
+                     _parse(row[i_published]), row[i_quantity], _parse(row[i_created]))
+
+    return decode
+
+class BookRowFactory:
+    """cursor.row_factory 로 지정해 행을 Book 으로 받는 row factory
+
+    첫 행에서 cursor.description 으로 디코더를 만든 뒤 재사용합니다.
+    쿼리마다 새 인스턴스를 지정해야 합니다.
+    """
+
+    __slots__ = ('_decode',)
+
+    def __init__(self):
+        self._decode = None
+
+    def __call__(self, cursor, row) -> Book:
+        if self._decode is None:
+            self._decode = make_book_decoder([column[0] for column in cursor.description])
+        return self._decode(row)
@@ -0,0 +1,127 @@
+import csv
+import gzip
+import io
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime
+from itertools import islice
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import IO, Iterable, Iterator, Optional, Union
+from models.book import Book, format_date, format_datetime
+from utils.row_decoder import BOOK_FIELDS
+
+# 한 번에 문자열로 합쳐 write 하는 도서 수
+_CHUNK_SIZE = 4096
+_BUFFER_SIZE = 1 << 20
+
+# 같은 날짜/시각을 가진 도서가 많으므로 JSON 조각을 캐시. datetime 자체를 키로 쓰면
+# 시간대만 다른 같은 시각이 한 항목을 공유하므로 날짜는 date() 를 키로 쓰고, 시각은
+# 시간대가 없고 초 단위인 값(DB 에서 읽은 값)만 캐시함 (마이크로초 값은 거의 반복되지 않음)
+@lru_cache(maxsize=65536)
+def _json_day(value) -> str:
+    return f'"{value.isoformat()}"'
+
+@lru_cache(maxsize=65536)
+def _json_naive_datetime(value) -> str:
+    return f'"{format_datetime(value)}"'
+
+def _json_datetime(value) -> str:
+    if value is None:
+        return 'null'
+    if value.microsecond or value.tzinfo is not None:
+        return f'"{format_datetime(value)}"'
+    return _json_naive_datetime(value)
+
+def _line_encoder(ensure_ascii: bool):
+    """json.dumps(book.to_dict()) 와 같은 한 줄을 만드는 함수
+
+    json.dumps 는 도서마다 dict 를 만들고 인코더를 거치므로, 키 순서가 고정된
+    이 경우에는 C 로 구현된 문자열 인코더만 써서 직접 조립합니다. 반복이 많은
+    저자와 날짜는 인코딩 결과를 캐시합니다.
+    """
+    encode = encode_basestring_ascii if ensure_ascii else encode_basestring
+    encode_author = lru_cache(maxsize=65536)(encode)
+
+    def encode_line(book: Book, _day=_json_day, _naive=_json_naive_datetime,
+                    _datetime=_json_datetime) -> str:
+        book_id = book.id
+        quantity = book.quantity
+        # 함수 호출을 한 단계 줄이려고 흔한 경우(시간대 없는 초 단위 시각)는 캐시를 바로 호출
+        published = book.published_date
+        if published is None:
+            published = 'null'
+        else:
+            published = _day(published.date() if isinstance(published, datetime) else published)
+        created = book.created_at
+        if created is not None and not created.microsecond and created.tzinfo is None:
+            created = _naive(created)
+        else:
+            created = _datetime(created)
+        return (f'{{"id": {"null" if book_id is None else book_id}, '
+                f'"title": {encode(book.title)}, '
+                f'"author": {encode_author(book.author)}, "isbn": {encode(book.isbn)}, '
+                f'"published_date": {published}, '
+                f'"quantity": {"null" if quantity is None else quantity}, '
+                f'"created_at": {created}}}\n')
+
+    return encode_line
+
+def iter_jsonl(books: Iterable[Book], ensure_ascii: bool = True) -> Iterator[str]:
+    """도서마다 JSON 한 줄(줄바꿈 포함)을 반환"""
+    return map(_line_encoder(ensure_ascii), books)
+
+def _csv_row(book: Book):
+    return (book.id, book.title, book.author, book.isbn,
+            None if book.published_date is None else format_date(book.published_date),
+            book.quantity,
+            None if book.created_at is None else format_datetime(book.created_at))
+
+@contextmanager
+def _open_text(target: Union[str, IO[str]], compress: bool, newline: Optional[str] = None):
+    """경로면 버퍼를 크게 잡아 열고(compress=True 면 gzip), 파일 객체면 그대로 사용"""
+    if not isinstance(target, str):
+        yield target
+        return
+    if compress:
+        raw = gzip.open(target, 'wb', compresslevel=6)
+        f = io.TextIOWrapper(io.BufferedWriter(raw, _BUFFER_SIZE), encoding='utf-8',
+                             newline=newline)
+    else:
+        f = open(target, 'w', encoding='utf-8', newline=newline, buffering=_BUFFER_SIZE)
+    with f:
+        yield f
+
+def write_jsonl(books: Iterable[Book], target: Union[str, IO[str]],
+                compress: bool = False, ensure_ascii: bool = True) -> int:
+    """도서를 JSON Lines 로 쓰고 쓴 도서 수를 반환
+
+    target 은 경로 또는 텍스트 파일 객체이며, 경로일 때 compress=True 면 gzip 으로
+    압축하며 씁니다. 각 줄은 json.dumps(book.to_dict()) 와 같은 내용입니다.
+    """
+    lines = iter_jsonl(books, ensure_ascii)
+    count = 0
+    with _open_text(target, compress) as f:
+        while True:
+            chunk = list(islice(lines, _CHUNK_SIZE))
+            if not chunk:
+                break
+            f.write(''.join(chunk))
+            count += len(chunk)
+    return count
+
+def write_csv(books: Iterable[Book], target: Union[str, IO[str]],
+              compress: bool = False, header: bool = True) -> int:
+    """도서를 CSV 로 쓰고 쓴 도서 수를 반환 (DatabaseManager.add_books 로 다시 읽을 수 있음)"""
+    rows = map(_csv_row, books)
+    count = 0
+    with _open_text(target, compress, newline='') as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(BOOK_FIELDS)
+        while True:
+            chunk = list(islice(rows, _CHUNK_SIZE))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
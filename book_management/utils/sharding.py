@@ -0,0 +1,267 @@
+import argparse
+import heapq
+import queue
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from models.book import Book
+from utils.database import (BOOK_COLUMNS, BookLike, BulkInsertError, BulkInsertResult,
+                            DatabaseManager, assign_isbn)
+from utils.id_generator import SnowflakeIdGenerator
+
+def shard_index(isbn: str, shard_count: int) -> int:
+    """isbn 이 저장될 샤드 번호 (프로세스와 실행에 관계없이 항상 같은 값)"""
+    return zlib.crc32(isbn.encode('utf-8')) % shard_count
+
+def _isbn_of(book: BookLike) -> str:
+    return book['isbn'] if isinstance(book, Mapping) else book.isbn
+
+def _sort_key(order_by: str, raw: bool):
+    """heapq.merge 용 정렬 키: SQLite 처럼 NULL 을 가장 앞에 둠"""
+    index = BOOK_COLUMNS.index(order_by)
+    if raw:
+        return lambda row: (row[index] is not None, row[index], row[0])
+    return lambda book: (getattr(book, order_by) is not None, getattr(book, order_by), book.id)
+
+def _prefetch(iterable: Iterable, chunk_size: int, depth: int = 2) -> Iterator:
+    """백그라운드 스레드에서 iterable 을 chunk_size 개씩 미리 읽어 옴"""
+    chunks: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def produce():
+        try:
+            chunk = []
+            for item in iterable:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    put(chunk)
+                    chunk = []
+                if stop.is_set():
+                    return
+            if chunk:
+                put(chunk)
+            put(done)
+        except BaseException as e:
+            put(e)
+
+    threading.Thread(target=produce, name='shard-prefetch', daemon=True).start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield from chunk
+    finally:
+        stop.set()
+
+class ShardedDatabaseManager:
+    """isbn 해시로 도서를 여러 SQLite 파일에 나눠 저장하는 DatabaseManager
+
+    단건 조회/저장은 한 샤드로만 가고, 검색과 전체 순회는 모든 샤드에서 병렬로
+    실행한 뒤 결과를 합칩니다. 샤드마다 전용 쓰기 스레드를 두어 서로 다른 샤드에
+    대한 쓰기는 동시에 진행됩니다. id 는 샤드 안에서만 고유합니다.
+    """
+
+    def __init__(self, db_files: Sequence[str], pool_size: int = 2,
+                 profile: Optional[str] = 'balanced',
+                 isbn_generator: Optional[SnowflakeIdGenerator] = None, **kwargs):
+        if not db_files:
+            raise ValueError("at least one shard file is required")
+        # 빈 isbn 은 샤드를 고르기 전에 채워야 하므로 샤드가 아닌 여기서 생성
+        self.isbn_generator = isbn_generator
+        self.shards = [DatabaseManager(db_file, pool_size=pool_size, profile=profile, **kwargs)
+                       for db_file in db_files]
+        # 같은 샤드의 쓰기는 순서대로, 다른 샤드끼리는 동시에
+        self._writers = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'shard-{i}')
+                         for i in range(len(self.shards))]
+        self._readers = ThreadPoolExecutor(max_workers=len(self.shards),
+                                           thread_name_prefix='shard-read')
+
+    def shard_for(self, isbn: str) -> DatabaseManager:
+        return self.shards[shard_index(isbn, len(self.shards))]
+
+    def _fan_out(self, method: str, *args, **kwargs) -> List:
+        futures = [self._readers.submit(getattr(shard, method), *args, **kwargs)
+                   for shard in self.shards]
+        return [future.result() for future in futures]
+
+    def initialize_db(self):
+        self._fan_out('initialize_db')
+
+    def add_book(self, book: Book) -> int:
+        """도서를 저장하고 해당 샤드 안에서의 id 를 반환"""
+        assign_isbn(book, self.isbn_generator)
+        index = shard_index(book.isbn, len(self.shards))
+        return self._writers[index].submit(self.shards[index].add_book, book).result()
+
+    def add_books(self, books: Iterable[BookLike], batch_size: int = 10000,
+                  on_conflict: str = 'fail') -> BulkInsertResult:
+        """샤드별로 나눠 batch_size 단위로 각 샤드의 쓰기 스레드에서 동시에 저장
+
+        on_conflict='fail' 에서 충돌이 나면 다른 샤드의 배치는 이미 커밋되었을 수 있으며
+        BulkInsertError 의 result 에는 커밋된 배치만 집계됩니다.
+        """
+        result = BulkInsertResult()
+        buffers: List[List] = [[] for _ in self.shards]
+        pending: List[List[Future]] = [[] for _ in self.shards]
+        error: Optional[BulkInsertError] = None
+
+        def collect(future: Future):
+            nonlocal error
+            try:
+                batch_result = future.result()
+            except BulkInsertError as e:
+                batch_result = e.result
+                error = error or e
+            result.total += batch_result.total
+            result.written += batch_result.written
+
+        def flush(index: int):
+            # 샤드당 진행 중인 배치를 2개로 제한해 메모리 사용량을 일정하게 유지
+            while len(pending[index]) >= 2:
+                collect(pending[index].pop(0))
+            batch, buffers[index] = buffers[index], []
+            pending[index].append(self._writers[index].submit(
+                self.shards[index].add_books, batch, batch_size, on_conflict))
+
+        for book in books:
+            book = assign_isbn(book, self.isbn_generator)
+            index = shard_index(_isbn_of(book), len(self.shards))
+            buffers[index].append(book)
+            if len(buffers[index]) >= batch_size:
+                flush(index)
+                if error is not None:
+                    break
+        else:
+            for index, buffer in enumerate(buffers):
+                if buffer:
+                    flush(index)
+        for futures in pending:
+            for future in futures:
+                collect(future)
+        if error is not None:
+            raise BulkInsertError(str(error), result) from error
+        return result
+
+    def get_book_by_isbn(self, isbn: str) -> Optional[Book]:
+        return self.shard_for(isbn).get_book_by_isbn(isbn)
+
+    def get_books_by_isbns(self, isbns: Iterable[str]) -> Dict[str, Book]:
+        groups: List[List[str]] = [[] for _ in self.shards]
+        for isbn in isbns:
+            groups[shard_index(isbn, len(self.shards))].append(isbn)
+        futures = [self._readers.submit(shard.get_books_by_isbns, group)
+                   for shard, group in zip(self.shards, groups) if group]
+        found: Dict[str, Book] = {}
+        for future in futures:
+            found.update(future.result())
+        return found
+
+    def search_books_ranked(self, query: str, limit: int = 20,
+                            offset: int = 0) -> List[Tuple[float, Book]]:
+        """모든 샤드에서 상위 limit + offset 개를 받아 bm25 점수로 합침
+
+        bm25 의 단어 통계는 샤드별로 계산되지만 해시 분산이라 샤드 간 차이는 작습니다.
+        """
+        per_shard = self._fan_out('search_books_ranked', query, limit + offset)
+        merged = heapq.merge(*per_shard, key=lambda item: item[0])
+        return list(merged)[offset:offset + limit]
+
+    def search_books(self, query: str, limit: int = 20, offset: int = 0) -> List[Book]:
+        return [book for _, book in self.search_books_ranked(query, limit, offset)]
+
+    def iter_books(self, order_by: str = 'id', page_size: int = 5000,
+                   where: Optional[str] = None, params: Tuple = (),
+                   after=None, raw: bool = False) -> Iterator[Book]:
+        """각 샤드를 백그라운드 스레드에서 미리 읽으며 (order_by, id) 순서로 합쳐 반환
+
+        id 는 샤드마다 따로 매겨지므로 같은 키를 가진 행이 여러 샤드에 있을 수 있고,
+        after 로 이어 읽을 때 그런 행은 빠질 수 있습니다.
+        """
+        if order_by not in BOOK_COLUMNS:
+            raise ValueError(f"cannot order by {order_by!r}")
+        streams = [_prefetch(shard.iter_books(order_by, page_size, where, params, after, raw),
+                             page_size)
+                   for shard in self.shards]
+        return heapq.merge(*streams, key=_sort_key(order_by, raw))
+
+    def close(self):
+        for writer in self._writers:
+            writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        for shard in self.shards:
+            shard.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+_COPY_SQL = '''
+    INSERT INTO books (title, author, isbn, published_date, quantity, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+def rebalance_shards(old_files: Sequence[str], new_files: Sequence[str],
+                     batch_size: int = 10000) -> int:
+    """기존 샤드 파일의 모든 도서를 새 샤드 구성으로 옮기고 옮긴 행 수를 반환
+
+    서비스를 멈춘 상태에서 실행하는 오프라인 도구입니다. 새 파일은 기존 파일과
+    달라야 하며, created_at 은 유지되고 id 는 새 샤드에서 다시 매겨집니다.
+    """
+    if set(old_files) & set(new_files):
+        raise ValueError("new shard files must differ from the old ones")
+    targets = [DatabaseManager(db_file, pool_size=1, profile='bulk-load')
+               for db_file in new_files]
+    for target in targets:
+        target.initialize_db()
+    buffers: List[List[Tuple]] = [[] for _ in targets]
+
+    def flush(index: int):
+        with targets[index].get_connection() as conn:
+            conn.executemany(_COPY_SQL, buffers[index])
+            conn.commit()
+        buffers[index] = []
+
+    moved = 0
+    try:
+        for old_file in old_files:
+            source = DatabaseManager(old_file, read_only=True)
+            for row in source.iter_books(page_size=batch_size, raw=True):
+                index = shard_index(row[3], len(targets))
+                buffers[index].append(row[1:])
+                if len(buffers[index]) >= batch_size:
+                    flush(index)
+                moved += 1
+        for index, buffer in enumerate(buffers):
+            if buffer:
+                flush(index)
+    finally:
+        for target in targets:
+            target.close()
+    return moved
+
+def main():
+    parser = argparse.ArgumentParser(description="샤드 개수를 바꿔 도서 데이터를 재배치")
+    parser.add_argument('--from', dest='old_files', nargs='+', required=True)
+    parser.add_argument('--to', dest='new_files', nargs='+', required=True)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    args = parser.parse_args()
+    moved = rebalance_shards(args.old_files, args.new_files, args.batch_size)
+    print(f"moved {moved} books from {len(args.old_files)} to {len(args.new_files)} shards")
+
+if __name__ == '__main__':
+    main()
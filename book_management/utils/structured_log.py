@@ -0,0 +1,140 @@
+import atexit
+import json
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
+from utils.logger import DEFAULT_LOGGER_NAME, default_logger_enabled_for, get_logger
+
+class Event:
+    """이벤트 이름과 필드를 담은 로그 메시지
+
+    문자열은 핸들러가 포맷할 때(큐를 쓰면 기록 스레드에서) 만들어지므로
+    호출하는 쪽은 f-string 이나 json 인코딩 비용을 내지 않습니다.
+    """
+
+    __slots__ = ('name', 'fields')
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return ' '.join([self.name] + [f'{key}={value!r}' for key, value in self.fields.items()])
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 고정 필드(ts, level, logger, event, message)의 JSON 한 줄로 포맷
+
+    이벤트 필드는 고정 필드를 덮어쓰지 않도록 'fields' 객체 안에 넣습니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = record.msg
+        entry = {'ts': self.formatTime(record), 'level': record.levelname,
+                 'logger': record.name}
+        if isinstance(msg, Event):
+            entry['event'] = msg.name
+            entry['fields'] = msg.fields
+        else:
+            entry['event'] = None
+            entry['message'] = record.getMessage()
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        return (time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created))
+                + f'.{int(record.msecs):03d}')
+
+# flush_event_logs 가 남은 억제 건수를 기록할 EventLog 목록
+_event_logs: 'weakref.WeakSet[EventLog]' = weakref.WeakSet()
+
+class EventLog:
+    """한 호출 위치에서 쓰는 표본 추출/속도 제한 이벤트 로그
+
+    모듈 수준에 호출 위치마다 하나씩 만들어 두고 `BOOK_ADDED(title=..., book_id=...)`
+    처럼 호출합니다. sample_every=N 이면 N 번 중 한 번만, max_per_second > 0 이면
+    1 초에 그 수까지만 기록하고 나머지는 세기만 합니다. 건너뛴 수는 다음에 기록되는
+    줄의 suppressed 필드로 남고, 끝까지 남은 수는 flush 에서 요약 줄로 씁니다.
+    기본 로거는 실제로 기록할 첫 이벤트에서 구성되므로, 레벨이 꺼져 있거나 건너뛴
+    호출은 로그 파일이나 기록 스레드를 만들지 않습니다.
+    """
+
+    def __init__(self, event: str, level: int = logging.INFO,
+                 logger_name: str = DEFAULT_LOGGER_NAME, sample_every: int = 1,
+                 max_per_second: int = 0, clock: Callable[[], float] = time.monotonic):
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.event = event
+        self.level = level
+        self.logger_name = logger_name
+        self.sample_every = sample_every
+        self.max_per_second = max_per_second
+        self.clock = clock
+        self.suppressed = 0
+        self._seen = 0
+        self._window = 0
+        self._emitted_in_window = 0
+        self._lock = threading.Lock()
+        _event_logs.add(self)
+
+    @property
+    def logger(self) -> logging.Logger:
+        # 기본 로거는 처음 쓸 때(shutdown_loggers 뒤에는 다시) 환경 변수 설정으로 구성됨
+        if self.logger_name == DEFAULT_LOGGER_NAME:
+            return get_logger()
+        return logging.getLogger(self.logger_name)
+
+    def _enabled(self) -> bool:
+        """로거를 구성하지 않고 이 이벤트의 레벨이 기록되는지 확인"""
+        if self.logger_name == DEFAULT_LOGGER_NAME:
+            return default_logger_enabled_for(self.level)
+        return logging.getLogger(self.logger_name).isEnabledFor(self.level)
+
+    def _admit(self) -> int:
+        """기록할 차례면 그동안 억제된 수를, 아니면 -1 을 반환"""
+        with self._lock:
+            self._seen += 1
+            if self._seen % self.sample_every:
+                self.suppressed += 1
+                return -1
+            if self.max_per_second > 0:
+                window = int(self.clock())
+                if window != self._window:
+                    self._window = window
+                    self._emitted_in_window = 0
+                if self._emitted_in_window >= self.max_per_second:
+                    self.suppressed += 1
+                    return -1
+                self._emitted_in_window += 1
+            suppressed, self.suppressed = self.suppressed, 0
+            return suppressed
+
+    def __call__(self, **fields):
+        # 꺼진 레벨은 세지도 않고, 건너뛸 호출은 로거를 구성하거나 레코드를 만들지 않고
+        # 카운터만 올림
+        if not self._enabled():
+            return
+        suppressed = self._admit()
+        if suppressed < 0:
+            return
+        logger = self.logger
+        if suppressed:
+            fields['suppressed'] = suppressed
+        logger.log(self.level, Event(self.event, fields), stacklevel=2)
+
+    def flush(self):
+        """억제된 채 남은 건수가 있으면 요약 줄을 기록"""
+        with self._lock:
+            suppressed, self.suppressed = self.suppressed, 0
+        if suppressed and self._enabled():
+            self.logger.log(self.level, Event(self.event, {'suppressed': suppressed,
+                                                            'summary': True}))
+
+def flush_event_logs():
+    for event_log in list(_event_logs):
+        event_log.flush()
+
+# 큐 없이 쓰는 로거도 종료 시 요약이 남도록 함 (큐를 쓰면 log_queue 의 종료 처리에서도 호출됨)
+atexit.register(flush_event_logs)
@@ -0,0 +1,78 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Optional
+
+class TkResultPump:
+    """다른 스레드에서 넘긴 콜백을 Tk 메인 스레드에서 실행
+
+    Tk 위젯은 메인 스레드에서만 다뤄야 하므로 작업 스레드는 post 로 콜백을
+    스레드 안전한 큐에 넣고, 메인 스레드는 root.after 로 주기적으로 큐를 비웁니다.
+    한 번에 max_per_poll 개까지만 실행해 결과가 몰려도 화면 갱신이 밀리지 않습니다.
+    """
+
+    def __init__(self, root, poll_interval: int = 20, max_per_poll: int = 100):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.max_per_poll = max_per_poll
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._after_id = None
+        self._stopped = False
+        self._schedule()
+
+    def post(self, callback: Callable, *args):
+        self._queue.put((callback, args))
+
+    def _schedule(self):
+        self._after_id = self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        for _ in range(self.max_per_poll):
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        if not self._stopped:
+            self._schedule()
+
+    def stop(self):
+        self._stopped = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+class AsyncTkBridge:
+    """백그라운드 스레드의 asyncio 루프에서 코루틴을 실행하고 결과를 Tk 로 전달"""
+
+    def __init__(self, root, poll_interval: int = 20):
+        self.pump = TkResultPump(root, poll_interval)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name='asyncio-bridge', daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Coroutine, on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> Future:
+        """코루틴을 실행하고, 끝나면 on_success/on_error 를 Tk 메인 스레드에서 호출"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def deliver(done: Future):
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                if on_error is not None:
+                    self.pump.post(on_error, error)
+            elif on_success is not None:
+                self.pump.post(on_success, done.result())
+
+        future.add_done_callback(deliver)
+        return future
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        self.pump.stop()
@@ -0,0 +1,116 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Set
+from utils.tk_bridge import TkResultPump
+
+class JobCancelled(Exception):
+    """작업이 cancel 요청을 받아 중단됨 (args[0] 에 그때까지의 결과를 담을 수 있음)"""
+
+class BackgroundJob:
+    """TkWorker 에서 실행 중인 작업의 진행률 보고와 취소를 담당
+
+    작업 함수는 job 키워드 인자로 이 객체를 받아 report 로 진행률을 알리고, 적당한
+    간격으로 check_cancelled 를 호출해 취소 요청이 있으면 중단합니다.
+    report 는 아무리 자주 불러도 Tk 쪽에는 아직 전달되지 않은 최신 값 하나만
+    넘기므로 UI 가 진행률 갱신에 밀리지 않습니다.
+    """
+
+    def __init__(self, pump: TkResultPump,
+                 on_progress: Optional[Callable[[int, Optional[int]], None]] = None):
+        self.future: Optional[Future] = None
+        self._pump = pump
+        self._on_progress = on_progress
+        self._cancel_event = threading.Event()
+        self._progress_lock = threading.Lock()
+        self._progress = None
+        self._progress_pending = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """취소를 요청 (아직 시작 전이면 실행되지 않음)"""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self, partial: Any = None):
+        if self._cancel_event.is_set():
+            raise JobCancelled(partial)
+
+    def report(self, done: int, total: Optional[int] = None):
+        if self._on_progress is None:
+            return
+        with self._progress_lock:
+            self._progress = (done, total)
+            if self._progress_pending:
+                return
+            self._progress_pending = True
+        self._pump.post(self._deliver_progress)
+
+    def _deliver_progress(self):
+        with self._progress_lock:
+            progress, self._progress_pending = self._progress, False
+        # 취소한 뒤 늦게 도착한 진행률은 버림
+        if not self._cancel_event.is_set():
+            self._on_progress(*progress)
+
+class TkWorker:
+    """DB 나 파일 작업을 백그라운드 스레드에서 실행하고 결과를 Tk 메인 스레드로 전달
+
+    콜백(on_success, on_error, on_progress, on_cancelled)은 모두 pump 를 통해
+    root.after 폴링으로 Tk 메인 스레드에서 실행됩니다. AsyncTkBridge 와
+    같은 pump 를 쓰면 결과가 들어온 순서대로 처리됩니다.
+    """
+
+    def __init__(self, pump: TkResultPump, max_workers: int = 1):
+        self.pump = pump
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='tk-worker')
+        self._jobs: Set[BackgroundJob] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[..., Any], *args,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+               on_cancelled: Optional[Callable[[JobCancelled], None]] = None) -> BackgroundJob:
+        """func(*args, job=job) 을 작업 스레드에서 실행하고 BackgroundJob 을 반환"""
+        job = BackgroundJob(self.pump, on_progress)
+        with self._lock:
+            self._jobs.add(job)
+
+        def deliver(done: Future):
+            with self._lock:
+                self._jobs.discard(job)
+            if done.cancelled():
+                if on_cancelled is not None:
+                    self.pump.post(on_cancelled, JobCancelled(None))
+                return
+            error = done.exception()
+            if isinstance(error, JobCancelled):
+                if on_cancelled is not None:
+                    self.pump.post(on_cancelled, error)
+            elif error is not None:
+                if on_error is not None:
+                    self.pump.post(on_error, error)
+            elif on_success is not None:
+                self.pump.post(on_success, done.result())
+
+        job.future = self._executor.submit(func, *args, job=job)
+        job.future.add_done_callback(deliver)
+        return job
+
+    @property
+    def active_jobs(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def close(self):
+        """남은 작업에 취소를 요청하고 작업 스레드가 끝나길 기다림"""
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=True)
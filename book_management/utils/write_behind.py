@@ -0,0 +1,118 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+from models.book import Book
+from utils.database import INSERT_COLUMNS, DatabaseManager, assign_isbn, book_params
+from utils.structured_log import EventLog
+
+# writer 스레드 종료 신호
+_STOP = object()
+
+# 묶음을 커밋할 때마다 남기는 이벤트 (초당 5 줄까지)
+_BATCH_COMMITTED = EventLog('write_behind_batch', level=logging.DEBUG, max_per_second=5)
+
+class WriteBehindWriter:
+    """add_book 요청을 큐에 모아 단일 writer 스레드가 묶음 단위로 커밋
+
+    여러 스레드가 submit 으로 Book 을 넣으면 id 를 돌려줄 Future 를 받습니다.
+    writer 는 max_batch_size 개가 모이거나 첫 요청 후 max_latency 초가 지나면
+    한 트랜잭션으로 커밋하므로 fsync 가 요청마다가 아니라 묶음마다 일어납니다.
+    isbn 충돌 같은 행 단위 오류는 해당 Future 에만 전달됩니다.
+    """
+
+    def __init__(self, db: DatabaseManager, max_batch_size: int = 500,
+                 max_latency: float = 0.005, queue_size: int = 0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.db = db
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+
+    def submit(self, book: Book) -> Future:
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("write-behind writer is closed")
+            # 파라미터 변환 오류는 호출한 스레드에서 바로 발생
+            self._queue.put((book_params(assign_isbn(book, self.db.isbn_generator)), future))
+        return future
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 요청을 모두 커밋한 뒤 writer 스레드를 종료"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch):
+        pending = [(params, future) for params, future in batch
+                   if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        results = []
+
+        def insert(cursor):
+            for params, future in pending:
+                try:
+                    cursor.execute(f'INSERT INTO books {INSERT_COLUMNS}', params)
+                    results.append((future, cursor.lastrowid, None))
+                except sqlite3.IntegrityError as e:
+                    # 실패한 문장만 취소되고 트랜잭션은 계속됨
+                    results.append((future, None, e))
+
+        try:
+            with self.db.get_connection() as conn:
+                self.db.write_rows(conn, [params[2] for params, _ in pending], insert)
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        _BATCH_COMMITTED(rows=len(pending),
+                         failed=sum(error is not None for _, _, error in results))
+        for future, row_id, error in results:
+            if error is None:
+                future.set_result(row_id)
+            else:
+                future.set_exception(error)
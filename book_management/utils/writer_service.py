@@ -0,0 +1,254 @@
+import itertools
+import multiprocessing as mp
+import queue
+import sqlite3
+import threading
+import time
+from multiprocessing.connection import wait
+from typing import Iterable, List, Optional
+from models.book import Book
+from utils.database import (BULK_INSERT_SQL, INSERT_COLUMNS, BookLike, BulkInsertError,
+                            BulkInsertResult, DatabaseManager, assign_isbn, book_params)
+from utils.id_generator import SnowflakeIdGenerator
+
+# 응답을 기다리는 동안 writer 프로세스가 살아 있는지 확인하는 간격(초)
+_POLL_INTERVAL = 0.1
+
+class WriterStoppedError(RuntimeError):
+    """writer 프로세스가 종료되어 요청에 대한 응답을 받을 수 없는 경우"""
+
+def _apply(cursor: sqlite3.Cursor, op: str, payload):
+    """요청 하나를 현재 트랜잭션에서 실행하고 결과를 반환"""
+    if op == 'add_book':
+        cursor.execute(f'INSERT INTO books {INSERT_COLUMNS}', payload)
+        return cursor.lastrowid
+    rows, on_conflict = payload
+    cursor.executemany(BULK_INSERT_SQL[on_conflict], rows)
+    return BulkInsertResult(total=len(rows), written=cursor.rowcount)
+
+def _writer_main(db_file: str, profile: Optional[str], requests, max_group: int, ready):
+    """writer 프로세스 본체: 쌓인 요청을 모아 한 트랜잭션으로 커밋
+
+    요청마다 SAVEPOINT 를 두어 한 요청이 실패해도 같은 묶음의 다른 요청은
+    커밋됩니다. 응답은 커밋이 끝난 뒤에 보냅니다. DB 를 연 뒤 ready 로 None 을,
+    열지 못하면 그 예외를 보내고 종료합니다.
+    """
+    try:
+        db = DatabaseManager(db_file, profile=profile)
+        db.initialize_db()
+        conn = db._connect()
+    except Exception as e:
+        ready.send(e)
+        return
+    ready.send(None)
+    ready.close()
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    stopping = False
+    try:
+        while not stopping:
+            group = [requests.get()]
+            while len(group) < max_group:
+                try:
+                    group.append(requests.get_nowait())
+                except queue.Empty:
+                    break
+            if None in group:
+                stopping = True
+                group = group[:group.index(None)]
+            if not group:
+                break
+            replies = []
+            try:
+                cursor.execute('BEGIN IMMEDIATE')
+                for op, reply_queue, seq, payload in group:
+                    cursor.execute('SAVEPOINT request')
+                    try:
+                        value = _apply(cursor, op, payload)
+                        cursor.execute('RELEASE request')
+                        replies.append((reply_queue, (seq, True, value)))
+                    except sqlite3.Error as e:
+                        cursor.execute('ROLLBACK TO request')
+                        cursor.execute('RELEASE request')
+                        replies.append((reply_queue, (seq, False, e)))
+                cursor.execute('COMMIT')
+            except sqlite3.Error as e:
+                # BEGIN/COMMIT 자체가 실패하면 묶음 전체를 실패로 응답
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                replies = [(reply_queue, (seq, False, e))
+                           for _, reply_queue, seq, _ in group]
+            for reply_queue, reply in replies:
+                reply_queue.put(reply)
+    finally:
+        conn.close()
+
+class WriterClient:
+    """WriterService 에 쓰기를 요청하는 클라이언트
+
+    다른 프로세스에 인자로 넘길 수 있습니다. 요청마다 응답을 기다리므로
+    여러 스레드가 하나의 클라이언트를 함께 쓰면 안 됩니다. isbn_generator 가 있으면
+    isbn 이 비어 있는 도서는 보내기 전에 이 프로세스에서 isbn 을 채웁니다.
+    """
+
+    def __init__(self, requests, replies, stopped,
+                 isbn_generator: Optional[SnowflakeIdGenerator] = None):
+        self._requests = requests
+        self._replies = replies
+        # writer 프로세스가 종료되면 WriterService 가 설정하는 multiprocessing.Event
+        self._stopped = stopped
+        self.isbn_generator = isbn_generator
+        self._seq = itertools.count()
+        self._reader: Optional[DatabaseManager] = None
+
+    def __getstate__(self):
+        # 다른 프로세스로 넘길 때 이 프로세스의 reader 연결은 넘기지 않음
+        state = self.__dict__.copy()
+        state['_reader'] = None
+        return state
+
+    def attach(self, reader: DatabaseManager) -> 'WriterClient':
+        """이 프로세스에서 읽기에 쓰는 DatabaseManager 를 연결
+
+        연결하면 요청을 보내기 전에 isbn 을 reader 의 Bloom 필터에 넣고, 응답을 받은 뒤
+        캐시를 무효화하므로 방금 쓴 도서를 reader.get_book_by_isbn 으로 바로 찾을 수 있습니다.
+        """
+        self._reader = reader
+        return self
+
+    def _call(self, op: str, payload, timeout: Optional[float], isbns: List[str]):
+        reader = self._reader
+        if reader is not None:
+            reader.admit_isbns(isbns)
+        try:
+            return self._send(op, payload, timeout)
+        finally:
+            if reader is not None:
+                reader.invalidate(isbns)
+
+    def _send(self, op: str, payload, timeout: Optional[float]):
+        """요청을 보내고 응답을 기다림
+
+        짧은 간격으로 나눠 기다리면서 writer 프로세스가 종료됐으면 WriterStoppedError 를,
+        timeout 안에 응답이 없으면 TimeoutError 를 발생시킵니다.
+        """
+        if self._stopped.is_set():
+            raise WriterStoppedError("writer process is not running")
+        seq = next(self._seq)
+        self._requests.put((op, self._replies, seq, payload))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = _POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise TimeoutError(f"no reply from writer within {timeout} seconds")
+            try:
+                reply_seq, ok, value = self._replies.get(timeout=wait)
+            except queue.Empty:
+                if self._stopped.is_set():
+                    raise WriterStoppedError("writer process exited before replying") from None
+                continue
+            if reply_seq == seq:
+                break
+        if not ok:
+            raise value
+        return value
+
+    def add_book(self, book: Book, timeout: Optional[float] = None) -> int:
+        params = book_params(assign_isbn(book, self.isbn_generator))
+        return self._call('add_book', params, timeout, [params[2]])
+
+    def add_books(self, books: Iterable[BookLike], on_conflict: str = 'fail',
+                  timeout: Optional[float] = None) -> BulkInsertResult:
+        """한 요청으로 보내 writer 의 한 트랜잭션 안에서 저장
+
+        on_conflict='fail' 에서 충돌이 나면 이 요청 전체가 롤백되고 BulkInsertError 가
+        발생합니다. 아주 큰 목록은 호출하는 쪽에서 나눠 보내야 합니다.
+        """
+        if on_conflict not in BULK_INSERT_SQL:
+            raise ValueError(f"unknown on_conflict policy: {on_conflict!r}")
+        rows: List = [book_params(assign_isbn(book, self.isbn_generator)) for book in books]
+        try:
+            return self._call('add_books', (rows, on_conflict), timeout, [row[2] for row in rows])
+        except sqlite3.IntegrityError as e:
+            raise BulkInsertError(str(e), BulkInsertResult()) from e
+
+class WriterService:
+    """books.db 의 모든 쓰기를 맡는 단일 writer 프로세스
+
+    여러 프로세스가 같은 파일에 직접 쓰면 쓰기 잠금을 두고 경쟁하다
+    'database is locked' 오류가 납니다. 쓰기는 client() 로 얻은 WriterClient 가
+    multiprocessing 큐로 writer 프로세스에 보내고, 읽기는 각 프로세스가
+    DatabaseManager(db_file, read_only=True) 로 직접 합니다.
+    """
+
+    def __init__(self, db_file: str, profile: Optional[str] = 'balanced', max_group: int = 64):
+        self.db_file = db_file
+        self.profile = profile
+        self.max_group = max_group
+        self._manager = None
+        self._requests = None
+        self._process: Optional[mp.Process] = None
+        self._stopped = None
+        # 응답 큐 프록시를 보관: 부모 쪽 참조가 사라지면 Manager 가 큐를 지워버려
+        # 자식 프로세스로 넘긴 클라이언트가 응답을 받지 못함
+        self._reply_queues: List = []
+
+    def start(self):
+        """writer 프로세스를 시작하고 DB 를 열 때까지 기다림 (열지 못하면 그 예외를 발생)"""
+        ready, ready_writer = mp.Pipe(duplex=False)
+        self._requests = mp.Queue()
+        self._stopped = mp.Event()
+        process = mp.Process(
+            target=_writer_main, name='books-writer', daemon=True,
+            args=(self.db_file, self.profile, self._requests, self.max_group, ready_writer))
+        process.start()
+        # 부모 쪽 끝을 닫아야 자식이 신호 없이 죽었을 때 recv 가 EOFError 로 끝남
+        ready_writer.close()
+        try:
+            error = ready.recv()
+        except EOFError:
+            process.join()
+            error = WriterStoppedError(
+                f"writer process exited during startup (exit code {process.exitcode})")
+        finally:
+            ready.close()
+        if error is not None:
+            process.join()
+            raise error
+        self._manager = mp.Manager()
+        self._process = process
+        # writer 가 어떤 이유로든 끝나면 기다리는 클라이언트가 알 수 있도록 표시
+        threading.Thread(target=self._watch, args=(process.sentinel, self._stopped),
+                         name='books-writer-watch', daemon=True).start()
+        return self
+
+    @staticmethod
+    def _watch(sentinel, stopped):
+        # join 대신 sentinel 을 기다려 stop() 의 join 과 겹치지 않게 함
+        wait([sentinel])
+        stopped.set()
+
+    def client(self, isbn_generator: Optional[SnowflakeIdGenerator] = None) -> WriterClient:
+        if self._process is None:
+            raise RuntimeError("writer service is not started")
+        replies = self._manager.Queue()
+        self._reply_queues.append(replies)
+        return WriterClient(self._requests, replies, self._stopped, isbn_generator)
+
+    def stop(self, timeout: Optional[float] = None):
+        """이미 보낸 요청을 모두 처리한 뒤 writer 프로세스를 종료"""
+        if self._process is None:
+            return
+        self._requests.put(None)
+        self._process.join(timeout)
+        self._reply_queues.clear()
+        self._manager.shutdown()
+        self._process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()